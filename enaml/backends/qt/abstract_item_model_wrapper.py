@@ -2,19 +2,34 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from collections import OrderedDict
 import itertools
 import operator
 
 from .qt.QtCore import Qt, QAbstractItemModel, QModelIndex, QSize
 from .styling import q_color_from_color, q_font_from_font
 
-from ...core.item_model import AbstractItemModel
+from ...core.item_model import (
+    AbstractItemModel, AbstractTableModel, AbstractListModel,
+)
 
 
 #: An invalid QModelIndex() for use in conversion routines
 _INVALID_QINDEX = QModelIndex()
 
 
+#: The number of rows and columns in a block of data which is fetched
+#: at once from models which provide a 'data_block' implementation.
+PREFETCH_ROWS = 128
+PREFETCH_COLUMNS = 32
+
+
+#: The maximum number of blocks of data which are kept by a wrapper.
+#: This is enough to cover a large viewport for several roles. The
+#: least recently used block is discarded when the limit is reached.
+MAX_PREFETCH_BLOCKS = 32
+
+
 #------------------------------------------------------------------------------
 # Flag Map
 #------------------------------------------------------------------------------
@@ -66,6 +81,30 @@ def _build_getters(model):
     }
 
 
+def _build_block_roles(model):
+    """ Returns a dictionary of role->data_block role names for the
+    given model, or an empty dictionary if the model does not provide
+    its own implementation of 'data_block'.
+
+    """
+    data_block = getattr(type(model).data_block, 'im_func', None)
+    if data_block is AbstractItemModel.data_block.im_func:
+        return {}
+    return {
+        int(Qt.DisplayRole): 'data',
+        int(Qt.DecorationRole): 'decoration',
+        int(Qt.EditRole): 'edit_data',
+        int(Qt.ToolTipRole): 'tool_tip',
+        int(Qt.StatusTipRole): 'status_tip',
+        int(Qt.WhatsThisRole): 'whats_this',
+        int(Qt.FontRole): 'font',
+        int(Qt.TextAlignmentRole): 'alignment',
+        int(Qt.BackgroundRole): 'background',
+        int(Qt.ForegroundRole): 'foreground',
+        int(Qt.SizeHintRole): 'size_hint',
+    }
+
+
 def _build_setters(model):
     """ Returns a dictionary of role->setter methods for the given
     model.
@@ -192,6 +231,11 @@ class AbstractItemModelWrapper(QAbstractItemModel):
         self._setters = _build_setters(item_model)
         self._h_header_getters = _build_h_header_getters(item_model)
         self._v_header_getters = _build_v_header_getters(item_model)
+        self._block_roles = _build_block_roles(item_model)
+        self._blocks = OrderedDict()
+        self._flat = isinstance(
+            item_model, (AbstractTableModel, AbstractListModel)
+        )
 
         def listen(name):
             signal = getattr(item_model, name)
@@ -224,79 +268,98 @@ class AbstractItemModelWrapper(QAbstractItemModel):
     # Traits Event Handlers
     #--------------------------------------------------------------------------
     def _columns_about_to_be_inserted(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsAboutToBeInserted.emit(q_index, start, end)
     
     def _columns_about_to_be_moved(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsAboutToBeMoved.emit(q_index, start, end)
     
     def _columns_about_to_be_removed(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsAboutToBeRemoved.emit(q_index, start, end)
     
     def _columns_inserted(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsInserted.emit(q_index, start, end)
     
     def _columns_moved(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsMoved.emit(q_index, start, end)
     
     def _columns_removed(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.columnsRemoved.emit(q_index, start, end)
 
     def _rows_about_to_be_inserted(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.rowsAboutToBeInserted.emit(q_index, start, end)
     
     def _rows_about_to_be_moved(self, evt_arg):
-        parent, start, end = evt_arg
+        self._blocks.clear()
+        parent, start, end, dest_parent, dest_row = evt_arg
         q_index = self.to_q_index(parent)
-        self.rowsAboutToBeMoved.emit(q_index, start, end)
+        q_dest_index = self.to_q_index(dest_parent)
+        self.rowsAboutToBeMoved.emit(q_index, start, end, q_dest_index, dest_row)
     
     def _rows_about_to_be_removed(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.rowsAboutToBeRemoved.emit(q_index, start, end)
     
     def _rows_inserted(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.rowsInserted.emit(q_index, start, end)
     
     def _rows_moved(self, evt_arg):
-        parent, start, end = evt_arg
+        self._blocks.clear()
+        parent, start, end, dest_parent, dest_row = evt_arg
         q_index = self.to_q_index(parent)
-        self.rowsMoved.emit(q_index, start, end)
+        q_dest_index = self.to_q_index(dest_parent)
+        self.rowsMoved.emit(q_index, start, end, q_dest_index, dest_row)
     
     def _rows_removed(self, evt_arg):
+        self._blocks.clear()
         parent, start, end = evt_arg
         q_index = self.to_q_index(parent)
         self.rowsRemoved.emit(q_index, start, end)
     
     def _layout_about_to_be_changed(self):
+        self._blocks.clear()
         self.layoutAboutToBeChanged.emit()
     
     def _layout_changed(self):
+        self._blocks.clear()
         self.layoutChanged.emit()
             
     def _model_about_to_be_reset(self):
+        self._blocks.clear()
         self.modelAboutToBeReset.emit()
     
     def _model_reset(self):
+        self._blocks.clear()
         self.modelReset.emit()
     
     def _data_changed(self, evt_arg):
         top_left, bottom_right = evt_arg
+        self._discard_blocks(top_left, bottom_right)
         q_top_left = self.to_q_index(top_left)
         q_bottom_right = self.to_q_index(bottom_right)
         self.dataChanged.emit(q_top_left, q_bottom_right)
@@ -323,7 +386,7 @@ class AbstractItemModelWrapper(QAbstractItemModel):
 
     def fetchMore(self, parent):
         enaml_parent = self.from_q_index(parent)
-        return self._item_model.fetchMore(enaml_parent)
+        return self._item_model.fetch_more(enaml_parent)
         
     def headerData(self, section, orientation, role):
         if orientation == Qt.Horizontal:
@@ -365,12 +428,71 @@ class AbstractItemModelWrapper(QAbstractItemModel):
         return self.to_q_index(enaml_parent)
 
     def data(self, index, role):
+        # Top-level items are served from a block of prefetched data
+        # if the model provides a bulk data implementation.
+        block_role = self._block_roles.get(role)
+        if block_role is not None and index.isValid():
+            if self._flat or not self.parent(index).isValid():
+                data = self._block_data(index.row(), index.column(), block_role)
+                return _QROLE_CONVERTERS[role](data)
         enaml_index = self.from_q_index(index)
         if enaml_index is None:
             return
         data = self._getters[role](enaml_index)
         return _QROLE_CONVERTERS[role](data)
 
+    def _block_data(self, row, column, block_role):
+        """ Returns the data for the given top-level item from the
+        block of prefetched data which contains it, fetching the block
+        from the model if necessary.
+
+        """
+        first_row = row - row % PREFETCH_ROWS
+        first_col = column - column % PREFETCH_COLUMNS
+        key = (block_role, first_row, first_col)
+        blocks = self._blocks
+        block = blocks.pop(key, None)
+        if block is None:
+            model = self._item_model
+            last_row = min(first_row + PREFETCH_ROWS, model.row_count())
+            last_col = min(first_col + PREFETCH_COLUMNS, model.column_count())
+            rows = xrange(first_row, last_row)
+            cols = xrange(first_col, last_col)
+            block = model.data_block(rows, cols, block_role)
+            # Array blocks are converted so that Qt gets Python values.
+            if hasattr(block, 'tolist'):
+                block = block.tolist()
+            if len(blocks) >= MAX_PREFETCH_BLOCKS:
+                blocks.popitem(last=False)
+        # The block is (re)inserted last to mark it most recently used.
+        blocks[key] = block
+        return block[row - first_row][column - first_col]
+
+    def _discard_blocks(self, top_left, bottom_right):
+        """ Discards the prefetched blocks which intersect the range
+        of items between the given enaml indices.
+
+        """
+        blocks = self._blocks
+        if not blocks:
+            return
+        if top_left is None or bottom_right is None:
+            blocks.clear()
+            return
+        # Only top-level items are prefetched, so changes to the data
+        # of child items leave the blocks intact.
+        if not self._flat and self._item_model.parent(top_left) is not None:
+            return
+        first_row, last_row = top_left.row, bottom_right.row
+        first_col, last_col = top_left.column, bottom_right.column
+        for key in blocks.keys():
+            role, block_row, block_col = key
+            if (block_row <= last_row and 
+                first_row < block_row + PREFETCH_ROWS and
+                block_col <= last_col and 
+                first_col < block_col + PREFETCH_COLUMNS):
+                del blocks[key]
+
     # XXX we don't have a use case at the moment for setHeaderData
     def setHeaderData(self, section, orientation, value, role):
        return False
@@ -57,6 +57,13 @@ class QtComboBox(QtControl, AbstractTkComboBox):
         """
         self.set_items(labels)
 
+    def shell_labels_updated_changed(self, update):
+        """ The change handler for the 'labels_updated' event on the 
+        shell object.
+
+        """
+        self.update_items(*update)
+
     def on_selected(self):
         """ The event handler for a combo box selection event.
 
@@ -87,6 +94,19 @@ class QtComboBox(QtControl, AbstractTkComboBox):
             widget.addItems(str_items)
             widget.setCurrentIndex(self.shell_obj.index)
 
+    def update_items(self, index, removed, str_items):
+        """ Replaces the given number of items in the combo box at the
+        given index with the given items.
+
+        """
+        # The same feedback guard as in 'set_items' is required here.
+        with guard(self, 'updating'):
+            widget = self.widget
+            for idx in xrange(removed):
+                widget.removeItem(index)
+            widget.insertItems(index, str_items)
+            widget.setCurrentIndex(self.shell_obj.index)
+
     def set_selection(self, index):
         """ Sets the value in the combo box, or resets the combo box
         if the value is not in the list of items.
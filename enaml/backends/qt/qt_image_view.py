@@ -2,6 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from .qt.QtCore import Qt, QTimer
 from .qt.QtGui import QWidget, QPainter
 from .qt_control import QtControl
 
@@ -13,7 +14,16 @@ class QImageView(QWidget):
     api is similar to QLabel, but with a few more options to control
     how the image scales.
 
+    The scaled pixmap is cached and reused until the image or the
+    target size changes. While the widget is being resized, the image
+    is scaled with a fast transformation, and it is smoothly rescaled
+    once the resizing stops.
+
     """
+    #: The number of milliseconds without a resize event after which
+    #: a resize is considered finished.
+    resize_delay = 150
+
     def __init__(self, parent=None):
         """ Initialize a QImageView.
 
@@ -28,6 +38,13 @@ class QImageView(QWidget):
         self._scaled_contents = False
         self._preserve_aspect_ratio = False
         self._allow_upscaling = False
+        self._scaled_pixmap = None
+        self._scaled_key = None
+        self._resizing = False
+        self._resize_timer = timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.resize_delay)
+        timer.timeout.connect(self._onResizeFinished)
 
     #--------------------------------------------------------------------------
     # Private API
@@ -47,7 +64,9 @@ class QImageView(QWidget):
         if pm_width == 0 or pm_height == 0:
             return 
 
-        evt_rect = event.rect()
+        # The image is laid out in the whole widget rather than in the
+        # event rect, which may only be the part that needs repainting.
+        evt_rect = self.rect()
         evt_x = evt_rect.x()
         evt_y = evt_rect.y()
         evt_width = evt_rect.width()
@@ -90,10 +109,52 @@ class QImageView(QWidget):
             paint_x = int((evt_width / 2. - paint_width / 2.) + evt_x)
             paint_y = int((evt_height / 2. - paint_height / 2.) + evt_y)
         
-        # Finally, draw the pixmap into the calculated rect.
+        # Finally, draw the pixmap into the calculated rect, using the
+        # cached scaled pixmap if the image is scaled.
+        if paint_width != pm_width or paint_height != pm_height:
+            pixmap = self._scaledPixmap(paint_width, paint_height)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.drawPixmap(paint_x, paint_y, paint_width, paint_height, pixmap)
+        painter.drawPixmap(paint_x, paint_y, pixmap)
+
+    def resizeEvent(self, event):
+        """ A custom resize event handler which starts the timer used
+        to detect the end of a resize.
+
+        """
+        super(QImageView, self).resizeEvent(event)
+        self._resizing = True
+        self._resize_timer.start()
+
+    def _onResizeFinished(self):
+        """ Handles the end of a resize by repainting the image so it
+        is smoothly scaled.
+
+        """
+        self._resizing = False
+        self.update()
+
+    def _scaledPixmap(self, width, height):
+        """ Returns the pixmap scaled to the given size, reusing the
+        cached scaled pixmap when possible.
+
+        """
+        pixmap = self._pixmap
+        smooth = not self._resizing
+        key = (pixmap.cacheKey(), width, height, smooth)
+        cached_key = self._scaled_key
+        if cached_key is not None and cached_key[:3] == key[:3]:
+            # A smooth pixmap of the right size is also reused during
+            # a resize, since it looks better than a fast one.
+            if cached_key[3] or not smooth:
+                return self._scaled_pixmap
+        if smooth:
+            mode = Qt.SmoothTransformation
+        else:
+            mode = Qt.FastTransformation
+        scaled = pixmap.scaled(width, height, Qt.IgnoreAspectRatio, mode)
+        self._scaled_pixmap = scaled
+        self._scaled_key = key
+        return scaled
 
     #--------------------------------------------------------------------------
     # Public API
@@ -124,6 +185,8 @@ class QImageView(QWidget):
 
         """
         self._pixmap  = pixmap
+        self._scaled_pixmap = None
+        self._scaled_key = None
         self.update()
 
     def scaledContents(self):
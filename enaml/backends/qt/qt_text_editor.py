@@ -25,6 +25,11 @@ class QtTextEditor(QtControl, AbstractTkTextEditor):
     """ A Qt4 implementation of a TextEditor.
 
     """
+    #: The (anchor, position) of the selection the last time the shell
+    #: was updated. This is used to only invalidate the shell's selected
+    #: text when the selection has actually changed.
+    _selection_range = None
+
     #--------------------------------------------------------------------------
     # SetupMethods
     #--------------------------------------------------------------------------
@@ -53,7 +58,7 @@ class QtTextEditor(QtControl, AbstractTkTextEditor):
         """
         super(QtTextEditor, self).bind()
         widget = self.widget
-        widget.textChanged.connect(self.on_text_updated) # XXX or should we bind to textEdited?
+        widget.document().contentsChange.connect(self.on_contents_change)
         widget.selectionChanged.connect(self.on_selection)
         widget.cursorPositionChanged.connect(self.on_cursor)
         widget.lostFocus.connect(self.on_lost_focus)
@@ -290,14 +295,29 @@ class QtTextEditor(QtControl, AbstractTkTextEditor):
             options |= QtGui.QTextDocument.FindWholeWords
         return self.widget.find(text, options)
 
-    def on_text_updated(self):
-        """ The event handler for the text update event.
+    def on_contents_change(self, position, removed, added):
+        """ The event handler for the 'contentsChange' signal of the
+        document. Only the added text is retrieved from the document,
+        so the cost does not depend on the size of the document. The
+        cursor change which accompanies an edit is reported separately
+        by the 'cursorPositionChanged' signal.
 
         """
         shell = self.shell_obj
-        self.update_shell_selection()
-        shell._modified = True
-        shell.text_edited()
+        text = u''
+        if added:
+            document = self.widget.document()
+            # The document always holds a final paragraph separator
+            # which is not part of the plain text.
+            end = min(position + added, document.characterCount() - 1)
+            cursor = QtGui.QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            text = cursor.selectedText().replace(u'\u2029', u'\n')
+        shell.text_delta((position, removed, text))
+        if not guard.guarded(self, 'setting_text'):
+            shell._modified = True
+            shell.text_edited()
         shell.text_changed()
 
     def on_selection(self):
@@ -325,12 +345,15 @@ class QtTextEditor(QtControl, AbstractTkTextEditor):
         """
         shell = self.shell_obj
         cursor = self.widget.textCursor()
-        selected_text = cursor.selectedText()
-        selected_text = selected_text.replace(u'\u2029', '\n') # replace unicode line break
-        shell._selected_text = selected_text
+        anchor = cursor.anchor()
+        position = cursor.position()
+        selection_range = (anchor, position)
+        if selection_range != self._selection_range:
+            self._selection_range = selection_range
+            shell._selection_updated = True
         with guard(self, 'setting_cursor'):
-            shell.cursor_position = cursor.position()
-            shell.anchor_position = cursor.anchor()
+            shell.cursor_position = position
+            shell.anchor_position = anchor
             shell._cursor_column = cursor.positionInBlock()
             shell._cursor_line = cursor.blockNumber()
 
@@ -341,13 +364,34 @@ class QtTextEditor(QtControl, AbstractTkTextEditor):
         text = self.widget.toPlainText()
         return text
 
+    def get_selected_text(self):
+        """ Get the text currently selected in the widget.
+
+        """
+        selected_text = self.widget.textCursor().selectedText()
+        return selected_text.replace(u'\u2029', u'\n') # replace unicode line break
+
     def set_text(self, text):
         """ Changes the text in the widget without emitted a text 
-        updated event. This should be called when the text is changed
+        edited event. This should be called when the text is changed
         programmatically.
 
         """
-        self.widget.setPlainText(text)
+        with guard(self, 'setting_text'):
+            self.widget.setPlainText(text)
+        self.shell_obj._modified = False
+
+    def append_text(self, text):
+        """ Appends the text to the end of the document without a text
+        edited event. The text is inserted with a cursor at the end of
+        the document, so the existing contents are not copied.
+
+        """
+        document = self.widget.document()
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.End)
+        with guard(self, 'setting_text'):
+            cursor.insertText(text)
     
     def set_read_only(self, read_only):
         """ Sets read only state of the widget.
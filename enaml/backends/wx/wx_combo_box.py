@@ -57,6 +57,13 @@ class WXComboBox(WXControl, AbstractTkComboBox):
         """
         self.set_items(labels)
 
+    def shell_labels_updated_changed(self, update):
+        """ The change handler for the 'labels_updated' event on the 
+        shell object.
+
+        """
+        self.update_items(*update)
+
     def on_selected(self, event):
         """ The event handler for a combo box selection event.
 
@@ -80,6 +87,18 @@ class WXComboBox(WXControl, AbstractTkComboBox):
         self.widget.SetItems(str_items)
         self.widget.SetSelection(self.shell_obj.index)
 
+    def update_items(self, index, removed, str_items):
+        """ Replaces the given number of items in the combo box at the
+        given index with the given items.
+
+        """
+        widget = self.widget
+        for idx in xrange(removed):
+            widget.Delete(index)
+        for offset, item in enumerate(str_items):
+            widget.Insert(item, index + offset)
+        widget.SetSelection(self.shell_obj.index)
+
     def set_selection(self, index):
         """ Set the selected value in the toolkit widget.
 
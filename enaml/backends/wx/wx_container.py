@@ -62,16 +62,16 @@ class WXContainer(WXConstraintsWidget, AbstractTkContainer):
         has been resized.
 
         """
-        # Notice that we are calling refresh() here instead of 
-        # request_refresh() since we want the refresh to happen
-        # immediately. Otherwise the resize layouts will appear 
-        # to lag in the ui. This is a safe operation since by the
-        # time we get this resize event, the widget has already 
-        # changed size. Further, the only geometry that gets set
-        # by the layout manager is that of our children. And should
-        # it be required to resize this widget from within the layout
-        # call, then the layout manager will do that asynchronously.
-        self.shell_obj.refresh()
+        # Unless it is throttling resize updates, the shell refreshes
+        # immediately here instead of calling request_refresh(), so 
+        # that the resize layouts do not lag in the ui. This is a safe
+        # operation since by the time we get this resize event, the 
+        # widget has already changed size. Further, the only geometry
+        # that gets set by the layout manager is that of our children.
+        # And should it be required to resize this widget from within
+        # the layout call, then the layout manager will do that 
+        # asynchronously.
+        self.shell_obj.handle_resize()
 
         # We need to call event.Skip() here or certain controls won't
         # won't inform their children to resize.
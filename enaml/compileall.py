@@ -0,0 +1,157 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Command-line tool to precompile .enaml files into .enamlc files.
+
+The compiled files are written to the __enamlcache__ directory next to
+each source file. If a cache directory is given with the -d option or
+with the ENAML_CACHE_DIR environment variable, the compiled files are
+instead written to that directory and named by the content hash of the
+source, which is the layout used by the import hooks when the same
+environment variable is set at runtime.
+
+"""
+import optparse
+import os
+import sys
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import (
+    MAGIC, CACHEDIR, CACHEDIR_ENV, make_file_info, make_hashed_file_info,
+    read_magic_info, write_cache,
+)
+from enaml.core.parser import parse
+
+
+def compile_file(src_path, cache_dir=None, force=False, quiet=False):
+    """ Compiles the given .enaml file into the appropriate cache file.
+
+    Parameters
+    ----------
+    src_path : string
+        The path to the .enaml file to compile.
+
+    cache_dir : string or None, optional
+        The central cache directory in which to write the compiled file.
+        If None, the file is written to the __enamlcache__ directory
+        next to the source file.
+
+    force : bool, optional
+        If True, the file is compiled even if the cached file is
+        current. The default is False.
+
+    quiet : bool, optional
+        If True, the names of the compiled files are not printed. The
+        default is False.
+
+    Returns
+    -------
+    result : bool
+        True if the file was compiled successfully or was current,
+        False if an error occurred during compilation.
+
+    """
+    with open(src_path) as src_file:
+        src = src_file.read()
+
+    if cache_dir:
+        file_info = make_hashed_file_info(src_path, src, cache_dir)
+        ts = 0
+    else:
+        file_info = make_file_info(src_path)
+        ts = int(os.path.getmtime(src_path))
+
+    if not force and os.path.exists(file_info.cache_path):
+        magic, cache_ts = read_magic_info(file_info)
+        if magic == MAGIC and ts <= cache_ts:
+            return True
+
+    if not quiet:
+        print 'Compiling', src_path, '...'
+
+    try:
+        ast = parse(src, src_path)
+        code = EnamlCompiler.compile(ast, src_path)
+    except Exception as exc:
+        if quiet:
+            print 'Compiling', src_path, '...'
+        print '***', '%s: %s' % (type(exc).__name__, exc)
+        return False
+
+    write_cache(code, ts, file_info)
+    return True
+
+
+def compile_dir(path, cache_dir=None, force=False, quiet=False):
+    """ Recursively compiles all of the .enaml files in the given
+    directory.
+
+    Parameters
+    ----------
+    path : string
+        The directory to search for .enaml files.
+
+    cache_dir : string or None, optional
+        The central cache directory. See 'compile_file'.
+
+    force : bool, optional
+        If True, the files are compiled even if the cached files are
+        current. The default is False.
+
+    quiet : bool, optional
+        If True, the names of the compiled files are not printed. The
+        default is False.
+
+    Returns
+    -------
+    result : bool
+        True if all of the files were compiled successfully, False
+        otherwise.
+
+    """
+    success = True
+    enaml_ext = os.path.extsep + 'enaml'
+    for root, dirs, files in os.walk(path):
+        if CACHEDIR in dirs:
+            dirs.remove(CACHEDIR)
+        for fn in sorted(files):
+            if fn.endswith(enaml_ext):
+                src_path = os.path.join(root, fn)
+                if not compile_file(src_path, cache_dir, force, quiet):
+                    success = False
+    return success
+
+
+def main():
+    usage = 'usage: %prog [options] directory|file [directory|file ...]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option('-d', '--cache-dir', default=None,
+                      help=('The central cache directory. Defaults to the '
+                            'value of %s, if set.' % CACHEDIR_ENV))
+    parser.add_option('-f', '--force', action='store_true', default=False,
+                      help='Compile the files even if they are current')
+    parser.add_option('-q', '--quiet', action='store_true', default=False,
+                      help='Only print errors')
+
+    options, args = parser.parse_args()
+    if not args:
+        parser.error('No directories or files were given')
+    cache_dir = options.cache_dir or os.environ.get(CACHEDIR_ENV)
+
+    success = True
+    for path in args:
+        if os.path.isdir(path):
+            res = compile_dir(path, cache_dir, options.force, options.quiet)
+        elif os.path.isfile(path):
+            res = compile_file(path, cache_dir, options.force, options.quiet)
+        else:
+            print '***', 'Cannot find %s' % path
+            res = False
+        success = success and res
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
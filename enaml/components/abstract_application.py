@@ -6,6 +6,7 @@ from abc import ABCMeta, abstractmethod
 from heapq import heappush, heappop
 from itertools import count
 from threading import Lock
+from time import time
     
 
 class ScheduledTask(object):
@@ -41,6 +42,24 @@ class ScheduledTask(object):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _coalesce(self, args, kwargs):
+        """ Replace the arguments of this task with the given arguments
+        if the task is still pending and valid. This should only be 
+        called by the scheduler while holding the heap lock.
+
+        Returns
+        -------
+        result : bool
+            True if the arguments were replaced, False if the task can
+            no longer be coalesced.
+
+        """
+        if not (self.__valid and self.__pending):
+            return False
+        self.__args = args
+        self.__kwargs = kwargs
+        return True
+
     def _execute(self):
         """ Execute the underlying task. This should only been called
         by the scheduler loop.
@@ -103,33 +122,85 @@ class AbstractTkApplication(object):
         # A Lock which protects access to the heap
         self.__heap_lock = Lock()
 
+        # Whether or not a batch of tasks is posted to the main thread.
+        # Protected by the heap lock.
+        self.__dispatching = False
+
+        # The pending tasks which were scheduled with a coalesce key.
+        # Protected by the heap lock.
+        self.__coalesced = {}
+
+        # The time budget, in seconds, to spend processing tasks in a 
+        # single trip through the event loop.
+        self.__batch_time = 0.0
+
+        # The scheduler counters. Protected by the heap lock.
+        self.__stats = self.__new_stats()
+
     #--------------------------------------------------------------------------
     # Private API 
     #--------------------------------------------------------------------------
-    def __process_task(self, task):
-        """ Processes the given task, then dispatches the next task.
+    @staticmethod
+    def __new_stats():
+        """ Returns a new dict of zeroed scheduler counters.
 
         """
-        try:
-            task._execute()
-        finally:
-            self.__next_task()
-    
-    def __next_task(self):
-        """ Pulls the next task off the heap and processes it on the 
-        main gui thread.
+        return {
+            'max_queue_depth': 0,
+            'executed': 0,
+            'coalesced': 0,
+            'batches': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0,
+        }
+
+    def __process_tasks(self):
+        """ Pulls tasks off the heap and executes them on the main gui
+        thread until the heap is empty or the batch time budget is 
+        spent, then posts the next batch if tasks remain. At least one
+        task is executed per batch.
 
         """
         heap = self.__heap
-        with self.__heap_lock:
-            if heap:
-                priority, count, task = heappop(heap)
-                self.call_on_main(self.__process_task, task)
+        lock = self.__heap_lock
+        coalesced = self.__coalesced
+        stats = self.__stats
+        end = time() + self.__batch_time
+        drained = False
+        with lock:
+            stats['batches'] += 1
+        try:
+            while True:
+                with lock:
+                    if not heap:
+                        self.__dispatching = False
+                        drained = True
+                        return
+                    priority, count, task, key, stamp = heappop(heap)
+                    if key is not None and coalesced.get(key) is task:
+                        del coalesced[key]
+                    latency = time() - stamp
+                    stats['executed'] += 1
+                    stats['total_latency'] += latency
+                    if latency > stats['max_latency']:
+                        stats['max_latency'] = latency
+                task._execute()
+                if time() >= end:
+                    break
+        finally:
+            # An exception raised by a task propagates to the event
+            # loop, so the remaining tasks are posted as a new batch.
+            # The decision is made from the local flag, since a task
+            # scheduled by another thread after the heap was drained 
+            # will have posted a new batch already.
+            if not drained:
+                self.call_on_main(self.__process_tasks)
 
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
-    def schedule(self, callback, args=None, kwargs=None, priority=50):
+    def schedule(self, callback, args=None, kwargs=None, priority=50,
+                 coalesce_key=None):
         """ Schedule a callable to be executed on the main gui thread 
         according to its priority. This call is thread-safe.
 
@@ -151,12 +222,21 @@ class AbstractTkApplication(object):
             is 0 and indicates that the callable will jump to the 
             front of the queue. The default is 50.
 
+        coalesce_key : hashable, optional
+            If given, and a task scheduled with an equal key is still
+            pending, the pending task is reused with the new args and 
+            kwargs instead of scheduling a new task. The pending task 
+            keeps its original priority and place in the queue. A key
+            of the form (callback, target) is typical. The default is
+            None and indicates the task is never coalesced.
+
         Returns
         -------
         result : ScheduledTask
             A task object which can be used to unschedule the task or
             retrieve the results of the callback after the task has
-            been executed.
+            been executed. For a coalesced call, this is the pending
+            task which was reused.
             
         """
         if args is None:
@@ -165,16 +245,25 @@ class AbstractTkApplication(object):
         if kwargs is None:
             kwargs = {}
 
-        task = ScheduledTask(callback, args, kwargs)
-
         heap = self.__heap
         with self.__heap_lock:
-            needs_start = len(heap) == 0
-            item = (priority, self.__counter.next(), task)
+            if coalesce_key is not None:
+                pending = self.__coalesced.get(coalesce_key)
+                if pending is not None and pending._coalesce(args, kwargs):
+                    self.__stats['coalesced'] += 1
+                    return pending
+            task = ScheduledTask(callback, args, kwargs)
+            if coalesce_key is not None:
+                self.__coalesced[coalesce_key] = task
+            item = (priority, self.__counter.next(), task, coalesce_key, time())
             heappush(heap, item)
+            stats = self.__stats
+            stats['max_queue_depth'] = max(stats['max_queue_depth'], len(heap))
+            needs_start = not self.__dispatching
+            self.__dispatching = True
 
         if needs_start:
-            self.call_on_main(self.__next_task)
+            self.call_on_main(self.__process_tasks)
         
         return task
 
@@ -187,6 +276,72 @@ class AbstractTkApplication(object):
             has_pending = len(self.__heap) > 0
         return has_pending
 
+    def batch_time(self):
+        """ Returns the time budget, in milliseconds, which the 
+        scheduler spends processing tasks per trip through the event
+        loop.
+
+        """
+        return self.__batch_time * 1000.0
+
+    def set_batch_time(self, ms):
+        """ Set the time budget which the scheduler spends processing
+        tasks per trip through the event loop. 
+
+        Parameters
+        ----------
+        ms : number
+            The number of milliseconds to spend processing tasks before
+            returning control to the event loop. At least one task is
+            always processed per trip. The default is 0, which processes
+            exactly one task per trip. A larger value reduces the cost
+            of scheduling many small tasks at the expense of event loop
+            responsiveness.
+
+        """
+        self.__batch_time = max(0.0, ms / 1000.0)
+
+    def scheduler_stats(self):
+        """ Returns a dict of the scheduler counters collected since
+        the application was created or the counters were last reset.
+
+        Returns
+        -------
+        result : dict
+            A dict with the following keys:
+                queue_depth : the current number of pending tasks.
+                max_queue_depth : the maximum number of pending tasks.
+                executed : the number of tasks pulled off the queue.
+                coalesced : the number of schedule calls which were
+                    coalesced into a pending task.
+                batches : the number of trips through the event loop
+                    used to process tasks.
+                total_latency : the total number of seconds between the
+                    scheduling and the execution of the tasks.
+                max_latency : the maximum number of seconds between the
+                    scheduling and the execution of a task.
+                mean_latency : the average number of seconds between the
+                    scheduling and the execution of a task.
+
+        """
+        with self.__heap_lock:
+            stats = self.__stats.copy()
+            stats['queue_depth'] = len(self.__heap)
+        executed = stats['executed']
+        if executed:
+            stats['mean_latency'] = stats['total_latency'] / executed
+        else:
+            stats['mean_latency'] = 0.0
+        return stats
+
+    def reset_scheduler_stats(self):
+        """ Reset the scheduler counters to zero.
+
+        """
+        with self.__heap_lock:
+            self.__stats.clear()
+            self.__stats.update(self.__new_stats())
+
     #--------------------------------------------------------------------------
     # Abstract API 
     #--------------------------------------------------------------------------
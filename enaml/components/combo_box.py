@@ -4,7 +4,9 @@
 #------------------------------------------------------------------------------
 from abc import abstractmethod
 
-from traits.api import List, Any, Callable, Int, Instance, Property, Str
+from traits.api import (
+    List, Any, Callable, Int, Instance, Property, Str, on_trait_change,
+)
 
 from .control import Control, AbstractTkControl
 
@@ -23,6 +25,14 @@ class AbstractTkComboBox(AbstractTkControl):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def shell_labels_updated_changed(self, update):
+        """ The change handler for the 'labels_updated' event on the
+        shell object. The update is an (index, removed, labels) tuple.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def shell_index_changed(self, index):
         """ The change handler for the 'index' attribute on the shell
@@ -53,6 +63,10 @@ class ComboBox(Control):
         - The selected event is only emitted when the user selects
           a valid value through the ui control, not when the value
           is changed programmatically.
+        - In-place changes to the list of items update the labels
+          incrementally through the labels_updated event. Only a new
+          list of items or a new to_string callable changes the labels
+          as a whole.
 
     """
     #: The objects that compose the collection.
@@ -66,7 +80,9 @@ class ComboBox(Control):
     #: The integer index of the current selection in items. If the index
     #: is out of range of :attr:`items` then the index it is set to -1, 
     #: and the current :attr:`value` is left unchanged.
-    index = Property(Int, depends_on=['_value', 'items[]'])
+    #: The change notification is fired when the value or the items
+    #: change, once the internal caches have been updated.
+    index = Property(Int, depends_on='_value')
 
     #: A callable which will convert the objects in the items list to
     #: strings for display. Defaults to str.
@@ -74,7 +90,16 @@ class ComboBox(Control):
 
     #: A readonly property that holds the component items as a list of
     #: strings that are produced by the :attr:`to_string` attribute.
-    labels = Property(List(Str), depends_on=['to_string', 'items[]'])
+    #: The change notification is only fired when the items are replaced
+    #: or :attr:`to_string` changes. In-place changes to the items fire
+    #: :attr:`labels_updated` instead.
+    labels = Property(List(Str))
+
+    #: Fired when the labels are updated in-place because of an in-place
+    #: change to the items. The event object is an (index, removed, 
+    #: labels) tuple which indicates that the number of labels given by
+    #: 'removed' were replaced with the list of 'labels' at 'index'.
+    labels_updated = EnamlEvent
 
     #: A readonly property that will return the result of calling
     #: :attr:`to_string` on :attr:`value`
@@ -95,6 +120,17 @@ class ComboBox(Control):
     #: An internal attribute that is used to synchronize :attr:`index`.
     _value = Any
 
+    #: The internal cache of the labels of the items, and the items and
+    #: to_string callable for which it was computed.
+    _labels = Any
+    _labels_key = Any
+
+    #: The internal dict which maps the items to the index of their first
+    #: occurrence, and the items for which it was computed. The dict is
+    #: False if the items are not hashable.
+    _item_indices = Any
+    _item_indices_key = Any
+
     #--------------------------------------------------------------------------
     # Property Handlers
     #--------------------------------------------------------------------------
@@ -108,8 +144,20 @@ class ComboBox(Control):
         """ The property getter for :attr:`index`.
 
         """
+        items = self.items
+        value = self._value
+        indices = self._item_indices
+        if self._item_indices_key is not items:
+            indices = self._item_indices = self._compute_item_indices()
+            self._item_indices_key = items
+        if indices is not False:
+            try:
+                return indices.get(value, -1)
+            except TypeError:
+                # An unhashable value is looked up by equality.
+                pass
         try:
-            idx = self.items.index(self._value)
+            idx = items.index(value)
         except ValueError:
             idx = -1
         return idx
@@ -135,10 +183,17 @@ class ComboBox(Control):
 
     def _get_labels(self):
         """ The property getter for :attr:`labels`. Converts the 
-        component items to a list of string labels.
+        component items to a list of string labels, which is cached 
+        until the items or the to_string callable are replaced.
 
         """
-        return map(self.to_string, self.items)
+        items = self.items
+        to_string = self.to_string
+        key = self._labels_key
+        if key is None or key[0] is not items or key[1] is not to_string:
+            self._labels = map(to_string, items)
+            self._labels_key = (items, to_string)
+        return self._labels[:]
     
     def _get_selected_text(self):
         """ The property getter for :attr:`selected_text`.
@@ -146,3 +201,93 @@ class ComboBox(Control):
         """
         return self.to_string(self.value)
 
+    #--------------------------------------------------------------------------
+    # Change Handlers
+    #--------------------------------------------------------------------------
+    def _items_changed(self):
+        """ Fires the change notifications for :attr:`labels` and
+        :attr:`index` when the list of items is replaced.
+
+        """
+        self._reset_labels()
+        self.trait_property_changed('index', None)
+
+    def _to_string_changed(self):
+        """ Fires the change notification for :attr:`labels` when the
+        to_string callable is replaced.
+
+        """
+        self._reset_labels()
+
+    @on_trait_change('items_items')
+    def _update_items(self, event):
+        """ Updates the cached labels and item indices for an in-place
+        change to the items, and fires the labels_updated event and the
+        change notification for :attr:`index`.
+
+        """
+        items = self.items
+        index = event.index
+        if not isinstance(index, int):
+            # An extended slice change updates the labels as a whole.
+            self._item_indices_key = None
+            self._reset_labels()
+            self.trait_property_changed('index', None)
+            return
+
+        removed = event.removed
+        added = event.added
+        indices = self._item_indices
+        if self._item_indices_key is items and indices is not False:
+            if not removed and index + len(added) == len(items):
+                # Appending only adds the new items to the indices.
+                try:
+                    for idx, item in enumerate(added, index):
+                        indices.setdefault(item, idx)
+                except TypeError:
+                    self._item_indices_key = None
+            else:
+                self._item_indices_key = None
+
+        # The labels are only updated if they have been computed, since
+        # no one can hold a copy otherwise. They may already have been
+        # computed from the changed items by another listener, in which
+        # case only the event is fired.
+        to_string = self.to_string
+        key = self._labels_key
+        if key is not None and key[0] is items and key[1] is to_string:
+            new_labels = map(to_string, added)
+            labels = self._labels
+            n_removed = len(removed)
+            if len(labels) == len(items) - len(added) + n_removed:
+                labels[index:index + n_removed] = new_labels
+            self.labels_updated((index, n_removed, new_labels))
+
+        self.trait_property_changed('index', None)
+
+    #--------------------------------------------------------------------------
+    # Private Methods
+    #--------------------------------------------------------------------------
+    def _reset_labels(self):
+        """ Clears the cached labels and fires the change notification
+        for :attr:`labels`.
+
+        """
+        old = self._labels if self._labels_key is not None else None
+        self._labels_key = None
+        self._labels = None
+        self.trait_property_changed('labels', old)
+
+    def _compute_item_indices(self):
+        """ Returns a dict which maps the items to the index of their 
+        first occurrence, or False if the items are not hashable.
+
+        """
+        indices = {}
+        try:
+            for idx, item in enumerate(self.items):
+                indices.setdefault(item, idx)
+        except TypeError:
+            return False
+        return indices
+
@@ -2,7 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Instance, Property, Tuple, Enum, on_trait_change
+from traits.api import Instance, Property, Tuple, Enum, Any, on_trait_change
 
 from .widget_component import WidgetComponent, AbstractTkWidgetComponent
 
@@ -65,6 +65,15 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
         depends_on='resist_clip_width, resist_clip_height',
     )
 
+    #: A private trait which stores the last layout geometry Rect that
+    #: was applied to the widget, or None if the geometry may have been
+    #: changed by other means.
+    _layout_rect = Any
+
+    #: A private trait which stores the size hint from which the cached
+    #: size hint constraints were generated.
+    _constraints_size_hint = Any
+
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkConstraintsWidget)
 
@@ -111,6 +120,7 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
         its own internal layout calculations.
 
         """
+        self.invalidate_constraints('size_hint')
         if self.initialized:
             parent = self.parent
             if parent is not None:
@@ -119,6 +129,20 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
     #--------------------------------------------------------------------------
     # Constraint Handlers
     #--------------------------------------------------------------------------
+    def cached_constraints(self, name):
+        """ Overridden parent class method which discards the cached
+        size hint constraints if the size hint of the widget has changed
+        since they were generated. Not every toolkit widget fires the 
+        'size_hint_updated' event, so the hint is compared directly.
+
+        """
+        if name == 'size_hint':
+            hint = self.size_hint()
+            if hint != self._constraints_size_hint:
+                self._constraints_size_hint = hint
+                self.invalidate_constraints('size_hint')
+        return super(ConstraintsWidget, self).cached_constraints(name)
+
     def size_hint_constraints(self):
         """ Returns the list of constraints relating to the size hint 
         of this layout component. If the size hint in a given dimension
@@ -169,6 +193,44 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
         width = int(round(self.width.value))
         height = int(round(self.height.value))
         rect = Rect(x - dx, y - dy, width, height)
-        self.set_layout_geometry(rect)
+        # Skip the toolkit call if the rect has not changed since it
+        # was last applied.
+        if rect != self._layout_rect:
+            self.set_layout_geometry(rect)
         return (x, y)
 
+    #--------------------------------------------------------------------------
+    # Geometry Methods
+    #--------------------------------------------------------------------------
+    def set_layout_geometry(self, rect):
+        """ Overridden parent class method which records the applied 
+        rect so that redundant layout updates can be skipped.
+
+        """
+        super(ConstraintsWidget, self).set_layout_geometry(rect)
+        self._layout_rect = rect
+
+    def set_geometry(self, rect):
+        """ Overridden parent class method which forgets the applied
+        layout rect, since it may no longer match the widget.
+
+        """
+        self._layout_rect = None
+        super(ConstraintsWidget, self).set_geometry(rect)
+
+    def resize(self, size):
+        """ Overridden parent class method which forgets the applied
+        layout rect, since it may no longer match the widget.
+
+        """
+        self._layout_rect = None
+        super(ConstraintsWidget, self).resize(size)
+
+    def move(self, pos):
+        """ Overridden parent class method which forgets the applied
+        layout rect, since it may no longer match the widget.
+
+        """
+        self._layout_rect = None
+        super(ConstraintsWidget, self).move(pos)
+
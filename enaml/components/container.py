@@ -3,17 +3,18 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from traits.api import (
-    List, Instance, Property, cached_property, Bool, WeakRef
+    List, Instance, Property, cached_property, Bool, WeakRef, Dict, Int, Enum,
 )
 
+from casuarius import CassowaryError
+
 from .constraints_widget import (
     ConstraintsWidget, AbstractTkConstraintsWidget,
 )
 from .layout_task_handler import LayoutTaskHandler
 
 from ..layout.constrainable import PaddingConstraints, Constrainable
-from ..layout.constraints_layout import ConstraintsLayout
-from ..layout.layout_helpers import expand_constraints
+from ..layout.constraints_layout import ConstraintsLayout, keyed_constraints
 from ..layout.geometry import Size, Box
     
 
@@ -53,6 +54,30 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
     #: marked as True to enable sharing.
     share_layout = Bool(False)
 
+    #: A boolean which indicates whether or not to throttle the layout
+    #: updates which are triggered by resizing the container. If True,
+    #: the layout is solved at most once per trip through the event 
+    #: loop, for the latest size of the container. This keeps resizing
+    #: responsive for very large layouts, at the cost of the children
+    #: lagging a single event behind the size of the container. The 
+    #: default is False and solves the layout on every resize event.
+    throttle_resize = Bool(False)
+
+    #: How the contents of the children which are hidden when the 
+    #: container is set up are set up. With 'eager', every child is
+    #: set up with the container. With 'lazy', the contents of a hidden
+    #: child are set up when it is first made visible. With 'idle', 
+    #: they are also set up one child at a time when the application
+    #: is idle. Only the initial value is used. The default is 'eager'.
+    lazy_children = Enum('eager', 'lazy', 'idle')
+
+    #: The index in the constraints children of the only child which
+    #: is shown when the container is set up with lazy children. The 
+    #: default of -1 indicates that the children which are visible are
+    #: shown. This is used by containers, such as a stack, which show
+    #: their children by index.
+    shown_index = Int(-1)
+
     #: A read-only property which returns True if this container owns
     #: its layout and is responsible for setting the geometry of its
     #: children, or False if that responsibility has been transferred
@@ -74,6 +99,17 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
     #: its layout.
     _layout_owner = WeakRef(allow_none=True)
 
+    #: A private dict which holds the constraints which are currently
+    #: in the layout manager, keyed on their structural identity. It 
+    #: is used to compute the difference between successive relayouts
+    #: so that only the changed constraints are updated in the solver.
+    _layout_constraints = Dict
+
+    #: Private counters of the number of child geometry updates which
+    #: were applied and skipped because the geometry was unchanged.
+    _geometry_updates_applied = Int
+    _geometry_updates_skipped = Int
+
     #: A private cached property which computes the size hint whenever 
     #: the size_hint_updated event is fired.
     _size_hint = Property(Instance(Size), depends_on='size_hint_updated')
@@ -128,12 +164,40 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         children change, provided that the container is initialized.
 
         """
+        # The default user constraints and the component constraints
+        # of subclasses are generated from the children.
+        self.invalidate_constraints('user', 'component')
         if self.initialized:
             self.request_relayout()
 
+    # This notifier is hooked up in the '_setup_finalize' method when 
+    # the container has lazy children.
+    def _on_lazy_child_visible(self, child, name, visible):
+        """ Completes the setup of a lazy child when it is made visible.
+
+        """
+        if visible and self.initialized:
+            child.complete_setup()
+
     #--------------------------------------------------------------------------
     # Setup Methods 
     #--------------------------------------------------------------------------
+    def _setup_create_widgets(self, parent):
+        """ A reimplemented parent class setup method which defers the
+        setup of the contents of the hidden children if requested.
+
+        """
+        if self.lazy_children != 'eager':
+            shown_index = self.shown_index
+            for idx, child in enumerate(self.constraints_children):
+                if shown_index >= 0:
+                    hidden = idx != shown_index
+                else:
+                    hidden = not getattr(child, 'visible', True)
+                if hidden:
+                    child.defer_setup()
+        super(Container, self)._setup_create_widgets(parent)
+
     def _setup_init_layout(self):
         """ A reimplemented parent class setup method that performs any
         layout initialization necessary for the component. The layout is
@@ -143,6 +207,20 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         super(Container, self)._setup_init_layout()
         self.initialize_layout()
 
+    def _setup_finalize(self):
+        """ A reimplemented parent class setup method which hooks up 
+        the completion of the setup of the lazy children.
+
+        """
+        super(Container, self)._setup_finalize()
+        lazy_children = self.lazy_children
+        if lazy_children != 'eager':
+            self.on_trait_change(
+                self._on_lazy_child_visible, 'constraints_children:visible',
+            )
+            if lazy_children == 'idle':
+                self.schedule_deferred_setup(self.constraints_children)
+
     #--------------------------------------------------------------------------
     # Layout Handling
     #--------------------------------------------------------------------------
@@ -154,8 +232,7 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         """
         # We only need to initialize the manager if we own the layout.
         if self.owns_layout:
-            constraints = self.compute_constraints()
-            self.layout_manager.initialize(constraints)
+            self._initialize_constraints(self.compute_constraints())
             # We fire off a size hint updated event here since, if
             # for some reason, the size hint was computed before 
             # the layout was initialized, the value will be wrong
@@ -235,12 +312,10 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         # already been forwarded on to the layout owner. So, at
         # this point, we just have to recompute the constraints
         # and do a refresh.
-
-        # TODO There is a big opportunity here to optimize by calling
-        # .update_constraints() on the layout manager instead of just
-        # recomputing everything from scratch, but that will require
-        # tracking the created constraints so for now we just punt.
-        self.layout_manager.initialize(self.compute_constraints())
+        self._update_constraints(self.compute_constraints())
+        # The constraints children may have changed, which invalidates
+        # any memoized solutions even if the constraints did not.
+        self.layout_manager.clear_solutions()
         self.do_refresh()
 
         # We emit the size hint updated event at this point since
@@ -262,7 +337,20 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         width = self.width
         height = self.height
         size = self.size()
-        self.layout_manager.layout(self.apply_layout, width, height, size)
+        self.layout_manager.layout(
+            self.apply_layout, width, height, size, replay=self.replay_layout,
+        )
+
+    def handle_resize(self):
+        """ Called by the toolkit container when it has been resized.
+        This refreshes the layout immediately, or at the next trip 
+        through the event loop if 'throttle_resize' is True.
+
+        """
+        if self.throttle_resize:
+            self.request_refresh()
+        else:
+            self.refresh()
 
     def apply_layout(self):
         """ The callback invoked by the layout manager when there are
@@ -270,17 +358,133 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         children for which this container has layout ownership and 
         applies the geometry updates.
 
+        Returns
+        -------
+        result : list or None
+            A list of (child, rect) tuples of the applied layout rects
+            which can be given to 'replay_layout', or None if a child 
+            does not record its layout rect.
+
         """
+        applied = 0
+        skipped = 0
+        solution = []
         stack = [((0, 0), self.constraints_children)]
         pop = stack.pop
         push = stack.append
         while stack:
             offset, children = pop()
             for child in children:
+                # A child only replaces its layout rect if it changed.
+                old_rect = getattr(child, '_layout_rect', None)
                 new_offset = child.update_layout_geometry(*offset)
+                if old_rect is not None and child._layout_rect is old_rect:
+                    skipped += 1
+                else:
+                    applied += 1
+                if solution is not None:
+                    rect = getattr(child, '_layout_rect', None)
+                    if rect is None:
+                        solution = None
+                    else:
+                        solution.append((child, rect))
                 if isinstance(child, Container):
                     if child._layout_owner is self:
                         push((new_offset, child.constraints_children))
+        self._geometry_updates_applied += applied
+        self._geometry_updates_skipped += skipped
+        return solution
+
+    def replay_layout(self, solution):
+        """ The callback invoked by the layout manager in place of a
+        solve when a memoized solution is available for the size of 
+        the container.
+
+        Parameters
+        ----------
+        solution : list
+            The list of (child, rect) tuples returned by a previous
+            call to 'apply_layout'.
+
+        """
+        applied = 0
+        skipped = 0
+        for child, rect in solution:
+            if child._layout_rect == rect:
+                skipped += 1
+            else:
+                child.set_layout_geometry(rect)
+                applied += 1
+        self._geometry_updates_applied += applied
+        self._geometry_updates_skipped += skipped
+
+    def geometry_update_stats(self):
+        """ Returns the number of child geometry updates which were 
+        applied and skipped by the layout passes of this container, 
+        for use in profiling.
+
+        Returns
+        -------
+        result : (applied, skipped)
+            The number of geometry updates which were pushed to the
+            toolkit, and the number which were skipped because the 
+            geometry of the child was unchanged.
+
+        """
+        return (self._geometry_updates_applied, self._geometry_updates_skipped)
+
+    def reset_geometry_update_stats(self):
+        """ Resets the counts returned by 'geometry_update_stats'.
+
+        """
+        self._geometry_updates_applied = 0
+        self._geometry_updates_skipped = 0
+
+    def _initialize_constraints(self, constraints):
+        """ Initializes the layout manager with a new solver for the 
+        given constraints and records them as the current constraints.
+
+        """
+        keyed = keyed_constraints(constraints)
+        self._layout_constraints = {}
+        self.layout_manager.initialize(keyed.itervalues())
+        self._layout_constraints = keyed
+
+    def _update_constraints(self, constraints):
+        """ Updates the layout manager with the given constraints by
+        removing and adding only the constraints which differ from the
+        current constraints. If the layout manager is not initialized,
+        it is initialized from scratch.
+
+        """
+        manager = self.layout_manager
+        if not manager.initialized:
+            self._initialize_constraints(constraints)
+            return
+
+        old = self._layout_constraints
+        new = keyed_constraints(constraints)
+        removed = [cn for key, cn in old.iteritems() if key not in new]
+        added = []
+        for key, cn in new.iteritems():
+            # Keep the instance which is already in the solver so that
+            # it can be removed during a later update.
+            if key in old:
+                new[key] = old[key]
+            else:
+                added.append(cn)
+
+        if removed or added:
+            try:
+                manager.update_constraints(removed, added)
+            except CassowaryError:
+                # A solver error leaves the solver in an unknown state,
+                # so it is rebuilt from scratch, which raises the error
+                # again if the constraints are not resolvable. Any 
+                # other error indicates a bug and is not masked.
+                self._initialize_constraints(new.itervalues())
+                return
+        self._layout_constraints = new
 
     #--------------------------------------------------------------------------
     # Constraints Computation
@@ -291,47 +495,47 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         constraints into a single list.
 
         """
-        expand = expand_constraints
-
         cns = []
         cns_extend = cns.extend
 
         # We don't care about the size hint constraints for a container
         # which manages a layout because the actual size is the input
-        # to the solver.
-        cns_extend(expand(self, self.hard_constraints()))
-        cns_extend(expand(self, self.padding_constraints()))
-        cns_extend(expand(self, self.user_constraints()))
-        cns_extend(expand(self, self.component_constraints()))
+        # to the solver. The constraints of each component are cached
+        # and only regenerated when their dependencies have changed.
+        cns_extend(self.cached_constraints('hard'))
+        cns_extend(self.cached_constraints('padding'))
+        cns_extend(self.cached_constraints('user'))
+        cns_extend(self.cached_constraints('component'))
 
         stack = list(self.constraints_children)
         stack_pop = stack.pop
         stack_extend = stack.extend
         while stack:
             child = stack_pop()
+            cached = child.cached_constraints
             if isinstance(child, Container):
                 # When we take over layout ownership of a container we
                 # don't care about its size hint constraints since we
                 # deal with its children directly.
                 if child.transfer_layout_ownership(self):
-                    cns_extend(expand(child, child.hard_constraints()))
-                    cns_extend(expand(child, child.padding_constraints()))
-                    cns_extend(expand(child, child.user_constraints()))
-                    cns_extend(expand(child, child.component_constraints()))
+                    cns_extend(cached('hard'))
+                    cns_extend(cached('padding'))
+                    cns_extend(cached('user'))
+                    cns_extend(cached('component'))
                     stack_extend(child.constraints_children)
                 else:
                     # If we aren't taking over layout ownership, then we
                     # don't care about any of the container's internal 
                     # constraints.
-                    cns_extend(expand(child, child.hard_constraints()))
-                    cns_extend(expand(child, child.size_hint_constraints()))
+                    cns_extend(cached('hard'))
+                    cns_extend(cached('size_hint'))
             else:
-                cns_extend(expand(child, child.hard_constraints()))
-                cns_extend(expand(child, child.size_hint_constraints()))
-                cns_extend(expand(child, child.user_constraints()))
-                cns_extend(expand(child, child.component_constraints()))
+                cns_extend(cached('hard'))
+                cns_extend(cached('size_hint'))
+                cns_extend(cached('user'))
+                cns_extend(cached('component'))
                 if isinstance(child, PaddingConstraints):
-                    cns_extend(expand(child, child.padding_constraints()))
+                    cns_extend(cached('padding'))
                     
         return cns
 
@@ -427,3 +631,26 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
             res = Size(-1, -1)
         return res
 
+    def compute_min_max_size(self):
+        """ Calculates both the minimum and maximum sizes of the 
+        container with a single query of the layout manager. See 
+        'compute_min_size' and 'compute_max_size'.
+
+        Returns
+        -------
+        result : (Size, Size)
+            The (min_size, max_size) tuple of the container.
+
+        """
+        if self.owns_layout and self.layout_manager.initialized:
+            width = self.width
+            height = self.height
+            manager = self.layout_manager
+            (min_w, min_h), (max_w, max_h) = manager.get_min_max_size(
+                width, height,
+            )
+            min_size = Size(int(round(min_w)), int(round(min_h)))
+            max_size = Size(int(round(max_w)), int(round(max_h)))
+        else:
+            min_size = max_size = Size(-1, -1)
+        return (min_size, max_size)
@@ -47,6 +47,13 @@ class Form(Container):
     
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkForm)
+
+    def _layout_strength_changed(self):
+        """ A change handler which discards the cached component 
+        constraints, which are generated with the layout strength.
+
+        """
+        self.invalidate_constraints('component')
     
     def component_constraints(self):
         """ Computes the current form constraints for the current
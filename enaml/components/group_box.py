@@ -4,7 +4,7 @@
 #------------------------------------------------------------------------------
 from abc import abstractmethod
 
-from traits.api import Bool, Instance, Str
+from traits.api import Any, Bool, Instance, Str, on_trait_change
 
 from .container import Container, AbstractTkContainer
 
@@ -72,6 +72,33 @@ class GroupBox(Container):
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkGroupBox)
 
+    #: A private trait which stores the contents margins from which the
+    #: cached padding constraints were generated.
+    _constraints_margins = Any
+
+    @on_trait_change('title, flat, font')
+    def _on_group_box_margins_changed(self):
+        """ A change handler which discards the cached padding 
+        constraints when a change may affect the contents margins.
+
+        """
+        self.invalidate_constraints('padding')
+
+    def cached_constraints(self, name):
+        """ Overridden parent class method which discards the cached
+        padding constraints if the contents margins of the group box 
+        have changed since they were generated. The margins depend on
+        the toolkit style as well as on the traits of the group box, 
+        so they are compared directly.
+
+        """
+        if name == 'padding':
+            margins = self.abstract_obj.get_contents_margins()
+            if margins != self._constraints_margins:
+                self._constraints_margins = margins
+                self.invalidate_constraints('padding')
+        return super(GroupBox, self).cached_constraints(name)
+
     def padding_constraints(self):
         """ Overriden padding constraints method to add the contents 
         margins of the underlying group box to the specified user 
@@ -2,44 +2,85 @@
 # Copyright (c) 2011, Enthought, Inc.
 # All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import List, Int, on_trait_change
+from traits.api import (
+    Instance, List, Int, Property, cached_property, on_trait_change,
+)
+from traits.trait_handlers import TraitListObject
 
 from .base_selection_model import BaseSelectionModel
 
+from ..core.interval_set import IntervalSet
 from ..guard import guard
 
 
 class RowSelectionModel(BaseSelectionModel):
-    """ A selection model that maps to a list of row indices.
+    """ A selection model that maps to a set of row indices.
+
+    The selected rows are held as an IntervalSet of contiguous ranges,
+    which are exchanged with the toolkit one range at a time. The list
+    of row indices is only created when 'selected_rows' is requested.
 
     Generally, this should be used with `selection_behavior='rows'`.
 
     """
-    #: The selected row indices.
-    selected_rows = List(Int)
+    #: The selected row indices as an IntervalSet.
+    selected_ranges = Instance(IntervalSet, ())
+
+    #: The selected row indices as a sorted list. The list is created
+    #: from 'selected_ranges' on request. Modifying the list in-place
+    #: updates 'selected_ranges' and fires 'selected_rows_items'.
+    selected_rows = Property(List(Int), depends_on='selected_ranges')
 
     #: Only select rows.
     selection_behavior = 'rows'
 
+    @cached_property
+    def _get_selected_rows(self):
+        """ The property getter for the 'selected_rows' attribute.
+
+        """
+        trait = self.trait('selected_rows').handler
+        return TraitListObject(
+            trait, self, 'selected_rows', list(self.selected_ranges),
+        )
+
+    def _set_selected_rows(self, rows):
+        """ The property setter for the 'selected_rows' attribute.
+
+        """
+        self.selected_ranges = IntervalSet.from_values(rows)
+
+    @on_trait_change('selected_rows_items')
+    def _update_from_rows(self):
+        """ Update the selected ranges from an in-place modification
+        of the 'selected_rows' list.
+
+        """
+        self.selected_ranges = IntervalSet.from_values(self.selected_rows)
+
     @on_trait_change('selection_event')
-    def _update_rows(self, event):
-        selected_rows = []
+    def _update_ranges(self, event):
+        """ Update the selected ranges from the toolkit selection.
+
+        """
+        ranges = []
         for topleft, botright in self.get_selection():
-            selected_rows.extend(range(topleft.row, botright.row+1))
-        selected_rows.sort()
-        with guard(self, self._update_rows):
-            self.selected_rows = selected_rows
-
-    @on_trait_change('selected_rows,selected_rows_items')
-    def _update_selection(self):
-        if guard.guarded(self, self._update_rows):
+            ranges.append((topleft.row, botright.row))
+        with guard(self, self._update_ranges):
+            self.selected_ranges = IntervalSet(ranges)
+
+    @on_trait_change('selected_ranges')
+    def _update_selection(self, new):
+        """ Update the toolkit selection from the selected ranges.
+
+        """
+        if guard.guarded(self, self._update_ranges):
             return
         item_model = self.parent.item_model
         selection = []
-        # FIXME: try to merge contiguous rows into ranges.
-        for i in self.selected_rows:
-            topleft = item_model.create_index(i, 0, item_model)
-            botright = item_model.create_index(i, 0, item_model)
+        for first, last in new.ranges():
+            topleft = item_model.create_index(first, 0, item_model)
+            botright = item_model.create_index(last, 0, item_model)
             selection.append((topleft, botright))
         self.set_selection(selection, ('clear_select', 'rows'))
 
@@ -5,7 +5,7 @@
 from abc import abstractmethod
 
 from traits.api import (
-    Property, Int, Instance, List, cached_property, on_trait_change,
+    Property, Int, Instance, List, Enum, cached_property, on_trait_change,
 )
 
 from .constraints_widget import (
@@ -72,6 +72,14 @@ class TabGroup(LayoutTaskHandler, ConstraintsWidget):
     #: The default value is 'top'.
     tab_position = TabPosition('top')
 
+    #: How the contents of the tabs are set up. With 'eager', every tab
+    #: is set up with the group. With 'lazy', only the selected tab is
+    #: set up with the group, and the contents of the other tabs are set
+    #: up when they are first selected. With 'idle', the contents of the
+    #: other tabs are also set up one tab at a time when the application
+    #: is idle. Only the initial value is used. The default is 'eager'.
+    tab_setup = Enum('eager', 'lazy', 'idle')
+
     #: How strongly a component hugs it's contents' width. A TabGroup
     #: ignores its width hug by default, so it expands freely in width.
     hug_width = 'ignore'
@@ -123,9 +131,45 @@ class TabGroup(LayoutTaskHandler, ConstraintsWidget):
             idx = 0
         return idx
 
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def _setup_create_widgets(self, parent):
+        """ A reimplemented parent class setup method which defers the
+        setup of the contents of the unselected tabs if requested.
+
+        """
+        if self.tab_setup != 'eager':
+            selected = self.selected_tab
+            for tab in self.tabs:
+                if tab is not selected:
+                    tab.defer_setup()
+        super(TabGroup, self)._setup_create_widgets(parent)
+
+    def _setup_finalize(self):
+        """ A reimplemented parent class setup method which schedules
+        the idle setup of the deferred tabs if requested.
+
+        """
+        super(TabGroup, self)._setup_finalize()
+        if self.tab_setup == 'idle':
+            self.schedule_deferred_setup(self.tabs)
+
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
+    @on_trait_change('_selected_index')
+    def _on_selected_index_changed(self):
+        """ A change handler which completes the setup of the selected
+        tab if it was deferred, provided that the component is
+        initialized.
+
+        """
+        if self.initialized:
+            tab = self.selected_tab
+            if tab is not None:
+                tab.complete_setup()
+
     @on_trait_change('tabs, tab_position')
     def _on_tab_group_deps_changed(self):
         """ A change handler for triggering a relayout when the tabs or
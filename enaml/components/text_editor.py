@@ -4,7 +4,7 @@
 #------------------------------------------------------------------------------
 from abc import abstractmethod
 
-from traits.api import Bool, Int, Str, Property, Instance
+from traits.api import Bool, Int, Str, Property, Instance, Event
 
 from .control import Control, AbstractTkControl
 
@@ -42,6 +42,14 @@ class AbstractTkTextEditor(AbstractTkControl):
     def set_text(self, text):
         raise NotImplementedError
 
+    @abstractmethod
+    def append_text(self, text):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_selected_text(self):
+        raise NotImplementedError
+
     @abstractmethod
     def set_selection(self, start, end):
         raise NotImplementedError
@@ -164,9 +172,9 @@ class TextEditor(Control):
     #: False if the text is programmatically changed.
     modified = Property(Bool, depends_on='_modified')
 
-    #: A read only property that is updated with the text selected
-    #: in the editor.
-    selected_text = Property(Str, depends_on='_selected_text')
+    #: A read only property holding the text selected in the editor.
+    #: The text is only retrieved from the widget when requested.
+    selected_text = Property(Str, depends_on='_selection_updated')
 
     #: Fired when the text is changed programmatically, or by the user
     #: via the ui. The event does not carry a payload. To retrieve the
@@ -178,6 +186,14 @@ class TextEditor(Control):
     #: payload. To retrieve the current text, call `get_text()`.
     text_edited = EnamlEvent
 
+    #: Fired when the contents of the editor change, either by the user
+    #: or programmatically. The payload is a tuple of (position, removed,
+    #: added) where 'position' is the index at which the change occured,
+    #: 'removed' is the number of characters removed, and 'added' is the
+    #: text which was inserted. This allows the changes to be followed
+    #: without retrieving the entire text with `get_text()`.
+    text_delta = EnamlEvent
+
     #: Fired when the widget has lost input focus.
     lost_focus = EnamlEvent
 
@@ -201,9 +217,9 @@ class TextEditor(Control):
     #: to update the value of 'modified'.
     _modified = Bool(False)
 
-    #: An internal attribute that is used by the implementation object
-    #: to update the value of 'selected_text'.
-    _selected_text = Str
+    #: An internal event that is fired by the implementation object
+    #: when the selection changes, invalidating 'selected_text'.
+    _selection_updated = Event
 
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkTextEditor)
@@ -220,6 +236,22 @@ class TextEditor(Control):
         """
         return self.abstract_obj.set_text(text)
 
+    def append_text(self, text):
+        """ Append text to the end of the editor. This is treated as
+        a programmatic change, so 'text_edited' is not fired.
+
+        Unlike a `set_text()` with the current text plus the new text,
+        this does not copy or re-layout the existing contents, which
+        makes it suitable for log-style output.
+
+        Arguments
+        ---------
+        text : str
+            The text to append to the editor.
+
+        """
+        self.abstract_obj.append_text(text)
+
     def set_selection(self, start, end):
         """ Sets the selection to the bounds of start and end.
 
@@ -400,8 +432,11 @@ class TextEditor(Control):
         return self._modified
 
     def _get_selected_text(self):
-        """ The property getter for the 'selected' attribute.
+        """ The property getter for the 'selected_text' attribute.
 
         """
-        return self._selected_text
+        abstract_obj = self.abstract_obj
+        if abstract_obj is None:
+            return u''
+        return abstract_obj.get_selected_text()
     
@@ -398,9 +398,11 @@ class Window(LayoutTaskHandler, WidgetComponent):
 
             # If the central widget is a container, we have it compute
             # the minimum size for us, otherwise, we use the size hint
-            # of the widget as the value.
+            # of the widget as the value. The window needs both bounds,
+            # so they are queried together and the maximum size is 
+            # cached by the layout manager for '_compute_maximum_size'.
             if isinstance(widget, Container):
-                min_width, min_height = widget.compute_min_size()
+                min_width, min_height = widget.compute_min_max_size()[0]
             else:
                 min_width, min_height = widget.size_hint()
 
@@ -450,7 +452,7 @@ class Window(LayoutTaskHandler, WidgetComponent):
             # the maximum size for us, otherwise, we use the size hint
             # of the widget as the value.
             if isinstance(widget, Container):
-                max_width, max_height = widget.compute_max_size()
+                max_width, max_height = widget.compute_min_max_size()[1]
             else:
                 max_width, max_height = widget.size_hint()
 
@@ -40,7 +40,7 @@ class BaseComponent(HasStrictTraits):
     #: user code.
     children = LazyProperty(
         List(Instance('BaseComponent')), 
-        depends_on='_subcomponents:_actual_updated',
+        depends_on='_subcomponents:_actual_updated, _setup_deferred',
     )
 
     #: Whether the component has been initialized or not. This will be 
@@ -75,6 +75,15 @@ class BaseComponent(HasStrictTraits):
     #: by subclasses to limit the type or number of subcomponents.
     _subcomponents = List(Instance('BaseComponent'))
 
+    #: A read-only property which is True if the setup of the 
+    #: subcomponents of this component has been deferred and has not
+    #: yet been completed.
+    setup_deferred = Property(Bool, depends_on='_setup_deferred')
+
+    #: The private storage for the 'setup_deferred' property. It is set
+    #: by the 'defer_setup' and 'complete_setup' methods.
+    _setup_deferred = Bool(False)
+
     #: A private event that should be emitted by a component when the 
     #: results of calling get_actual() will result in new values. 
     #: This event is listened to by the parent of subcomponents in order 
@@ -119,13 +128,22 @@ class BaseComponent(HasStrictTraits):
         """
         return self
         
+    def _get_setup_deferred(self):
+        """ The property getter for the 'setup_deferred' attribute.
+
+        """
+        return self._setup_deferred
+
     def _get_children(self):
         """ The lazy property getter for the 'children' attribute.
 
         This property getter returns the flattened list of components
-        returned by calling 'get_actual()' on each subcomponent.
+        returned by calling 'get_actual()' on each subcomponent, or an
+        empty list if the setup of the subcomponents is deferred.
 
         """
+        if self._setup_deferred:
+            return []
         return sum([c.get_actual() for c in self._subcomponents], [])
     
     #--------------------------------------------------------------------------
@@ -203,7 +221,7 @@ class BaseComponent(HasStrictTraits):
         to create the underlying toolkit widget(s).
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_create_widgets(parent)
 
     def _setup_init_widgets(self):
@@ -212,7 +230,7 @@ class BaseComponent(HasStrictTraits):
         to initialize their internal toolkit widget(s).
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_init_widgets()
 
     def _setup_eval_expressions(self):
@@ -224,7 +242,7 @@ class BaseComponent(HasStrictTraits):
         """
         for name in self._expressions:
             getattr(self, name)
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_eval_expressions()
 
     def _setup_bind_widgets(self):
@@ -233,7 +251,7 @@ class BaseComponent(HasStrictTraits):
         to bind any event handlers of their internal toolkit widget(s).
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_bind_widgets()
 
     def _setup_listeners(self):
@@ -243,7 +261,7 @@ class BaseComponent(HasStrictTraits):
         toolkit widget(s).
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_listeners()
 
     def _setup_init_visibility(self):
@@ -252,7 +270,7 @@ class BaseComponent(HasStrictTraits):
         to initialize the visibility of their widgets.
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_init_visibility()
 
     def _setup_init_layout(self):
@@ -261,7 +279,7 @@ class BaseComponent(HasStrictTraits):
         their underlying layout.
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_init_layout()
 
     def _setup_finalize(self):
@@ -271,7 +289,7 @@ class BaseComponent(HasStrictTraits):
         this method.
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_finalize()
 
     def _setup_set_initialized(self):
@@ -279,10 +297,111 @@ class BaseComponent(HasStrictTraits):
         the component to True. This is performed bottom-up.
 
         """
-        for child in self._subcomponents:
+        for child in self._setup_subcomponents():
             child._setup_set_initialized()
         self.initialized = True
 
+    #--------------------------------------------------------------------------
+    # Deferred Setup
+    #--------------------------------------------------------------------------
+    def _setup_subcomponents(self):
+        """ Returns the subcomponents which take part in the setup of
+        this component. This is an empty list if their setup has been
+        deferred.
+
+        """
+        if self._setup_deferred:
+            return []
+        return self._subcomponents
+
+    def defer_setup(self):
+        """ Defers the setup of the subcomponents of this component.
+
+        This must be called before the component is set up. The
+        component itself is set up as usual, but its subcomponents are
+        not set up and are not included in its children until the
+        'complete_setup' method is called.
+
+        """
+        self._setup_deferred = True
+
+    def complete_setup(self):
+        """ Runs the deferred setup of the subcomponents of this 
+        component and includes them in its children. This is a no-op
+        if the setup has not been deferred.
+
+        """
+        if not self._setup_deferred:
+            return
+        components = self._subcomponents
+
+        # This performs the same setup steps as the 'setup' method, in
+        # the same way as an Include sets up its dynamic components. 
+        # The subcomponents are only included in the children once 
+        # they are fully set up, so that any relayout which results 
+        # from the change in children sees the completed components.
+        try:
+            toolkit_parent = self.toolkit_widget
+        except AttributeError:
+            toolkit_parent = None
+
+        for child in components:
+            child._setup_create_widgets(toolkit_parent)
+
+        for child in components:
+            child._setup_init_widgets()
+
+        for child in components:
+            child._setup_eval_expressions()
+
+        for child in components:
+            child._setup_bind_widgets()
+
+        for child in components:
+            child._setup_listeners()
+
+        for child in components:
+            child._setup_init_visibility()
+
+        for child in components:
+            child._setup_init_layout()
+
+        for child in components:
+            child._setup_finalize()
+
+        for child in components:
+            child._setup_set_initialized()
+
+        self._setup_deferred = False
+
+    def schedule_deferred_setup(self, components):
+        """ Schedules the completion of the deferred setup of the given
+        components with the toolkit application. The components are 
+        set up one at a time by tasks of the lowest priority, so that
+        the setup is performed while the application is idle.
+
+        Parameters
+        ----------
+        components : iterable
+            The components whose deferred setup should be completed.
+            Components whose setup is not deferred when their task is
+            run are skipped.
+
+        """
+        app = getattr(self.toolkit, 'app', None)
+        pending = deque(c for c in components if c.setup_deferred)
+        if app is None or not pending:
+            return
+        def closure():
+            while pending:
+                component = pending.popleft()
+                if component.setup_deferred:
+                    component.complete_setup()
+                    break
+            if pending:
+                app.schedule(closure, priority=100)
+        app.schedule(closure, priority=100)
+
     #--------------------------------------------------------------------------
     # Teardown Methods
     #--------------------------------------------------------------------------
@@ -294,9 +413,12 @@ class BaseComponent(HasStrictTraits):
         reimplement this method.
 
         """
-        for child in self._subcomponents:
+        # Subcomponents whose setup was deferred were never set up, so
+        # there is nothing of theirs to destroy.
+        for child in self._setup_subcomponents():
             child.destroy()
         del self._subcomponents[:]
+        self._setup_deferred = False
         self._expressions.clear()
 
     #--------------------------------------------------------------------------
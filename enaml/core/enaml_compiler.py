@@ -2,14 +2,17 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import __builtin__
 import ast
 import itertools
 import types
 
+from . import enaml_ast
 from .byteplay import (
     Code, LOAD_FAST, CALL_FUNCTION, LOAD_GLOBAL, STORE_FAST, LOAD_CONST,
     LOAD_ATTR, STORE_SUBSCR, RETURN_VALUE, POP_TOP, MAKE_FUNCTION,
-    STORE_NAME, LOAD_NAME, SetLineno,
+    STORE_NAME, LOAD_NAME, DELETE_NAME, POP_JUMP_IF_FALSE, JUMP_FORWARD,
+    SetLineno, Label,
 )
 
 
@@ -27,7 +30,14 @@ from .byteplay import (
 #     line number specified by the ast. The workaround is to compile the 
 #     code object, then make a new copy of it with the proper firstlineno 
 #     set via the types.CodeType constructor.
-COMPILER_VERSION = 2
+# 3 : Add name resolution plans - 18 October 2026
+#     Operators are passed a 7th argument which is a tuple describing
+#     how the names loaded by the expression should be resolved.
+# 4 : Only pass plans to operators which accept them - 18 October 2026
+#     The plan is only passed to operators which have a true 
+#     '__enaml_accepts_plan__' attribute, so that operators which 
+#     take the original 6 arguments continue to work.
+COMPILER_VERSION = 4
 
 
 #------------------------------------------------------------------------------
@@ -51,6 +61,64 @@ def _var_name_generator():
         yield '_var_' + str(count.next())
 
 
+def _module_names(module_ast):
+    """ Returns the set of names which are bound at the top level of
+    the given enaml module ast. Wildcard imports and names bound by 
+    other means are not included.
+
+    """
+    names = set()
+    for item in module_ast.body:
+        if isinstance(item, enaml_ast.Declaration):
+            names.add(item.name)
+        elif isinstance(item, enaml_ast.Python):
+            for stmt in item.py_ast.body:
+                if isinstance(stmt, (ast.FunctionDef, ast.ClassDef)):
+                    names.add(stmt.name)
+                elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                    for alias in stmt.names:
+                        if alias.name != '*':
+                            asname = alias.asname or alias.name
+                            names.add(asname.split('.')[0])
+                elif isinstance(stmt, ast.Assign):
+                    for target in stmt.targets:
+                        if isinstance(target, ast.Name):
+                            names.add(target.id)
+    return names
+
+
+def _declared_identifiers(node):
+    """ Returns the set of identifiers declared within the body of 
+    the given Declaration node, including its own identifier.
+
+    """
+    idents = set()
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (enaml_ast.Declaration, enaml_ast.Instantiation)):
+            if item.identifier:
+                idents.add(item.identifier)
+            stack.extend(item.body)
+    return idents
+
+
+def _loaded_names(code):
+    """ Returns the tuple of names which are loaded by the given code
+    object with the LOAD_NAME op-code and which are never stored by it.
+
+    """
+    loaded = []
+    stored = set()
+    for op, op_arg in Code.from_code(code).code:
+        if op == LOAD_NAME:
+            if op_arg not in loaded:
+                loaded.append(op_arg)
+        elif op == STORE_NAME or op == DELETE_NAME:
+            stored.add(op_arg)
+    return tuple(name for name in loaded if name not in stored)
+
+
 def update_firstlineno(code, firstlineno):
     """ Returns a new code object with an updated first line number.
 
@@ -98,7 +166,7 @@ class DeclarationCompiler(_NodeVisitor):
 
     """
     @classmethod
-    def compile(cls, node, filename):
+    def compile(cls, node, filename, global_names=()):
         """ Compiles the given Declaration node into a byteplay code 
         object.
 
@@ -121,17 +189,51 @@ class DeclarationCompiler(_NodeVisitor):
             foo = foo_cls.__enaml_call__(identifiers, toolkit)
             identifiers['foo'] = foo
             op = eval_('__operator_Equal__', toolkit, f_globals)
-            op(foo, 'a', <ast>, <code>, identifiers, f_globals, toolkit)
+            op(foo, 'a', <code>, identifiers, f_globals, toolkit, <plan>)
             btn_cls = eval_('PushButton', toolkit, f_globals)
             btn = btn_cls.__enaml_call__(None, toolkit)
             identifiers['btn'] = button
             op = eval_('__operator_Equal__', toolkit, f_globals)
-            op(item, 'text', <ast>, <code>, identifiers, f_globals, toolkit)
+            op(item, 'text', <code>, identifiers, f_globals, toolkit, <plan>)
             foo.add_subcomponent(button)
             return foo
+
+        The <plan> is a tuple of (name, kind, depth) tuples which 
+        describes how each name loaded by the expression should be 
+        resolved at runtime. The kind is one of:
+
+            'identifier'
+                The name is an identifier declared in the body of the
+                declaration. The depth is None.
+
+            'attribute'
+                The name is an attribute declared on the component
+                which is 'depth' levels above the component which owns 
+                the expression.
+            
+            'global'
+                The name is bound at the top level of the module or is
+                a builtin. The depth is None.
+
+        Names which cannot be classified are omitted from the plan and
+        are resolved dynamically at runtime. The <plan> is only passed
+        to operators which have a true '__enaml_accepts_plan__' 
+        attribute. Other operators are called with 6 arguments.
+
+        Parameters
+        ----------
+        node : Declaration
+            The enaml ast Declaration node to compile.
+
+        filename : string
+            The filename of the module being compiled.
+
+        global_names : set, optional
+            The names bound at the top level of the module, used to
+            classify global names in the resolution plans.
         
         """
-        compiler = cls(filename)
+        compiler = cls(filename, global_names)
         compiler.visit(node)
         code_ops = compiler.code_ops
         code = Code(
@@ -140,14 +242,17 @@ class DeclarationCompiler(_NodeVisitor):
         )
         return code
 
-    def __init__(self, filename):
+    def __init__(self, filename, global_names=()):
         self.filename = filename
+        self.global_names = set(global_names).union(dir(__builtin__))
+        self.identifiers = set()
         self.code_ops = []
         self.extend_ops = self.code_ops.extend
         self.name_gen = _var_name_generator()
         self.name_stack = []
         self.push_name = self.name_stack.append
         self.pop_name = self.name_stack.pop
+        self.attr_stack = []
 
     def curr_name(self):
         """ Returns the current variable name on the stack.
@@ -155,6 +260,46 @@ class DeclarationCompiler(_NodeVisitor):
         """
         return self.name_stack[-1]
 
+    def push_attrs(self, node):
+        """ Pushes the set of attribute names declared in the body of
+        the given node onto the attribute stack.
+
+        """
+        attrs = set(
+            item.name for item in node.body 
+            if isinstance(item, enaml_ast.AttributeDeclaration)
+        )
+        self.attr_stack.append(attrs)
+
+    def pop_attrs(self):
+        """ Pops the current set of attribute names off of the 
+        attribute stack.
+
+        """
+        self.attr_stack.pop()
+
+    def resolution_plan(self, code):
+        """ Computes the name resolution plan for the given expression
+        code object. See 'compile' for a description of the plan.
+
+        """
+        plan = []
+        identifiers = self.identifiers
+        global_names = self.global_names
+        attr_stack = self.attr_stack
+        for name in _loaded_names(code):
+            if name in identifiers:
+                plan.append((name, 'identifier', None))
+                continue
+            for depth, attrs in enumerate(reversed(attr_stack)):
+                if name in attrs:
+                    plan.append((name, 'attribute', depth))
+                    break
+            else:
+                if name in global_names:
+                    plan.append((name, 'global', None))
+        return tuple(plan)
+
     def visit_Declaration(self, node):
         """ Creates the bytecode ops for a declaration node. This visitor
         handles creating the component instance and storing it's identifer
@@ -164,6 +309,8 @@ class DeclarationCompiler(_NodeVisitor):
         name = self.name_gen.next()
         extend_ops = self.extend_ops
         self.push_name(name)
+        self.push_attrs(node)
+        self.identifiers = _declared_identifiers(node)
         base_code = compile(node.base.py_ast, self.filename, mode='eval')
         extend_ops([
             # f_globals = globals()
@@ -208,6 +355,7 @@ class DeclarationCompiler(_NodeVisitor):
             (RETURN_VALUE, None),
         ])
 
+        self.pop_attrs()
         self.pop_name()
 
     def visit_AttributeDeclaration(self, node):
@@ -259,10 +407,15 @@ class DeclarationCompiler(_NodeVisitor):
 
         """
         # A binding is accomplished by loading the appropriate binding
-        # operator function and passing it the a number of arguments:
+        # operator function and passing it the a number of arguments.
+        # The resolution plan is only passed to operators which declare
+        # that they accept it:
         #
-        # op = eval('__operator_Equal__', toolkit, f_globals)
-        # op(item, 'a', code, identifiers, f_globals, toolkit)
+        # op_ = eval('__operator_Equal__', toolkit, f_globals)
+        # if getattr(op_, '__enaml_accepts_plan__', False):
+        #     op_(item, 'a', code, identifiers, f_globals, toolkit, plan)
+        # else:
+        #     op_(item, 'a', code, identifiers, f_globals, toolkit)
         fn = self.filename
         op_code = compile(node.binding.op, fn, mode='eval')
         py_ast = node.binding.expr.py_ast
@@ -275,19 +428,35 @@ class DeclarationCompiler(_NodeVisitor):
             # exceptions are properly reported.
             expr_code = compile(py_ast, fn, mode='eval')
             expr_code = update_firstlineno(expr_code, py_ast.lineno)
+        plan = self.resolution_plan(expr_code)
+        no_plan = Label()
+        done = Label()
         self.extend_ops([
             (LOAD_FAST, 'eval_'),
             (LOAD_CONST, op_code),
             (LOAD_FAST, 'toolkit'),
             (LOAD_FAST, 'f_globals'),
             (CALL_FUNCTION, 0x0003),
+            (STORE_FAST, 'op_'),
+            (LOAD_FAST, 'op_'),
             (LOAD_FAST, self.curr_name()),
             (LOAD_CONST, node.name),
             (LOAD_CONST, expr_code),
             (LOAD_FAST, 'identifiers'),
             (LOAD_FAST, 'f_globals'),
             (LOAD_FAST, 'toolkit'),
+            (LOAD_GLOBAL, 'getattr'),
+            (LOAD_FAST, 'op_'),
+            (LOAD_CONST, '__enaml_accepts_plan__'),
+            (LOAD_CONST, False),
+            (CALL_FUNCTION, 0x0003),
+            (POP_JUMP_IF_FALSE, no_plan),
+            (LOAD_CONST, plan),
+            (CALL_FUNCTION, 0x0007),
+            (JUMP_FORWARD, done),
+            (no_plan, None),
             (CALL_FUNCTION, 0x0006),
+            (done, None),
             (POP_TOP, None),
         ])
 
@@ -300,6 +469,7 @@ class DeclarationCompiler(_NodeVisitor):
         extend_ops = self.extend_ops
         name = self.name_gen.next()
         self.push_name(name)
+        self.push_attrs(node)
         op_code = compile(node.name, self.filename, mode='eval')
         extend_ops([
             # btn_cls = eval('PushButton', toolkit, f_globals)
@@ -332,6 +502,7 @@ class DeclarationCompiler(_NodeVisitor):
         for item in node.body:
             visit(item)
         
+        self.pop_attrs()
         self.pop_name()
         extend_ops([
             # foo.add_subcomponent(button)
@@ -369,6 +540,7 @@ class EnamlCompiler(_NodeVisitor):
         
         """
         compiler = cls(filename)
+        compiler.global_names = _module_names(module_ast)
         compiler.visit(module_ast)
 
         module_ops = [(SetLineno, 1)]
@@ -404,6 +576,7 @@ class EnamlCompiler(_NodeVisitor):
     def __init__(self, filename):
         self.code_ops = []
         self.filename = filename
+        self.global_names = set()
 
     def visit_Module(self, node):
         """ The module node visitor method. Used internally by the
@@ -434,7 +607,9 @@ class EnamlCompiler(_NodeVisitor):
         """
         # This creates a function from the generated code ops then
         # wraps that function in an EnamlDeclaration.
-        func_code = DeclarationCompiler.compile(node, self.filename)
+        func_code = DeclarationCompiler.compile(
+            node, self.filename, self.global_names,
+        )
         name = node.name
         self.code_ops.extend([
             (LOAD_CONST, func_code),
@@ -3,18 +3,22 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
-from collections import namedtuple, defaultdict
+from collections import namedtuple, defaultdict, OrderedDict
 from contextlib import contextmanager
-from weakref import ref
+import logging
+from weakref import ref, WeakKeyDictionary
 
-from traits.api import Disallow
+from traits.api import HasTraits
 
 from .byteplay import Code
-from .monitors import AbstractMonitor
+from .monitors import AbstractMonitor, TraitHandlerMixin
 from .signaling import Signal
 from .trait_types import UninitializedAttributeError
 
 
+logger = logging.getLogger(__name__)
+
+
 #------------------------------------------------------------------------------
 # Expression Helpers
 #------------------------------------------------------------------------------
@@ -43,6 +47,69 @@ def swap_attribute(obj, attr, value):
     setattr(obj, attr, old)
 
 
+#: A cache of the results of _class_may_have_attribute. The keys are
+#: weakly held classes and the values are dicts which map an attribute
+#: name to a boolean, so that dynamically created classes are not kept
+#: alive by the cache.
+_class_attr_cache = WeakKeyDictionary()
+
+
+def _class_may_have_attribute(cls, name):
+    """ Returns whether instances of the given HasTraits class may 
+    provide the given attribute by virtue of their class. The results
+    are cached on the class and the name.
+
+    """
+    try:
+        names = _class_attr_cache[cls]
+    except KeyError:
+        names = _class_attr_cache[cls] = {}
+    res = names.get(name)
+    if res is None:
+        # Prefix traits other than the default can provide arbitrary
+        # attributes, in which case the check must be conservative.
+        prefixes = getattr(cls, '__prefix_traits__', {}).get('*', ())
+        res = names[name] = (
+            name in cls.__class_traits__ or hasattr(cls, name) or 
+            hasattr(cls, '__getattr__') or len(prefixes) > 1
+        )
+    return res
+
+
+def _may_have_attribute(obj, name):
+    """ Returns whether a getattr for the given name on the given 
+    object may succeed. This is a cheap conservative check which does
+    not raise exceptions. It returns False only if the attribute is 
+    certain not to exist, which allows the implicit attribute lookup
+    to skip the costly failing getattr for those objects.
+
+    """
+    if not isinstance(obj, HasTraits):
+        return True
+    if _class_may_have_attribute(type(obj), name):
+        return True
+    return name in obj._instance_traits() or name in obj.__dict__
+
+
+#: A cache of the dicts generated by _resolution_plan.
+_plan_cache = {}
+
+
+def _resolution_plan(plan):
+    """ Converts a resolution plan tuple generated by the compiler 
+    into a dict which maps a name to a (kind, depth) tuple. The results
+    are cached since a plan is shared by all expressions created from 
+    the same declaration.
+
+    """
+    res = _plan_cache.get(plan)
+    if res is None:
+        res = _plan_cache[plan] = dict(
+            (name, (kind, depth)) for name, kind, depth in plan
+        )
+    return res
+
+
 #------------------------------------------------------------------------------
 # Execution Scope
 #------------------------------------------------------------------------------
@@ -57,7 +124,8 @@ class ExecutionScope(object):
     order to avoid issues with reference cycles.
 
     """
-    def __init__(self, obj, identifiers, f_globals, toolkit, overrides, cb):
+    def __init__(self, obj, identifiers, f_globals, toolkit, overrides, cb,
+                 plan=None):
         """ Initialize an execution scope.
 
         Parameters
@@ -85,6 +153,12 @@ class ExecutionScope(object):
             found and accessed on the object. The arguments passed are 
             the object and the attribute name.
 
+        plan : dict or None, optional
+            A dict which maps a name to the (kind, depth) tuple of the
+            compiler generated resolution plan for the expression. The
+            names in the plan are resolved directly, all other names
+            are resolved dynamically.
+
         """
         self._obj = obj
         self._identifiers = identifiers
@@ -92,6 +166,7 @@ class ExecutionScope(object):
         self._toolkit = toolkit
         self._overrides = overrides
         self._attr_cb = cb
+        self._plan = plan or {}
         self._assignments = {}
 
     def __getitem__(self, name):
@@ -143,8 +218,52 @@ class ExecutionScope(object):
             return dct[name]
 
         # After identifiers, the implicit attributes of the component
-        # hierarchy have precedence.
+        # hierarchy have precedence. If the compiler has classified the
+        # name, the walk skips the components which cannot provide the
+        # attribute instead of performing a failing getattr on them.
+        entry = self._plan.get(name)
+        if entry is None:
+            return self._dynamic_lookup(name)
+
+        kind, depth = entry
         parent = self._obj
+        if kind == 'attribute':
+            # Walk directly to the declaring component. The components
+            # in between may still shadow the attribute.
+            while parent is not None and depth > 0:
+                if _may_have_attribute(parent, name):
+                    break
+                parent = parent.parent
+                depth -= 1
+            return self._dynamic_lookup(name, parent)
+        
+        # An identifier which was not found in the identifiers dict has
+        # not yet been assigned, so it must be resolved dynamically.
+        if kind == 'identifier':
+            return self._dynamic_lookup(name)
+
+        # A global may be shadowed by an attribute on any component.
+        while parent is not None:
+            if _may_have_attribute(parent, name):
+                return self._dynamic_lookup(name, parent)
+            parent = parent.parent
+
+        # Global variables come after implicit attributes
+        dct = self._f_globals
+        if name in dct:
+            return dct[name]
+        
+        # End with the toolkit which will raise KeyError on failure.
+        # Builtins will be checked by Python using the global dict.
+        return self._toolkit[name]
+
+    def _dynamic_lookup(self, name, start=None):
+        """ Lookup an item from the implicit attributes, f_globals and
+        toolkit by walking the component hierarchy. The walk begins at 
+        the given start object, or at the scope object if not given.
+
+        """
+        parent = self._obj if start is None else start
         while parent is not None:
             try:
                 res = getattr(parent, name)
@@ -367,7 +486,8 @@ class AbstractExpression(object):
     #: computed value of the expression.
     expression_changed = Signal()
 
-    def __init__(self, obj, name, code, identifiers, f_globals, toolkit):
+    def __init__(self, obj, name, code, identifiers, f_globals, toolkit,
+                 plan=()):
         """ Initializes and expression object.
 
         Parameters
@@ -393,6 +513,10 @@ class AbstractExpression(object):
             The toolkit that was used to create the object and in which
             the expression should execute.
 
+        plan : tuple, optional
+            The name resolution plan generated by the compiler for the
+            expression. It is a tuple of (name, kind, depth) tuples.
+
         """
         self.obj_ref = ref(obj)
         self.name = name
@@ -400,6 +524,7 @@ class AbstractExpression(object):
         self.identifiers = identifiers
         self.f_globals = f_globals
         self.toolkit = toolkit
+        self.plan = _resolution_plan(plan)
 
     @abstractmethod
     def eval(self):
@@ -455,7 +580,7 @@ class SimpleExpression(AbstractExpression):
         f_globals = self.f_globals
         toolkit = self.toolkit
         scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
+            obj, identifiers, f_globals, toolkit, overrides, None, self.plan,
         )
 
         with toolkit:
@@ -510,7 +635,7 @@ class NotificationExpression(AbstractExpression):
             'nonlocals': NonlocalScope(obj, None),
         }
         scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, override, None,
+            obj, identifiers, f_globals, toolkit, override, None, self.plan,
         )
 
         with toolkit:
@@ -595,7 +720,7 @@ class UpdateExpression(AbstractExpression):
             '_[name]': self.name, 'nonlocals': NonlocalScope(obj, None),
         }
         scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
+            obj, identifiers, f_globals, toolkit, overrides, None, self.plan,
         )
 
         # Run through the inverters, giving each a chance to do the
@@ -612,10 +737,97 @@ class UpdateExpression(AbstractExpression):
                 raise RuntimeError(msg % (self.name, obj))
 
 
+#------------------------------------------------------------------------------
+# Batched Updates
+#------------------------------------------------------------------------------
+#: The nesting depth of the active 'batched_updates' contexts and of
+#: the running 'flush_updates' call.
+_batch_depth = 0
+
+#: Whether or not expression updates are batched per trip through the
+#: event loop. This is set with 'set_scheduled_updates'.
+_scheduled_updates = False
+
+#: Whether or not a call to 'flush_updates' is scheduled.
+_flush_pending = False
+
+#: The subscription expressions awaiting re-evaluation, keyed on their
+#: id and kept in the order in which they were marked dirty.
+_dirty_expressions = OrderedDict()
+
+
+@contextmanager
+def batched_updates():
+    """ A context manager which defers the re-evaluation of subscription
+    expressions until the outermost context exits. An expression whose 
+    dependencies change any number of times within the context is then
+    re-evaluated once.
+
+    The expressions are re-evaluated even if the body of the context
+    raises an exception, so that they do not remain stale. The errors
+    raised by the expressions are logged by the flush, so the original
+    exception propagates unchanged.
+
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            flush_updates()
+
+
+def set_scheduled_updates(enabled):
+    """ Set whether or not expression updates are batched per trip 
+    through the event loop. 
+    
+    When enabled, a subscription expression whose dependencies change
+    is marked dirty, and the dirty expressions are re-evaluated once 
+    by a single task scheduled with the toolkit application. This is
+    disabled by default, and the expressions are re-evaluated as soon
+    as a dependency changes.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether or not to schedule the expression updates.
+
+    """
+    global _scheduled_updates
+    _scheduled_updates = bool(enabled)
+
+
+def flush_updates():
+    """ Re-evaluate each dirty subscription expression once. Expressions
+    which are marked dirty by the re-evaluation of other expressions are
+    re-evaluated by the same flush. An exception raised by the update
+    of an expression is logged, and the flush continues with the other
+    expressions.
+
+    """
+    global _batch_depth, _flush_pending
+    _flush_pending = False
+    dirty = _dirty_expressions
+    _batch_depth += 1
+    try:
+        while dirty:
+            expr = dirty.popitem(last=False)[1]
+            try:
+                expr._update()
+            except Exception:
+                logger.exception(
+                    'Error updating the expression for %r', expr.name,
+                )
+    finally:
+        _batch_depth -= 1
+
+
 #------------------------------------------------------------------------------
 # Subscription Expression
 #------------------------------------------------------------------------------
-class _ImplicitAttributeBinder(object):
+class _ImplicitAttributeBinder(TraitHandlerMixin):
     """ A thin class which supports attaching a notifier to an implicit
     attribute lookup.
 
@@ -623,7 +835,8 @@ class _ImplicitAttributeBinder(object):
     # This doesn't need to be provided as a monitor because implicit 
     # attribute lookups, when successful, will always be on an instance
     # of BaseComponent and should never need to be hooked by an Enaml 
-    # extension.
+    # extension. It shares the differential rebinding of the trait
+    # monitors, so a binder lives as long as its expression.
     def __init__(self, parent):
         """ Initialize an _ImplicitAttributeBinder
 
@@ -634,6 +847,7 @@ class _ImplicitAttributeBinder(object):
             reference to the parent is stored.
 
         """
+        super(_ImplicitAttributeBinder, self).__init__()
         self.parent_ref = ref(parent)
     
     def __call__(self, obj, name):
@@ -649,14 +863,12 @@ class _ImplicitAttributeBinder(object):
             The attribute name of interest
              
         """
-        trait = obj.trait(name)
-        if trait is not None and trait is not Disallow:
-            obj.on_trait_change(self.notify, name)
+        self.do_binding(obj, name)
     
-    def notify(self):
-        """ The trait change handler callback. It calls the monitor
-        changed method on the parent when the trait changes, provided 
-        the parent has not already been garbage collected.
+    def expression_changed(self):
+        """ The callback invoked by the notification handlers when a 
+        trait changes. It calls the monitor changed method on the parent
+        provided the parent has not already been garbage collected.
         
         """
         parent = self.parent_ref()
@@ -664,6 +876,89 @@ class _ImplicitAttributeBinder(object):
             parent._on_monitor_changed()
 
 
+#: A cache of monitored code objects. The keys are weak references to
+#: the original code objects and the values are dicts which map a tuple
+#: of monitor classes to the code object generated for those monitors.
+_monitored_code_cache = WeakKeyDictionary()
+
+
+def _binder_name(idx):
+    """ Returns the scope name of the binder for the monitor at the 
+    given index. The name is not a valid Python identifier and so will
+    not clash with any names used in the expression.
+
+    """
+    return '_[monitor%d]' % idx
+
+
+def _get_monitored_code(code, monitors, binders):
+    """ Returns the code object for the given code instrumented with
+    the insertion code of the given monitors. The results are cached
+    on the code object and the monitor classes, so that the bytecode 
+    rewrite is only performed once for all expressions which are 
+    created from the same code. 
+
+    Monitors without a binder generate code which references their 
+    instance. Their insertion code is requested with the code list
+    only, and the result is not cached.
+
+    Parameters
+    ----------
+    code : types.CodeType object
+        The compiled code object for the Python expression.
+
+    monitors : sequence of AbstractMonitor instances
+        The monitors which will generate the insertion code. The 
+        monitor at a given index is expected to be bound under the
+        name returned by '_binder_name' for that index.
+
+    binders : sequence
+        The binders returned by 'get_binder' for the monitors.
+
+    Returns
+    -------
+    result : types.CodeType object
+        The instrumented code object for the expression.
+
+    """
+    shared = None not in binders
+    if shared:
+        key = tuple(type(monitor) for monitor in monitors)
+        cache = _monitored_code_cache.get(code)
+        if cache is None:
+            cache = _monitored_code_cache[code] = {}
+        elif key in cache:
+            return cache[key]
+
+    # Collect the generated code from the monitors that will be
+    # inserted into the code for the expression.
+    bp_code = Code.from_code(code)
+    code_list = list(bp_code.code)
+    insertions = defaultdict(list)
+    for idx, (monitor, binder) in enumerate(zip(monitors, binders)):
+        if binder is None:
+            ins_code = monitor.get_insertion_code(code_list)
+        else:
+            binder_name = _binder_name(idx)
+            ins_code = monitor.get_insertion_code(code_list, binder_name)
+        for code_idx, code_ops in ins_code:
+            insertions[code_idx].extend(code_ops)
+    
+    # Create a new code list which interleaves the code generated
+    # by the monitors at the appropriate location in the expression.
+    new_code = []
+    for idx, code_op in enumerate(code_list):
+        if idx in insertions:
+            new_code.extend(insertions[idx])
+        new_code.append(code_op)
+    
+    bp_code.code = new_code
+    eval_code = bp_code.to_code()
+    if shared:
+        cache[key] = eval_code
+    return eval_code
+
+
 class SubscriptionExpression(AbstractExpression):
     """ A concrete implementation of AbstractExpression. An instance 
     of SubcriptionExpression emits the expression_changed signal when
@@ -699,33 +994,57 @@ class SubscriptionExpression(AbstractExpression):
             monitor.expression_changed.connect(handler)
             monitors.append(monitor)
 
-        # Collect the generated code from the monitors that will be
-        # inserted into the code for the expression.
-        bp_code = Code.from_code(self.code)
-        code_list = list(bp_code.code)
-        insertions = defaultdict(list)
-        for monitor in monitors:
-            for idx, code in monitor.get_insertion_code(code_list):
-                insertions[idx].extend(code)
-        
-        # Create a new code list which interleaves the code generated
-        # by the monitors at the appropriate location in the expression.
-        new_code = []
-        for idx, code_op in enumerate(code_list):
-            if idx in insertions:
-                new_code.extend(insertions[idx])
-            new_code.append(code_op)
-        
-        bp_code.code = new_code
-        self.eval_code = bp_code.to_code()
+        # The monitored code is shared by all expressions created from
+        # the same code object and monitor classes. The monitors are 
+        # bound to the generated code at evaluation time by placing 
+        # their binders in the scope under the generated binder names.
+        binders = [monitor.get_binder() for monitor in monitors]
+        self.eval_code = _get_monitored_code(self.code, monitors, binders)
+        self.binders = dict(
+            (_binder_name(idx), binder)
+            for idx, binder in enumerate(binders) if binder is not None
+        )
         self.monitors = tuple(monitors)
         self.implicit_binder = _ImplicitAttributeBinder(self)
         self.old_value = NotImplemented
 
     def _on_monitor_changed(self):
         """ The signal callback which is fired from a monitor when the
-        expression changes. It will fire the expression_changed signal
-        provided that the value of the expression has actually changed.
+        expression changes. It will update the expression immediately,
+        or mark it dirty if the expression updates are being batched.
+
+        """
+        if (_batch_depth or _scheduled_updates) and self._mark_dirty():
+            return
+        self._update()
+
+    def _mark_dirty(self):
+        """ Marks the expression dirty so that it is re-evaluated by the
+        next flush of the batched updates. Outside of a batch, the flush
+        is scheduled with the toolkit application.
+
+        Returns
+        -------
+        result : bool
+            True if the expression was marked dirty, or False if the 
+            update could not be deferred because there is no toolkit
+            application with which to schedule the flush.
+
+        """
+        global _flush_pending
+        if not (_batch_depth or _flush_pending):
+            app = getattr(self.toolkit, 'app', None)
+            if app is None:
+                return False
+            _flush_pending = True
+            app.schedule(flush_updates)
+        _dirty_expressions[id(self)] = self
+        return True
+
+    def _update(self):
+        """ Re-evaluates the expression and fires the expression_changed
+        signal provided that the value of the expression has actually 
+        changed.
 
         """
         new_value = self.eval()
@@ -743,30 +1062,42 @@ class SubscriptionExpression(AbstractExpression):
 
     def eval(self):
         """ Evaluates the expression and returns the result. It also
-        resets the monitors before evaluating the expression to help
-        ensures that duplicate notifications are avoided.
+        rebinds the monitors around the evaluation to help ensure that
+        duplicate notifications are avoided.
 
         """
-        # Reset the monitors before every evaluation so that any old 
-        # notifiers are disconnected. This avoids muti-notifications.
-        self.implicit_binder = binder = _ImplicitAttributeBinder(self)
-        for monitor in self.monitors:
-            monitor.reset()
-
-        obj = self.obj_ref()
-        if obj is None:
-            return NotImplemented
-        
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        overrides = {'nonlocals': NonlocalScope(obj, binder)}
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, binder,
-        )
+        # Start a binding pass on the monitors before every evaluation.
+        # The notifiers of the dependencies which are accessed again
+        # are kept, and the others are disconnected at the end of the 
+        # pass. This avoids multi-notifications without reconnecting 
+        # every notifier on every evaluation.
+        binder = self.implicit_binder
+        monitors = self.monitors
+        binder.begin_binding()
+        for monitor in monitors:
+            monitor.begin_binding()
 
-        with toolkit:
-            res = eval(self.eval_code, f_globals, scope)
+        try:
+            obj = self.obj_ref()
+            if obj is None:
+                return NotImplemented
+            
+            identifiers = self.identifiers
+            f_globals = self.f_globals
+            toolkit = self.toolkit
+            overrides = {'nonlocals': NonlocalScope(obj, binder)}
+            overrides.update(self.binders)
+            scope = ExecutionScope(
+                obj, identifiers, f_globals, toolkit, overrides, binder, 
+                self.plan,
+            )
+
+            with toolkit:
+                res = eval(self.eval_code, f_globals, scope)
+        finally:
+            binder.end_binding()
+            for monitor in monitors:
+                monitor.end_binding()
 
         return res
 
@@ -863,7 +1194,7 @@ class DelegationExpression(SubscriptionExpression):
             '_[name]': self.name, 'nonlocals': NonlocalScope(obj, None),
         }
         scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
+            obj, identifiers, f_globals, toolkit, overrides, None, self.plan,
         )
 
         # Run through the inverters, giving each a chance to do the
@@ -4,6 +4,7 @@
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict, namedtuple
+import hashlib
 import imp
 import marshal
 import os
@@ -32,6 +33,11 @@ except AttributeError:
 CACHEDIR = '__enamlcache__'
 
 
+# The environment variable which, when set, names a central directory 
+# in which compiled files are cached by the content hash of the source.
+CACHEDIR_ENV = 'ENAML_CACHE_DIR'
+
+
 #------------------------------------------------------------------------------
 # Import Helpers
 #------------------------------------------------------------------------------
@@ -60,6 +66,148 @@ def make_file_info(src_path):
     return EnamlFileInfo(src_path, cache_path, cache_dir)
 
 
+def make_hashed_file_info(src_path, src, cache_dir):
+    """ Create an EnamlFileInfo object for the given src_path where the
+    cached file lives in the given central cache directory and is named
+    by the hash of the source content.
+
+    Parameters
+    ----------
+    src_path : string
+        The full path to the .enaml file.
+    
+    src : string
+        The source content of the .enaml file.
+
+    cache_dir : string
+        The central directory in which to cache the compiled file.
+    
+    Returns
+    -------
+    result : FileInfo
+        A properly populated EnamlFileInfo object.
+    
+    """
+    digest = hashlib.sha1(src).hexdigest()
+    fn = ''.join((digest, '.', MAGIC_TAG, os.path.extsep, 'enamlc'))
+    cache_path = os.path.join(cache_dir, fn)
+    return EnamlFileInfo(src_path, cache_path, cache_dir)
+
+
+def read_magic_info(file_info):
+    """ Loads and returns the magic info for the given file info.
+
+    Parameters
+    ----------
+    file_info : EnamlFileInfo
+        The file info object for the file.
+    
+    Returns
+    -------
+    result : (magic, timestamp)
+        The magic string and integer timestamp for the file.
+
+    """
+    with open(file_info.cache_path, 'rb') as cache_file:
+        magic = cache_file.read(4)
+        timestamp = struct.unpack('i', cache_file.read(4))[0]
+    return (magic, timestamp)
+
+
+def load_cache(file_info):
+    """ Loads and returns the code object for the given file info.
+
+    Parameters
+    ----------
+    file_info : EnamlFileInfo
+        The file info object for the file.
+    
+    Returns
+    -------
+    result : types.CodeType
+        The code object for the file.
+
+    """
+    with open(file_info.cache_path, 'rb') as cache_file:
+        cache_file.read(8)
+        code = marshal.load(cache_file)
+    return code
+
+
+def write_cache(code, ts, file_info):
+    """ Write the cached file for then given info, creating the cache 
+    directory if needed. The file is written to a temporary file and
+    then renamed, so that concurrent writers sharing a cache directory
+    never observe a partial file. This call will suppress any IOError 
+    or OSError exceptions.
+    
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object to write to the cache.
+    
+    ts : int
+        The integer timestamp for the file.
+    
+    file_info : EnamlFileInfo
+        The file info object for the file.
+    
+    """
+    cache_path = file_info.cache_path
+    tmp_path = '%s.%s.tmp' % (cache_path, os.getpid())
+    try:
+        if not os.path.exists(file_info.cache_dir):
+            os.makedirs(file_info.cache_dir)
+        with open(tmp_path, 'w+b') as cache_file:
+            cache_file.write(MAGIC)
+            cache_file.write(struct.pack('i', ts))
+            marshal.dump(code, cache_file)
+        if os.name == 'nt' and os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(tmp_path, cache_path)
+    except (OSError, IOError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def update_filename(code, filename):
+    """ Returns the given code object with the co_filename of it and 
+    all of its nested code objects set to the given filename. Files 
+    cached by content hash may have been compiled from another path, 
+    so this is needed for tracebacks to point at the right file.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object to update.
+    
+    filename : string
+        The filename to apply to the code.
+    
+    Returns
+    -------
+    result : types.CodeType
+        The updated code object, or the original code object if the 
+        filename is already correct.
+
+    """
+    if code.co_filename == filename:
+        return code
+    consts = tuple(
+        update_filename(const, filename) 
+        if isinstance(const, types.CodeType) else const
+        for const in code.co_consts
+    )
+    return types.CodeType(
+        code.co_argcount, code.co_nlocals, code.co_stacksize, code.co_flags,
+        code.co_code, consts, code.co_names, code.co_varnames, filename, 
+        code.co_name, code.co_firstlineno, code.co_lnotab, 
+        code.co_freevars, code.co_cellvars,
+    )
+
+
 #------------------------------------------------------------------------------
 # Abstract Enaml Importer
 #------------------------------------------------------------------------------
@@ -246,71 +394,6 @@ class EnamlImporter(AbstractEnamlImporter):
         """
         self.file_info = file_info
 
-    def _load_cache(self, file_info):
-        """ Loads and returns the code object for the given file info.
-
-        Parameters
-        ----------
-        file_info : EnamlFileInfo
-            The file info object for the file.
-        
-        Returns
-        -------
-        result : types.CodeType
-            The code object for the file.
-
-        """
-        with open(file_info.cache_path, 'rb') as cache_file:
-            cache_file.read(8)
-            code = marshal.load(cache_file)
-        return code
-
-    def _write_cache(self, code, ts, file_info):
-        """ Write the cached file for then given info, creating the 
-        cache directory if needed. This call will suppress any 
-        IOError or OSError exceptions.
-        
-        Parameters
-        ----------
-        code : types.CodeType
-            The code object to write to the cache.
-        
-        ts : int
-            The integer timestamp for the file.
-        
-        file_info : EnamlFileInfo
-            The file info object for the file.
-        
-        """
-        try:
-            if not os.path.exists(file_info.cache_dir):
-                os.mkdir(file_info.cache_dir)
-            with open(file_info.cache_path, 'w+b') as cache_file:
-                cache_file.write(MAGIC)
-                cache_file.write(struct.pack('i', ts))
-                marshal.dump(code, cache_file)
-        except (OSError, IOError):
-            pass
-
-    def _get_magic_info(self, file_info):
-        """ Loads and returns the magic info for the given path.
-
-        Parameters
-        ----------
-        file_info : EnamlFileInfo
-            The file info object for the file.
-        
-        Returns
-        -------
-        result : (magic, timestamp)
-            The magic string and integer timestamp for the file.
-
-        """
-        with open(file_info.cache_path, 'rb') as cache_file:
-            magic = cache_file.read(4)
-            timestamp = struct.unpack('i', cache_file.read(4))[0]
-        return (magic, timestamp)
-
     def get_code(self):
         """ Loads and returns the code object for the Enaml module and
         the full path to the module for use as the __file__ attribute 
@@ -330,15 +413,22 @@ class EnamlImporter(AbstractEnamlImporter):
         # informative than an ImportError.
         file_info = self.file_info
         if not os.path.exists(file_info.src_path):
-            code = self._load_cache(file_info)
+            code = load_cache(file_info)
             return (code, file_info.src_path)
 
+        # If a central cache directory is configured, the compiled 
+        # file is looked up by the hash of the source content instead 
+        # of the source modification time.
+        central_dir = os.environ.get(CACHEDIR_ENV)
+        if central_dir:
+            return self._get_hashed_code(central_dir)
+
         # Use the cached file if it exists and is current
         src_mod_time = int(os.path.getmtime(file_info.src_path))
         if os.path.exists(file_info.cache_path):
-            magic, ts = self._get_magic_info(file_info)
+            magic, ts = read_magic_info(file_info)
             if magic == MAGIC and src_mod_time <= ts:
-                code = self._load_cache(file_info)
+                code = load_cache(file_info)
                 return (code, file_info.src_path)
 
         # Otherwise, compile from source and attempt to cache
@@ -346,9 +436,40 @@ class EnamlImporter(AbstractEnamlImporter):
             src = src_file.read()
         ast = parse(src)
         code = EnamlCompiler.compile(ast, file_info.src_path)
-        self._write_cache(code, src_mod_time, file_info)
+        write_cache(code, src_mod_time, file_info)
         return (code, file_info.src_path)
 
+    def _get_hashed_code(self, cache_dir):
+        """ Loads and returns the code object for the Enaml module 
+        using the content hash keyed cache in the given directory.
+
+        Parameters
+        ----------
+        cache_dir : string
+            The central directory in which compiled files are cached.
+
+        Returns
+        -------
+        result : (code, path)
+            The Python code object for the .enaml module, and the full
+            path to the module as a string.
+
+        """
+        src_path = self.file_info.src_path
+        with open(src_path) as src_file:
+            src = src_file.read()
+        file_info = make_hashed_file_info(src_path, src, cache_dir)
+        if os.path.exists(file_info.cache_path):
+            magic, ts = read_magic_info(file_info)
+            if magic == MAGIC:
+                code = load_cache(file_info)
+                return (update_filename(code, src_path), src_path)
+
+        ast = parse(src)
+        code = EnamlCompiler.compile(ast, src_path)
+        write_cache(code, 0, file_info)
+        return (code, src_path)
+
 
 #------------------------------------------------------------------------------
 # Enaml Imports Context
@@ -0,0 +1,139 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+
+class IntervalSet(object):
+    """ An immutable set of integers which is stored as a sorted list
+    of disjoint intervals.
+
+    Membership is tested with a binary search over the intervals, and
+    the set operations merge the intervals without expanding them, so
+    a set of a million contiguous integers costs as much as one with
+    a single integer.
+
+    """
+    __slots__ = ('_starts', '_stops', '_count')
+
+    def __init__(self, ranges=()):
+        """ Initialize an IntervalSet.
+
+        Parameters
+        ----------
+        ranges : iterable of (first, last) tuples, optional
+            The inclusive ranges of integers in the set. They may be
+            given in any order and may overlap.
+
+        """
+        starts = []
+        stops = []
+        count = 0
+        for first, last in sorted((f, l) for f, l in ranges if f <= l):
+            stop = last + 1
+            if stops and first <= stops[-1]:
+                if stop > stops[-1]:
+                    count += stop - stops[-1]
+                    stops[-1] = stop
+            else:
+                starts.append(first)
+                stops.append(stop)
+                count += stop - first
+        self._starts = starts
+        self._stops = stops
+        self._count = count
+
+    @classmethod
+    def from_values(cls, values):
+        """ Create an IntervalSet from an iterable of integers.
+
+        """
+        ranges = []
+        for value in sorted(values):
+            if ranges and value <= ranges[-1][1] + 1:
+                if value > ranges[-1][1]:
+                    ranges[-1][1] = value
+            else:
+                ranges.append([value, value])
+        return cls(ranges)
+
+    def ranges(self):
+        """ Returns the list of inclusive (first, last) ranges of the
+        set in increasing order.
+
+        """
+        pairs = zip(self._starts, self._stops)
+        return [(start, stop - 1) for start, stop in pairs]
+
+    def union(self, other):
+        """ Returns the set of integers which are in this set or in the
+        other set.
+
+        """
+        return IntervalSet(chain(self.ranges(), other.ranges()))
+
+    def difference(self, other):
+        """ Returns the set of integers which are in this set but not
+        in the other set.
+
+        """
+        result = []
+        o_starts = other._starts
+        o_stops = other._stops
+        for start, stop in zip(self._starts, self._stops):
+            # Only the intervals of the other set which overlap this
+            # interval are visited.
+            idx = bisect_right(o_stops, start)
+            end = bisect_left(o_starts, stop)
+            for o_start, o_stop in zip(o_starts[idx:end], o_stops[idx:end]):
+                if o_start > start:
+                    result.append((start, o_start - 1))
+                start = max(start, o_stop)
+            if start < stop:
+                result.append((start, stop - 1))
+        return IntervalSet(result)
+
+    __or__ = union
+
+    __sub__ = difference
+
+    def __contains__(self, value):
+        """ Returns whether the integer is in the set.
+
+        """
+        idx = bisect_right(self._starts, value) - 1
+        return idx >= 0 and value < self._stops[idx]
+
+    def __iter__(self):
+        """ Iterates over the integers in the set in increasing order.
+
+        """
+        for start, stop in zip(self._starts, self._stops):
+            for value in xrange(start, stop):
+                yield value
+
+    def __len__(self):
+        return self._count
+
+    def __nonzero__(self):
+        return self._count > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        if res is NotImplemented:
+            return res
+        return not res
+
+    def __hash__(self):
+        return hash((tuple(self._starts), tuple(self._stops)))
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.ranges())
+
@@ -702,6 +702,48 @@ class AbstractItemModel(object):
         """
         raise NotImplementedError
 
+    #--------------------------------------------------------------------------
+    # Bulk Data Methods
+    #--------------------------------------------------------------------------
+    def data_block(self, rows, columns, role='data'):
+        """ Get the data for a block of top-level items in the model.
+
+        Views may use this method to fetch the data for many items at
+        once instead of calling the per-index method for each item. 
+        The default implementation calls the per-index method for each
+        item in the block. Models which can produce their data more 
+        efficiently in bulk, such as models backed by arrays, should
+        override this method. The result must be the same as calling
+        the per-index method with the index of each item.
+
+        Arguments
+        ---------
+        rows : sequence of ints
+            The rows of the top-level items in the block.
+
+        columns : sequence of ints
+            The columns of the top-level items in the block.
+
+        role : string, optional
+            The name of the per-index data method for which to return
+            the data, e.g. 'data', 'tool_tip', or 'background'. The 
+            default is 'data'.
+
+        Returns
+        -------
+        values : list of lists or 2D array
+            A len(rows) x len(columns) block of values such that 
+            values[i][j] is the value for the item at (rows[i], 
+            columns[j]).
+
+        """
+        getter = getattr(self, role)
+        index = self.index
+        res = []
+        for row in rows:
+            res.append([getter(index(row, column)) for column in columns])
+        return res
+
     #--------------------------------------------------------------------------
     # Auxiliary Data Methods
     #--------------------------------------------------------------------------
@@ -8,8 +8,8 @@ from weakref import ref
 from traits.api import HasTraits, Disallow
 
 from .byteplay import (
-    CALL_FUNCTION, ROT_THREE, LOAD_CONST, LOAD_ATTR, ROT_TWO, BUILD_TUPLE, 
-    UNPACK_SEQUENCE, POP_TOP, DUP_TOP,
+    CALL_FUNCTION, ROT_THREE, LOAD_CONST, LOAD_ATTR, LOAD_NAME, ROT_TWO,
+    BUILD_TUPLE, UNPACK_SEQUENCE, POP_TOP, DUP_TOP,
 )
 from .signaling import Signal
 
@@ -28,6 +28,21 @@ class AbstractMonitor(object):
     warranted, it should make the appropriate connections to emit the
     expression_changed signal when the expression has changed.
 
+    The generated code is shared by every expression which is created
+    from the same code object with the same monitor classes. It must 
+    therefore never reference a particular monitor instance. Instead,
+    the generated code should retrieve the binder callable for the
+    running monitor with a LOAD_NAME op-code using the binder name
+    supplied by the expression. The expression places the object
+    returned by 'get_binder' into the evaluation scope under that
+    name before every evaluation.
+
+    A monitor which does not provide a binder may instead reference
+    itself from its generated code, as monitors did before the code 
+    was shared. The 'get_insertion_code' method of such a monitor is
+    called with the code list only, and the code it generates is used
+    by its expression alone.
+
     """
     __metaclass__ = ABCMeta
 
@@ -35,7 +50,7 @@ class AbstractMonitor(object):
     expression_changed = Signal()
 
     @abstractmethod
-    def get_insertion_code(self, code_list):
+    def get_insertion_code(self, code_list, binder_name=None):
         """ Generates the byteplay code operations to be inserted into 
         the expression code object in order to monitor execution.
 
@@ -46,6 +61,13 @@ class AbstractMonitor(object):
             If no code need be generated, an empty list should be 
             returned.
 
+        binder_name : string, optional
+            The name under which the binder returned by 'get_binder'
+            will be available in the scope during evaluation. It is 
+            not a valid Python identifier and so will not clash with
+            the names used in the expression. It is only given if 
+            'get_binder' returns a binder.
+
         Returns
         -------
         result : list of (insertion_idx, code_ops)
@@ -63,6 +85,24 @@ class AbstractMonitor(object):
         """
         raise NotImplementedError
 
+    def get_binder(self):
+        """ Returns the callable which is placed into the evaluation 
+        scope under the binder name and invoked by the code generated 
+        by 'get_insertion_code'.
+
+        The default implementation returns None, which indicates that
+        the generated code references the monitor instance directly 
+        and so cannot be shared with other expressions.
+
+        Returns
+        -------
+        result : callable or None
+            The callable which binds the running monitor instance to
+            the shared generated code, or None.
+
+        """
+        return None
+
     @abstractmethod
     def reset(self):
         """ Unhook any previously connected notifiers. This method is 
@@ -71,6 +111,26 @@ class AbstractMonitor(object):
         """
         raise NotImplementedError
 
+    def begin_binding(self):
+        """ Called by the owner expression just before the expression is
+        evaluated. The notifiers hooked up during the evaluation are the
+        dependencies of the new value of the expression.
+
+        The default implementation calls 'reset' so that every notifier
+        is connected anew. Subclasses may instead keep the notifiers and
+        discard the stale ones in 'end_binding'.
+
+        """
+        self.reset()
+
+    def end_binding(self):
+        """ Called by the owner expression just after the expression is
+        evaluated, even if the evaluation raised an exception. The 
+        default implementation is a no-op.
+
+        """
+        pass
+
 
 #------------------------------------------------------------------------------
 # Abstract Attribute Monitor
@@ -81,20 +141,13 @@ class AbstractAttributeMonitor(AbstractMonitor):
     which is being accessed.
     
     """
-    def get_insertion_code(self, code_list):
+    def get_insertion_code(self, code_list, binder_name=None):
         """ Generates the byteplay code operations to be inserted into 
         the expression code object to monitor attribute accesses. When
         an attribute access occurs, the 'monitor_attribute' method will 
         be called with the object and attribute name as arguments.
 
         """
-        # A weak closure which is injected into the stack to call the
-        # monitor method upon attribute access.
-        def code_binder(obj, attr, selfref=ref(self)):
-            this = selfref()
-            if this is not None:
-                this.monitor_attribute(obj, attr)
-        
         # The list of code segments that will be inserted into the
         # new bytecode for the expression.
         insertion_code = []
@@ -102,15 +155,15 @@ class AbstractAttributeMonitor(AbstractMonitor):
         for idx, (op, op_arg) in enumerate(code_list):
             # This bit of code is injected between the object on TOS
             # and its pending attribute access. The TOS obj is duped,
-            # the rotated above the binder code. The attr is loaded,
-            # and the binder is called with the object and attr. The
-            # return value of the binder is discarded. This leaves the
-            # original TOS and pending attribute access to continue on
-            # as normal
+            # the rotated above the binder which is loaded from the 
+            # scope. The attr is loaded, and the binder is called with 
+            # the object and attr. The return value of the binder is 
+            # discarded. This leaves the original TOS and pending 
+            # attribute access to continue on as normal
             if op == LOAD_ATTR:
                 code = [
                     (DUP_TOP, None),
-                    (LOAD_CONST, code_binder),
+                    (LOAD_NAME, binder_name),
                     (ROT_TWO, None),
                     (LOAD_CONST, op_arg),
                     (CALL_FUNCTION, 0x0002),
@@ -120,6 +173,13 @@ class AbstractAttributeMonitor(AbstractMonitor):
 
         return insertion_code
 
+    def get_binder(self):
+        """ Returns the 'monitor_attribute' method as the binder which
+        is invoked by the generated code.
+
+        """
+        return self.monitor_attribute
+
     @abstractmethod
     def monitor_attribute(self, obj, attr):
         """ Hooks up any necessary monitors for the given object and 
@@ -147,28 +207,13 @@ class AbstractCallMonitor(AbstractMonitor):
     are being called.
     
     """
-    def get_insertion_code(self, code_list):
+    def get_insertion_code(self, code_list, binder_name=None):
         """ Generates the byteplay code operations to be inserted into 
         the expression code object to monitor function calls. When an
         attribute access occurs, the 'monitor_function' method will be 
         called with the object, args, and kwargs.
 
         """
-        # A weak closure which is injected into the stack to call the
-        # monitor method on function call.
-        def code_binder(func_obj, arg_tuple, arg_spec, selfref=ref(self)):
-            this = selfref()
-            if this is not None:
-                nargs = arg_spec & 0xFF
-                args = arg_tuple[:nargs]
-                kwargs = dict(zip(arg_tuple[nargs::2], arg_tuple[nargs+1::2]))
-                this.monitor_function(func_obj, args, kwargs)
-            # The UNPACK_SEQUENCE op_codes which will unpack these 
-            # return values will unpack things onto the stack in the
-            # reverse of how they are provided. So, we pre-reverse them
-            # so they come out in the right order.
-            return (tuple(reversed(arg_tuple)), func_obj)
-                
         # The list of code segments that will be inserted into the
         # new bytecode for the expression.
         insertion_code = []
@@ -176,10 +221,10 @@ class AbstractCallMonitor(AbstractMonitor):
         for idx, (op, op_arg) in enumerate(code_list):
             # This bit of code is injected just before a function call
             # is performed. The arguments on the stack are packed into
-            # tuple. The code binder is then pushed onto the stack and
+            # tuple. The binder is then loaded from the scope and 
             # rotated under the func_obj and arg_tuple. The arg spec
-            # is then loaded and the code binder is invoked. The return 
-            # value of the code binder is the original func_obj and 
+            # is then loaded and the binder is invoked. The return 
+            # value of the binder is the original func_obj and 
             # arg_tuple. This return tuple is unpacked, and then the 
             # arg_tuple is unpacked and the function call proceeds as 
             # normal.
@@ -194,7 +239,7 @@ class AbstractCallMonitor(AbstractMonitor):
                 n_stack_args = (op_arg & 0xFF) + 2 * ((op_arg >> 8) & 0xFF)
                 code = [
                     (BUILD_TUPLE, n_stack_args),
-                    (LOAD_CONST, code_binder),
+                    (LOAD_NAME, binder_name),
                     (ROT_THREE, None),
                     (LOAD_CONST, op_arg),
                     (CALL_FUNCTION, 0x0003),
@@ -206,6 +251,30 @@ class AbstractCallMonitor(AbstractMonitor):
             # TODO - CALL_FUNCTION_VAR, CALL_FUNCTION_KW, CALL_FUNCTION_VAR_KW
 
         return insertion_code
+
+    def get_binder(self):
+        """ Returns the '_call_binder' method as the binder which is
+        invoked by the generated code.
+
+        """
+        return self._call_binder
+
+    def _call_binder(self, func_obj, arg_tuple, arg_spec):
+        """ The binder invoked by the generated code just before a 
+        function call. It unpacks the call arguments, invokes the 
+        'monitor_function' method, and returns the values which the
+        generated code unpacks back onto the stack.
+
+        """
+        nargs = arg_spec & 0xFF
+        args = arg_tuple[:nargs]
+        kwargs = dict(zip(arg_tuple[nargs::2], arg_tuple[nargs+1::2]))
+        self.monitor_function(func_obj, args, kwargs)
+        # The UNPACK_SEQUENCE op_codes which will unpack these 
+        # return values will unpack things onto the stack in the
+        # reverse of how they are provided. So, we pre-reverse them
+        # so they come out in the right order.
+        return (tuple(reversed(arg_tuple)), func_obj)
     
     @abstractmethod
     def monitor_function(self, func_obj, args, kwargs):
@@ -252,8 +321,19 @@ class _TraitNotificationHandler(object):
 
         """
         self._parent_ref = ref(parent)
+        self.obj_ref = ref(obj)
+        self.attr = attr
         obj.on_trait_change(self.notify, attr)
 
+    def unbind(self):
+        """ Removes the trait notifier from the object, provided the 
+        object is still alive.
+
+        """
+        obj = self.obj_ref()
+        if obj is not None:
+            obj.on_trait_change(self.notify, self.attr, remove=True)
+
     def notify(self):
         """ The trait change callback which will emit the expression
         changed signal on the parent.
@@ -271,6 +351,13 @@ class TraitHandlerMixin(object):
     """ A mixin class which adds the common binding code for the trait
     monitor classes below.
 
+    The notifiers are rebound differentially. Between the calls to
+    'begin_binding' and 'end_binding', the object/attribute pairs which
+    were already bound by the previous evaluation reuse their existing
+    notifiers, and only the notifiers for the pairs which are no longer
+    accessed are removed. An expression whose dependencies are stable
+    therefore does not touch the trait notifiers when it is evaluated.
+
     """
     def __init__(self, *args, **kwargs):
         super(TraitHandlerMixin, self).__init__(*args, **kwargs)
@@ -280,13 +367,40 @@ class TraitHandlerMixin(object):
         # is used to avoid ref cycles and potential hashing issues.
         self._handlers = {}
 
+        # The dictionary of handlers bound during the current binding 
+        # pass, or None if a binding pass is not in progress.
+        self._bound = None
+
     def reset(self):
-        """ Clears the existing handlers which results in the notifiers
-        being destroyed.
+        """ Clears the existing handlers and removes their notifiers.
 
         """
+        for handler in self._handlers.itervalues():
+            handler.unbind()
         self._handlers.clear()
 
+    def begin_binding(self):
+        """ Starts a binding pass. The existing handlers are kept until
+        the end of the pass so that they may be reused.
+
+        """
+        self._bound = {}
+
+    def end_binding(self):
+        """ Ends a binding pass. The handlers which were not bound during
+        the pass are removed, and the handlers which were bound become
+        the current handlers.
+
+        """
+        bound = self._bound
+        if bound is None:
+            return
+        self._bound = None
+        for key, handler in self._handlers.iteritems():
+            if bound.get(key) is not handler:
+                handler.unbind()
+        self._handlers = bound
+
     def do_binding(self, obj, attr):
         """ Hooks up a notifier to the object attribute pair if the 
         object is a HasTraits instance and the attribute refers to 
@@ -295,10 +409,21 @@ class TraitHandlerMixin(object):
         """
         # Don't hook up multiple identifiers to the same object/attr
         # pair. Use the id of the object to prevent an accidental ref
-        # cycle to the object.
+        # cycle to the object. Outside of a binding pass, the handlers
+        # are added directly to the current handlers.
         handlers = self._handlers
+        bound = self._bound
+        if bound is None:
+            bound = handlers
         key = (id(obj), attr)
-        if key in handlers:
+        if key in bound:
+            return
+
+        # Reuse the handler from the previous pass, provided the id
+        # has not been recycled for a different object.
+        handler = handlers.get(key)
+        if handler is not None and handler.obj_ref() is obj:
+            bound[key] = handler
             return
         
         if isinstance(obj, HasTraits):
@@ -308,7 +433,7 @@ class TraitHandlerMixin(object):
             trait = obj.trait(attr)
             if trait is not None and trait.trait_type is not Disallow:
                 handler = _TraitNotificationHandler(self, obj, attr)
-                handlers[key] = handler
+                bound[key] = handler
 
 
 #------------------------------------------------------------------------------
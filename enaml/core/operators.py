@@ -47,6 +47,14 @@ from .monitors import TraitAttributeMonitor, TraitGetattrMonitor
 #:          The same rules about sharing and copying that apply to
 #:          the identifiers dict, apply here as well.
 #:
+#:      plan : tuple, optional
+#:          The name resolution plan generated by the compiler for the
+#:          expression. It is a tuple of (name, kind, depth) tuples.
+#:          See DeclarationCompiler.compile for the details. The plan
+#:          is only passed to operators which are decorated with the
+#:          'accepts_plan' decorator, so operators which only accept
+#:          the first 6 arguments continue to work.
+#:
 #: Operators may do whatever they please with the information provided
 #: to them. The default operators in Enaml use this information to 
 #: create and bind Enaml expression objects to the component. However,
@@ -54,35 +62,48 @@ from .monitors import TraitAttributeMonitor, TraitGetattrMonitor
 #: are free to get creative with the operators.
 
 
-def op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit):
+def accepts_plan(operator):
+    """ A decorator which marks an operator as accepting the name 
+    resolution plan as its 7th argument.
+
+    """
+    operator.__enaml_accepts_plan__ = True
+    return operator
+
+
+@accepts_plan
+def op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
     """ The default Enaml operator for '=' expressions. It binds an
     instance of SimpleExpression to the component.
 
     """
-    expr = SimpleExpression(cmpnt, attr, code, identifiers, f_globals, toolkit)
+    expr = SimpleExpression(cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
     cmpnt.bind_expression(attr, expr)
 
 
-def op_notify(cmpnt, attr, code, identifiers, f_globals, toolkit):
+@accepts_plan
+def op_notify(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
     """ The default Enaml operator for '::' expressions. It binds an
     instance of NotificationExpression to the component.
 
     """
-    expr = NotificationExpression(cmpnt, attr, code, identifiers, f_globals, toolkit)
+    expr = NotificationExpression(cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
     cmpnt.bind_expression(attr, expr, notify_only=True)
 
 
-def op_update(cmpnt, attr, code, identifiers, f_globals, toolkit):
+@accepts_plan
+def op_update(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
     """ The default Enaml operator for '>>' expressions. It binds an
     instance of UpdateExpression to the component.
 
     """
     inverters = [GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter]
-    expr = UpdateExpression(inverters, cmpnt, attr, code, identifiers, f_globals, toolkit)
+    expr = UpdateExpression(inverters, cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
     cmpnt.bind_expression(attr, expr, notify_only=True)
 
 
-def op_subscribe(cmpnt, attr, code, identifiers, f_globals, toolkit):
+@accepts_plan
+def op_subscribe(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
     """ The default Enaml operator for '<<' expressions. It binds an
     instance of SubscriptionExpression to the component using monitors
     which understand traits attribute access via dotted notation and
@@ -90,11 +111,12 @@ def op_subscribe(cmpnt, attr, code, identifiers, f_globals, toolkit):
 
     """
     monitors = [TraitAttributeMonitor, TraitGetattrMonitor]
-    expr = SubscriptionExpression(monitors, cmpnt, attr, code, identifiers, f_globals, toolkit)
+    expr = SubscriptionExpression(monitors, cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
     cmpnt.bind_expression(attr, expr)
 
 
-def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit):
+@accepts_plan
+def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
     """ The default Enaml operator for ':=' expressions. It binds an
     instance of DelegationExpression to the component using monitors
     which understand traits attribute access via dotted notation and
@@ -105,7 +127,7 @@ def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit):
     """
     inverters = [GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter]
     monitors = [TraitAttributeMonitor, TraitGetattrMonitor]
-    expr = DelegationExpression(inverters, monitors, cmpnt, attr, code, identifiers, f_globals, toolkit)
+    expr = DelegationExpression(inverters, monitors, cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
     cmpnt.bind_expression(attr, expr)
 
 
@@ -2,6 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from itertools import count
 from types import MethodType
 from weakref import ref, WeakKeyDictionary
 
@@ -86,6 +87,20 @@ class Signal(object):
         self._instances.pop(obj, None)
 
 
+def _make_remover(signal, key):
+    """ Returns a weak reference callback which removes the connection
+    with the given key from the signal when the connected object dies.
+    Only a weak reference to the signal is kept.
+
+    """
+    signal_ref = ref(signal)
+    def remove(wr):
+        signal = signal_ref()
+        if signal is not None:
+            signal._connection_dead(key, wr)
+    return remove
+
+
 class _Signal(object):
     """ A signal implementation object. Instance of this class are
     created as needed by the Signal descriptor. A single instance 
@@ -93,15 +108,31 @@ class _Signal(object):
     the Signal descriptor. This class manages the actual connected
     handlers for the object.
 
+    The connections are stored in a dict keyed on the identity of the
+    connected callback, so that connecting and disconnecting does not
+    scan the connections. An immutable snapshot of the connections, in
+    the order in which they were made, is rebuilt whenever a connection 
+    is made, broken, or dies. Emitting the signal only iterates over 
+    the snapshot.
+
     """
-    __slots__ = ('_connections', '__weakref__')
+    __slots__ = ('_connections', '_snapshot', '_counter', '__weakref__')
     
     def __init__(self):
-        self._connections = []
+        # A dict mapping the key of a connection to an (order, weakref,
+        # func) tuple. The order is the sequence number of the connect
+        # call. For a bound method, the weakref refers to the bound 
+        # object and func is the underlying function. Otherwise, the
+        # weakref refers to the callback and func is None.
+        self._connections = {}
+        # The tuple of (weakref, func) pairs for the connections.
+        self._snapshot = ()
+        self._counter = count()
     
-    def _make_connection(self, callback):
-        """ A private method which creates an appropriate connection 
-        object for the given callback.
+    @staticmethod
+    def _connection_key(callback):
+        """ A private method which computes the connection key and the 
+        connection target for the given callback.
 
         Parameters
         ----------
@@ -111,37 +142,60 @@ class _Signal(object):
         
         Returns
         -------
-        result : _MethodConnection or _DirectConnection
-            If the callable is a bound method, a _MethodConnection is
-            created. For all other cases, a _DirectConnection is used.
+        result : (key, target, func)
+            If the callable is a bound method, the key is the tuple of
+            the id of the bound object and the underlying function, the
+            target is the bound object, and func is the function. For
+            all other cases, the key is the tuple of the id of the 
+            callable and None, the target is the callable, and func is
+            None.
 
         """
         if isinstance(callback, MethodType):
-            connection = _MethodConnection(self, callback)
-        else:
-            connection = _DirectConnection(self, callback)
-        return connection
+            im_self = callback.im_self
+            if im_self is not None:
+                im_func = callback.im_func
+                return ((id(im_self), im_func), im_self, im_func)
+        return ((id(callback), None), callback, None)
+
+    def _rebuild(self):
+        """ A private method which rebuilds the snapshot of connections.
+
+        """
+        items = sorted(self._connections.itervalues())
+        self._snapshot = tuple((wr, func) for order, wr, func in items)
 
-    def _connection_dead(self, conn):
-        """ A private method which removes the connection object from
-        the internal list of connections when the connection has died.
+    def _connection_dead(self, key, wr):
+        """ A private method which removes a connection when the object
+        to which it refers has died.
 
         Parameters
         ----------
-        conn : _BaseConnection
-            The dead _BaseConnection instance to remove.
+        key : tuple
+            The key of the connection to remove.
+
+        wr : weakref
+            The dead weak reference of the connection. The connection 
+            is only removed if it still holds this weak reference.
 
         """
         connections = self._connections
-        if conn in connections:
-            connections.remove(conn)
+        item = connections.get(key)
+        if item is not None and item[1] is wr:
+            del connections[key]
+            self._rebuild()
 
     def __call__(self, *args, **kwargs):
         """ Emits the signal with the given arguments and keywords.
 
         """
-        for conn in self._connections:
-            conn(args, kwargs)
+        for wr, func in self._snapshot:
+            target = wr()
+            if target is not None:
+                if func is None:
+                    target(*args, **kwargs)
+                else:
+                    func(target, *args, **kwargs)
 
     def connect(self, callback):
         """ Connects the given callback to the signal. The callback
@@ -160,10 +214,12 @@ class _Signal(object):
         """
         if not callable(callback):
             raise TypeError('Cannot connect a non-callable to a Signal')
-        conn = self._make_connection(callback)
+        key, target, func = self._connection_key(callback)
         connections = self._connections
-        if conn not in connections:
-            connections.append(conn)
+        if key not in connections:
+            wr = ref(target, _make_remover(self, key))
+            connections[key] = (self._counter.next(), wr, func)
+            self._rebuild()
     
     def disconnect(self, callback):
         """ Disconnects the given callback from the signal. If the 
@@ -179,169 +235,7 @@ class _Signal(object):
         """
         if not callable(callback):
             raise TypeError('Cannot disconnect a non-callable from a Signal')
-        conn = self._make_connection(callback)
-        self._connection_dead(conn)
-
-
-class _BaseConnection(object):
-    """ The base connection class which provides some basic lifetime
-    management for the connection and stubs out the api which must
-    be implemented by subclasses.
-
-    """
-    __slots__ = ('_parent_ref', '_remove', '__weakref__')
-
-    def __init__(self, parent):
-        """ Initialize a _BaseConnection
-
-        Parameters
-        ----------
-        parent : _Signal
-            The _Signal instance which owns this connection. Only a
-            weak reference is maintained to the _Signal.
-
-        """
-        def remove(item, selfref=ref(self)):
-            this = selfref()
-            if this is not None:
-                parent = self._parent_ref()
-                if parent is not None:
-                    parent._connection_dead(this)
-        self._parent_ref = ref(parent)
-        self._remove = remove
-    
-    def __call__(self, args, kwargs):
-        """ Invokes the underlying callable with the given arguments
-        and keywords.
-
-        """
-        raise NotImplementedError
-    
-    def __hash__(self):
-        """ Computes the hash of the underlying callable. Two different
-        connection instances with the same underlying callable should
-        hash the same.
-
-        """
-        raise NotImplementedError
-    
-    def __eq__(self, other):
-        """ Performs equality comparison. Two different connection
-        instances with the same underlying callable should compare
-        equally.
-
-        """
-        raise NotImplementedError
-
-
-class _DirectConnection(_BaseConnection):
-    """ A _BaseConnection subclass which makes a direct connection
-    to the underlying callable.
-
-    """
-    __slots__ = ('_callback_ref',)
-
-    def __init__(self, parent, callback):
-        """ Initialize a _DirectConnection
-
-        Parameters
-        ----------
-        parent : _Signal
-            The _Signal instance which owns this connection. Only a
-            weak reference is maintained to the _Signal.
-
-        callback : callable
-            The callable to which the connection should be made. 
-            Only a direct weak reference to the callable is kept.
-
-        """
-        super(_DirectConnection, self).__init__(parent)
-        self._callback_ref = ref(callback, self._remove)
-
-    def __call__(self, args, kwargs):
-        """ Invokes the underlying callable with the given arguments
-        and keywords.
-
-        """
-        callback = self._callback_ref()
-        if callback is not None:
-            callback(*args, **kwargs)
-
-    def __hash__(self):
-        """ Computes and returns the hash of the weak reference to the
-        underlying callable.
-
-        """
-        return hash(self._callback_ref)
-    
-    def __eq__(self, other):
-        """ Performs equality comparison. If comparing against another
-        instance of _DirectionConnection, the comparison is made between
-        the weak references to the underlying callables. Otherwise, this
-        method will return False.
-
-        """
-        if isinstance(other, _DirectConnection):
-            return self._callback_ref == other._callback_ref
-        return False
-    
-
-class _MethodConnection(_BaseConnection):
-    """ A _BaseConnection subclass which makes a connection to the
-    constituents of a bound method
-
-    """
-    __slots__ = ('_im_func', '_im_self_ref', '_im_class',)
-
-    def __init__(self, parent, method):
-        """ Initialize a _MethodConnection
-
-        Parameters
-        ----------
-        parent : _Signal
-            The _Signal instance which owns this connection. Only a
-            weak reference is maintained to the _Signal.
-
-        method : types.MethodType
-            The bound method instance to which the connection should
-            be made. The method is deconstructed into its constituents
-            and the lifetime of connection is tied to the lifetime
-            of the bound object. Only a weak reference to that object
-            is kept.
-
-        """
-        super(_MethodConnection, self).__init__(parent)
-        self._im_func = method.im_func
-        self._im_self_ref = ref(method.im_self, self._remove)
-        self._im_class = method.im_class
-
-    def __call__(self, args, kwargs):
-        """ Invokes the underlying method with the given arguments and 
-        keywords. The bound method is reconstructed before being called.
-
-        """
-        im_self = self._im_self_ref()
-        if im_self is not None:
-            method = MethodType(self._im_func, im_self, self._im_class)
-            method(*args, **kwargs)
-    
-    def __hash__(self):
-        """ Computes and returns a hash of the consituent components
-        of the underlying method.
-
-        """
-        return hash((self._im_func, self._im_self_ref, self._im_class))
-
-    def __eq__(self, other):
-        """ Performs equality comparison. If comparing against another
-        instance of _MethodConnection, the comparison is made between
-        the constituent components of the bound method. Otherwise, this
-        method will return False.
-
-        """
-        if isinstance(other, _MethodConnection):
-            return (self._im_func == other._im_func and
-                    self._im_self_ref == other._im_self_ref and
-                    self._im_class == other._im_class)
-        return False
+        key = self._connection_key(callback)[0]
+        if self._connections.pop(key, None) is not None:
+            self._rebuild()
 
@@ -4,7 +4,7 @@
 #------------------------------------------------------------------------------
 from traits.api import (
     HasStrictTraits, List, Property, Instance, Bool, on_trait_change,
-    Tuple, Either
+    Tuple, Either, Dict
 )
 
 from .box_model import BoxModel, PaddingBoxModel
@@ -72,6 +72,12 @@ class Constrainable(HasStrictTraits):
     def __box_model_default(self):
         return BoxModel(self)
 
+    #: A private dict which caches the expanded lists of constraints
+    #: generated by the constraint handlers, keyed on the prefix of the
+    #: handler name, e.g. 'user' for 'user_constraints'. An entry is 
+    #: discarded when the traits on which the handler depends change.
+    _constraints_cache = Dict
+
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
@@ -81,8 +87,35 @@ class Constrainable(HasStrictTraits):
         change, provided that the component is initialized.
 
         """
+        self.invalidate_constraints('user')
         if self.initialized:
             self.request_relayout()
+
+    @on_trait_change('visible')
+    def _on_constrainable_visible_changed(self):
+        """ A change handler which discards the cached user and component
+        constraints which may depend on the visibility of this component.
+        
+        The layout helpers skip the components which are not visible on
+        the screen, so the constraints of the ancestors which may refer
+        to this component, and of the descendants which may refer to 
+        their own children, are discarded. A hidden descendant stays
+        hidden on the screen either way, so its subtree is skipped.
+
+        """
+        stack = [self]
+        stack_pop = stack.pop
+        stack_extend = stack.extend
+        while stack:
+            item = stack_pop()
+            item.invalidate_constraints('user', 'component')
+            stack_extend(
+                child for child in item.children
+                if isinstance(child, Constrainable) and child.visible
+            )
+        for item in self.traverse_ancestors():
+            if isinstance(item, Constrainable):
+                item.invalidate_constraints('user', 'component')
     
     #--------------------------------------------------------------------------
     # Geometry Methods
@@ -116,6 +149,54 @@ class Constrainable(HasStrictTraits):
     #--------------------------------------------------------------------------
     # Constraint Handling
     #--------------------------------------------------------------------------
+    def cached_constraints(self, name):
+        """ Returns the expanded list of constraints generated by one of
+        the constraint handlers of the component. The list is generated
+        the first time it is requested and then cached until it is 
+        invalidated by a change to the traits on which it depends.
+
+        Parameters
+        ----------
+        name : string
+            The prefix of the name of the constraint handler, i.e. one 
+            of 'hard', 'size_hint', 'component', 'user', or 'padding'.
+
+        Returns
+        -------
+        result : list
+            The list of expanded constraints for the handler. The list
+            is shared with the cache and must not be modified.
+
+        """
+        cache = self._constraints_cache
+        cns = cache.get(name)
+        if cns is None:
+            from .layout_helpers import expand_constraints
+            handler = getattr(self, name + '_constraints')
+            cns = cache[name] = list(expand_constraints(self, handler()))
+        return cns
+
+    def invalidate_constraints(self, *names):
+        """ Discards the cached lists of constraints of the component so
+        that they will be regenerated on the next relayout. Subclasses 
+        which generate constraints from additional state should call 
+        this method when that state changes.
+
+        Parameters
+        ----------
+        *names
+            The prefixes of the names of the constraint handlers whose
+            lists should be discarded. If no names are given, all of the
+            cached lists are discarded.
+
+        """
+        cache = self._constraints_cache
+        if not names:
+            cache.clear()
+        else:
+            for name in names:
+                cache.pop(name, None)
+
     def hard_constraints(self):
         """ Returns the list of required symbolic constraints for the 
         component. These are constraints that apply to both the internal
@@ -249,6 +330,7 @@ class PaddingConstraints(Constrainable):
         initialized.
 
         """
+        self.invalidate_constraints('padding')
         if self.initialized:
             self.request_relayout()
     
@@ -2,11 +2,76 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from collections import OrderedDict
+
 from casuarius import Solver, medium
 
 from ..guard import guard
 
 
+def constraint_key(cn):
+    """ Returns a hashable key which describes the structure of the 
+    given constraint. Two constraints with the same key are equivalent
+    when added to a solver.
+
+    The variables of the constraint are identified by object identity,
+    so the key is only guaranteed to be unique for as long as the 
+    constraint it was computed from is kept alive.
+
+    Parameters
+    ----------
+    cn : LinearConstraint
+        The casuarius constraint for which to compute the key.
+
+    Returns
+    -------
+    result : tuple
+        A hashable tuple which describes the constraint.
+
+    """
+    # The rhs is moved to the lhs so that 'a == b' and 'a - b == 0'
+    # hash the same. Zero coefficients are dropped for the same reason.
+    coeffs = {}
+    lhs = cn.lhs
+    rhs = cn.rhs
+    for term in lhs.terms:
+        var_id = id(term.var)
+        coeffs[var_id] = coeffs.get(var_id, 0.0) + term.coeff
+    for term in rhs.terms:
+        var_id = id(term.var)
+        coeffs[var_id] = coeffs.get(var_id, 0.0) - term.coeff
+    terms = tuple(sorted(item for item in coeffs.iteritems() if item[1]))
+    constant = lhs.constant - rhs.constant
+    return (cn.op, terms, constant, cn.strength, cn.weight)
+
+
+def keyed_constraints(constraints):
+    """ Returns a dict of the given constraints keyed on their 
+    structural identity. Duplicate constraints are given distinct keys
+    so that the dict holds the same constraints as the iterable.
+
+    Parameters
+    ----------
+    constraints : Iterable
+        An iterable that yields casuarius constraints.
+
+    Returns
+    -------
+    result : dict
+        A dict mapping (constraint_key, occurrence) tuples to the
+        constraints.
+
+    """
+    res = {}
+    for cn in constraints:
+        key = constraint_key(cn)
+        idx = 0
+        while (key, idx) in res:
+            idx += 1
+        res[(key, idx)] = cn
+    return res
+
+
 class ConstraintsLayout(object):
     """ A class which uses a casuarius solver to manage a system 
     of constraints.
@@ -18,6 +83,18 @@ class ConstraintsLayout(object):
     #: The internal flag indicating if the solver is initialized
     _initialized = False
 
+    #: The maximum number of solutions memoized by the layout method.
+    solution_cache_size = 16
+
+    #: The internal LRU dict of memoized layout solutions.
+    _solutions = None
+
+    #: The internal dict of cached min and max sizes. The dict is keyed
+    #: on the kind of size, strength, and weight. The values are tuples
+    #: of (width, height, size) so that the variables can be compared 
+    #: by identity instead of by the constraint building '=='.
+    _size_cache = None
+
     @property
     def initialized(self):
         """ A read-only property which returns whether or not this solver
@@ -39,6 +116,8 @@ class ConstraintsLayout(object):
 
         """
         self._initialized = False
+        self._solutions = OrderedDict()
+        self._size_cache = {}
         self._solver = solver = Solver(autosolve=False)
         for cn in constraints:
             solver.add_constraint(cn)
@@ -62,6 +141,8 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Update constraints on uninitialized solver')
 
+        self._solutions.clear()
+        self._size_cache.clear()
         solver = self._solver
         solver.autosolve = False
         for cn in old_cns:
@@ -70,7 +151,17 @@ class ConstraintsLayout(object):
             solver.add_constraint(cn)
         solver.autosolve = True
 
-    def layout(self, cb, width, height, size, strength=medium, weight=1.0):
+    def clear_solutions(self):
+        """ Clear the solutions memoized by the layout method. This 
+        should be called if a memoized solution may no longer apply,
+        for example when the components being laid out have changed.
+
+        """
+        if self._solutions is not None:
+            self._solutions.clear()
+
+    def layout(self, cb, width, height, size, strength=medium, weight=1.0,
+               replay=None):
         """ Perform an iteration of the solver for the new width and 
         height of the component.
 
@@ -103,16 +194,39 @@ class ConstraintsLayout(object):
         weight : float, optional
             The weight to apply to the strength. The default is 1.0
 
+        replay : callable or None, optional
+            If given, the value returned by the callback is memoized as
+            the solution for the size, strength, and weight, and on a
+            later layout with the same arguments, this callable is 
+            invoked with the memoized solution instead of running the
+            solver. The solver variables only hold the solved values 
+            within the callback, so the solution must hold everything
+            needed to apply the layout. A callback which returns None
+            is not memoized. The memoized solutions are discarded when
+            the constraints are changed. The default is None.
+
         """
         if not self._initialized:
             raise RuntimeError('Layout with uninitialized solver')
 
         if not guard.guarded(self, 'layout'):
             with guard(self, 'layout'):
+                solutions = self._solutions
+                key = (tuple(size), strength, weight)
+                if replay is not None:
+                    solution = solutions.pop(key, None)
+                    if solution is not None:
+                        solutions[key] = solution
+                        replay(solution)
+                        return
                 w, h = size
                 values = [(width, w), (height, h)]
                 with self._solver.suggest_values(values, strength, weight):
-                    cb()
+                    solution = cb()
+                if replay is not None and solution is not None:
+                    solutions[key] = solution
+                    if len(solutions) > self.solution_cache_size:
+                        solutions.popitem(last=False)
 
     def get_min_size(self, width, height, strength=medium, weight=0.1):
         """ Run an iteration of the solver with the suggested size of the
@@ -150,11 +264,23 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Get min size on uninitialized solver')
 
+        # The result only changes when the constraints change, so it
+        # is cached until the next call to 'update_constraints'.
+        key = ('min', strength, weight)
+        cache = self._size_cache
+        cached = cache.get(key)
+        if cached is not None:
+            c_width, c_height, res = cached
+            if c_width is width and c_height is height:
+                return res
+
         values = [(width, 0.0), (height, 0.0)]
         with self._solver.suggest_values(values, strength, weight):
             min_width = width.value
             min_height = height.value
-        return (min_width, min_height)
+        res = (min_width, min_height)
+        cache[key] = (width, height, res)
+        return res
 
     def get_max_size(self, width, height, strength=medium, weight=0.1):
         """ Run an iteration of the solver with the suggested size of 
@@ -194,6 +320,16 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Get max size on uninitialized solver')
 
+        # The result only changes when the constraints change, so it
+        # is cached until the next call to 'update_constraints'.
+        key = ('max', strength, weight)
+        cache = self._size_cache
+        cached = cache.get(key)
+        if cached is not None:
+            c_width, c_height, res = cached
+            if c_width is width and c_height is height:
+                return res
+
         max_val = 2**24 - 1 # Arbitrary, but the max allowed by Qt.
         values = [(width, max_val), (height, max_val)]
         with self._solver.suggest_values(values, strength, weight): 
@@ -205,5 +341,40 @@ class ConstraintsLayout(object):
             max_width = -1
         if height_diff <= 1:
             max_height = -1
-        return (max_width, max_height)
+        res = (max_width, max_height)
+        cache[key] = (width, height, res)
+        return res
+
+    def get_min_max_size(self, width, height, strength=medium, weight=0.1):
+        """ Returns both the minimum and the maximum size of the 
+        component in a single query. See 'get_min_size' and 
+        'get_max_size'. Both sizes are cached until the constraints
+        change, so only the first query after a change runs the solver.
+
+        Parameters
+        ----------
+        width : Constraint Variable
+            The constraint variable representing the width of the
+            main layout container.
+        
+        height : Constraint Variable
+            The constraint variable representing the height of the
+            main layout container.
 
+        strength : casuarius strength, optional
+            The strength with which to perform the layout using the
+            current size of the container. i.e. the strength of the
+            resize. The default is casuarius.medium.
+        
+        weight : float, optional
+            The weight to apply to the strength. The default is 0.1.
+
+        Returns
+        -------
+        result : ((float, float), (float or -1, float or -1))
+            The (min_size, max_size) tuple of the container.
+
+        """
+        min_size = self.get_min_size(width, height, strength, weight)
+        max_size = self.get_max_size(width, height, strength, weight)
+        return (min_size, max_size)
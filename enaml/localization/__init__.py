@@ -4,6 +4,7 @@
 #------------------------------------------------------------------------------
 from .abstract_locale import AbstractLocale
 from .system_locale import SystemLocale
+from .snapshot_locale import SnapshotLocale
 
 
 #: The storage for the framework default locale object
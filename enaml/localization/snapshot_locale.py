@@ -0,0 +1,415 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import locale
+
+from .system_locale import SystemLocale
+
+
+#: The maximum number of digit groups computed for a grouping pattern.
+#: This is enough for the integer part of any float.
+_MAX_GROUPS = 128
+
+
+def _grouping_sizes(grouping):
+    """ Expand a 'grouping' list from 'locale.localeconv' into a tuple
+    of group sizes, ordered from the rightmost group.
+
+    Parameters
+    ----------
+    grouping : list of int
+        The grouping list. A trailing 0 repeats the previous size and a
+        trailing locale.CHAR_MAX stops further grouping.
+
+    Returns
+    -------
+    result : tuple of int
+        The sizes of the digit groups. The leftmost digits which are not
+        covered by these groups are left ungrouped.
+
+    """
+    sizes = []
+    last = None
+    for size in grouping:
+        if size == locale.CHAR_MAX:
+            break
+        if size == 0:
+            if last is not None:
+                sizes.extend([last] * (_MAX_GROUPS - len(sizes)))
+            break
+        sizes.append(size)
+        last = size
+    return tuple(sizes[:_MAX_GROUPS])
+
+
+def _group_digits(text, sizes, separator):
+    """ Insert the separator between the digit groups of the integer
+    part of a formatted number.
+
+    Parameters
+    ----------
+    text : str
+        A formatted number, such as '-1234567' or '1234.5e+06'. Only
+        the leading run of digits after an optional sign is grouped.
+
+    sizes : tuple of int
+        The group sizes as returned by '_grouping_sizes'.
+
+    separator : str
+        The separator to insert between the groups.
+
+    Returns
+    -------
+    result : str
+        The formatted number with the grouped integer part.
+
+    """
+    if not (sizes and separator):
+        return text
+    start = 1 if text[:1] in ('-', '+') else 0
+    end = start
+    n = len(text)
+    while end < n and text[end].isdigit():
+        end += 1
+    digits = text[start:end]
+    groups = []
+    for size in sizes:
+        if len(digits) <= size:
+            break
+        groups.append(digits[-size:])
+        digits = digits[:-size]
+    if not groups:
+        return text
+    groups.append(digits)
+    groups.reverse()
+    return text[:start] + separator.join(groups) + text[end:]
+
+
+class SnapshotLocale(SystemLocale):
+    """ A SystemLocale subclass which captures the values of the system
+    locale once and reuses them for every query and conversion.
+
+    The SystemLocale queries the 'locale' module on every call, which
+    is costly when formatting or validating large numbers of values. A
+    SnapshotLocale instead precomputes the locale tables, such as the
+    month names and digit grouping patterns, when it is created. If the
+    system locale is later changed with 'locale.setlocale', call the
+    'refresh' method to capture the new values.
+
+    """
+    def __init__(self):
+        """ Initialize a SnapshotLocale from the current system locale.
+
+        """
+        self.refresh()
+
+    def refresh(self):
+        """ Capture the current values of the system locale and rebuild
+        the precomputed tables.
+
+        """
+        system = SystemLocale()
+        conv = locale.localeconv()
+        self._conv = conv
+
+        self._name = system.name
+        self._encoding = system.encoding
+        self._am_string = system.am_string
+        self._pm_string = system.pm_string
+        self._decimal_point = system.decimal_point
+        self._monetary_decimal_point = system.monetary_decimal_point
+        self._thousands_separator = system.thousands_separator
+        self._monetary_thousands_separator = (
+            system.monetary_thousands_separator
+        )
+        self._negative_sign = system.negative_sign
+        self._positive_sign = system.positive_sign
+
+        flags = (False, True)
+        self._month_names = dict(
+            ((month, abbr), system.month_name(month, abbr))
+            for month in xrange(1, 13) for abbr in flags
+        )
+        self._day_names = dict(
+            ((day, abbr), system.day_name(day, abbr))
+            for day in xrange(1, 8) for abbr in flags
+        )
+        self._time_formats = dict(
+            (abbr, system.time_format(abbr)) for abbr in flags
+        )
+        self._date_formats = dict(
+            (abbr, system.date_format(abbr)) for abbr in flags
+        )
+        self._datetime_formats = dict(
+            (abbr, system.datetime_format(abbr)) for abbr in flags
+        )
+
+        # The raw byte string values are used for the numeric parsing
+        # and formatting, the same as is done by the 'locale' module.
+        self._raw_decimal_point = conv['decimal_point']
+        self._raw_thousands_sep = conv['thousands_sep']
+        self._group_sizes = _grouping_sizes(conv['grouping'])
+        self._mon_group_sizes = _grouping_sizes(conv['mon_grouping'])
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _delocalize(self, text):
+        """ Remove the thousands separators from a localized numeric
+        string and replace the decimal point with a period.
+
+        """
+        ts = self._raw_thousands_sep
+        if ts:
+            text = text.replace(ts, '')
+        dp = self._raw_decimal_point
+        if dp and dp != '.':
+            text = text.replace(dp, '.')
+        return text
+
+    def _localize(self, text, group, monetary=False):
+        """ Group the integer part of a numeric string formatted in the
+        'C' locale and replace its decimal point with the decimal point
+        of the locale.
+
+        """
+        conv = self._conv
+        if monetary:
+            dp = conv['mon_decimal_point']
+            sizes = self._mon_group_sizes
+            sep = conv['mon_thousands_sep']
+        else:
+            dp = self._raw_decimal_point
+            sizes = self._group_sizes
+            sep = self._raw_thousands_sep
+        if group:
+            text = _group_digits(text, sizes, sep)
+        if dp and dp != '.':
+            text = text.replace('.', dp, 1)
+        return text
+
+    #--------------------------------------------------------------------------
+    # Properties
+    #--------------------------------------------------------------------------
+    @property
+    def name(self):
+        """ The RFC 1766 language code for the locale.
+
+        """
+        return self._name
+
+    @property
+    def encoding(self):
+        """ The encoding for strings in the locale.
+
+        """
+        return self._encoding
+
+    @property
+    def am_string(self):
+        """ The string for "AM" time in the locale.
+
+        """
+        return self._am_string
+
+    @property
+    def pm_string(self):
+        """ The string for "PM" time in the locale.
+
+        """
+        return self._pm_string
+
+    @property
+    def decimal_point(self):
+        """ The decimal separator for the locale.
+
+        """
+        return self._decimal_point
+
+    @property
+    def monetary_decimal_point(self):
+        """ The decimal separator for monetary values for the locale.
+
+        """
+        return self._monetary_decimal_point
+
+    @property
+    def thousands_separator(self):
+        """ The thousands separator for the locale.
+
+        """
+        return self._thousands_separator
+
+    @property
+    def monetary_thousands_separator(self):
+        """ The thousands separator for monetary values for the locale.
+
+        """
+        return self._monetary_thousands_separator
+
+    @property
+    def negative_sign(self):
+        """ The monetary negative sign for the locale.
+
+        """
+        return self._negative_sign
+
+    @property
+    def positive_sign(self):
+        """ The monetary positive sign for the locale.
+
+        """
+        return self._positive_sign
+
+    #--------------------------------------------------------------------------
+    # Methods
+    #--------------------------------------------------------------------------
+    def month_name(self, month_int, abbreviated=False):
+        """ The month name for the given month integer. See the
+        SystemLocale.month_name method.
+
+        """
+        return self._month_names.get((month_int, bool(abbreviated)), '')
+
+    def day_name(self, day_int, abbreviated=False):
+        """ The day name for the given day integer. See the
+        SystemLocale.day_name method.
+
+        """
+        return self._day_names.get((day_int, bool(abbreviated)), '')
+
+    def time_format(self, abbreviated=False):
+        """ The format string for a time value. See the
+        SystemLocale.time_format method.
+
+        """
+        return self._time_formats[bool(abbreviated)]
+
+    def date_format(self, abbreviated=False):
+        """ The format string for a date value. See the
+        SystemLocale.date_format method.
+
+        """
+        return self._date_formats[bool(abbreviated)]
+
+    def datetime_format(self, abbreviated=False):
+        """ The format string for a datetime value. See the
+        SystemLocale.datetime_format method.
+
+        """
+        return self._datetime_formats[bool(abbreviated)]
+
+    #--------------------------------------------------------------------------
+    # Conversions
+    #--------------------------------------------------------------------------
+    def to_int(self, int_str, base=10):
+        """ Parse the string into an integer using the given base. See
+        the SystemLocale.to_int method.
+
+        """
+        return int(self._delocalize(int_str), base)
+
+    def to_long(self, long_str, base=10):
+        """ Parse the string into a long integer using the given base.
+        See the SystemLocale.to_long method.
+
+        """
+        return long(self._delocalize(long_str), base)
+
+    def to_float(self, float_str):
+        """ Parse the given string into a float. See the
+        SystemLocale.to_float method.
+
+        """
+        return float(self._delocalize(float_str))
+
+    def to_currency(self, currency_str, symbol=True, group=False, intl=False):
+        """ Parse the given currency string into a float. See the
+        SystemLocale.to_currency method.
+
+        """
+        curr = currency_str
+        conv = self._conv
+        if symbol:
+            if intl:
+                curr = curr.replace(conv['int_curr_symbol'], '')
+            else:
+                curr = curr.replace(conv['currency_symbol'], '')
+        if group:
+            curr = curr.replace(conv['mon_thousands_sep'], '')
+        curr = curr.replace(conv['mon_decimal_point'], '.').strip()
+        return float(curr)
+
+    def from_int(self, value, base=10, group=False):
+        """ Format the integer value according to the locale. See the
+        SystemLocale.from_int method.
+
+        """
+        # Only base 10 is formatted here. The other bases are rarely
+        # used and are formatted by the system locale.
+        if base != 10:
+            return super(SnapshotLocale, self).from_int(value, base, group)
+        r = '%d' % value
+        if group:
+            r = _group_digits(r, self._group_sizes, self._raw_thousands_sep)
+        return unicode(r)
+
+    def from_float(self, value, group=False, prec=-1):
+        """ Format the float value according to the locale. See the
+        SystemLocale.from_float method.
+
+        """
+        if prec < 0:
+            r = '%g' % value
+        else:
+            r = '%.*g' % (prec, value)
+        return unicode(self._localize(r, group))
+
+    def from_currency(self, value, symbol=True, group=False, intl=False):
+        """ Convert the given value into a locale specific currency
+        string. See the SystemLocale.from_currency method.
+
+        """
+        # This follows the implementation of 'locale.currency'.
+        conv = self._conv
+        digits = conv['int_frac_digits' if intl else 'frac_digits']
+        if digits == locale.CHAR_MAX:
+            msg = "Currency formatting is not possible using the 'C' locale."
+            raise ValueError(msg)
+
+        s = self._localize('%.*f' % (digits, abs(value)), group, True)
+        s = '<' + s + '>'
+        negative = value < 0
+
+        if symbol:
+            smb = conv['int_curr_symbol' if intl else 'currency_symbol']
+            precedes = conv['n_cs_precedes' if negative else 'p_cs_precedes']
+            separated = conv[
+                'n_sep_by_space' if negative else 'p_sep_by_space'
+            ]
+            space = ' ' if separated else ''
+            if precedes:
+                s = smb + space + s
+            else:
+                s = s + space + smb
+
+        sign_pos = conv['n_sign_posn' if negative else 'p_sign_posn']
+        sign = conv['negative_sign' if negative else 'positive_sign']
+        if sign_pos == 0:
+            s = '(' + s + ')'
+        elif sign_pos == 1:
+            s = sign + s
+        elif sign_pos == 2:
+            s = s + sign
+        elif sign_pos == 3:
+            s = s.replace('<', sign)
+        elif sign_pos == 4:
+            s = s.replace('>', sign)
+        else:
+            # The sign position is not specified by the locale, so the
+            # sign is placed before the value.
+            s = sign + s
+
+        return unicode(s.replace('<', '').replace('>', ''))
+
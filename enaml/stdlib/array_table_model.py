@@ -0,0 +1,334 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import OrderedDict
+
+import numpy as np
+
+from enaml.core.item_model import (
+    AbstractTableModel, ITEM_IS_SELECTABLE, ITEM_IS_ENABLED, ITEM_IS_EDITABLE,
+)
+
+
+#: The default display formats for the dtype kinds of the columns.
+#: Floats use their repr, which is the shortest string that round
+#: trips to the same value, so that no precision is lost on display.
+DEFAULT_FORMATS = {
+    'f': '%r',
+    'c': '%s',
+}
+
+
+def _changed_ranges(mask):
+    """ Yields the (first_row, last_row, first_col, last_col) inclusive
+    ranges which cover the True values in the given 2D boolean mask.
+    Runs of consecutive changed rows are grouped, and within each group,
+    runs of consecutive changed columns are grouped.
+
+    """
+    def runs(flags):
+        idxs = np.flatnonzero(flags)
+        if len(idxs) == 0:
+            return
+        breaks = np.flatnonzero(np.diff(idxs) != 1)
+        starts = np.concatenate(([idxs[0]], idxs[breaks + 1]))
+        ends = np.concatenate((idxs[breaks], [idxs[-1]]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            yield start, end
+
+    for first_row, last_row in runs(mask.any(axis=1)):
+        cols = mask[first_row:last_row + 1].any(axis=0)
+        for first_col, last_col in runs(cols):
+            yield first_row, last_row, first_col, last_col
+
+
+class ArrayTableModel(AbstractTableModel):
+    """ A concrete implementation of AbstractTableModel which displays
+    the data of a 2D NumPy array or a 1D record array without copying.
+
+    The display strings are rendered a page of rows for a column at a
+    time using vectorized formatting, and the rendered pages are cached
+    so that repeated paints of the visible cells are cheap. When the
+    array is modified in place, call 'notify_array_changed' to update
+    the cache and the views.
+
+    """
+    base_flags = ITEM_IS_ENABLED | ITEM_IS_SELECTABLE
+
+    #: The number of rows rendered at once for a column.
+    page_size = 256
+
+    #: The maximum number of rendered pages to keep in the cache.
+    max_pages = 512
+
+    def __init__(self, array, formats=None, editable=False,
+                 horizontal_headers=None, vertical_headers=None):
+        """ Initialize an ArrayTableModel.
+
+        Parameters
+        ----------
+        array : ndarray
+            A 2D array, or a 1D structured array where each field is a
+            column. The array is referenced, not copied.
+
+        formats : string, sequence, dict or None, optional
+            The display format of the columns. Each format is either a
+            %-style format string, or a callable which accepts a 1D
+            array of values and returns a sequence of strings. A single
+            format applies to every column. A sequence gives the format
+            of each column and a dict maps column indexes to formats.
+            Columns without a format use a format based on their dtype.
+            The default is None.
+
+        editable : bool, optional
+            Whether or not the model is editable. Edited values are
+            converted by the array on assignment. The default is False.
+
+        horizontal_headers : sequence or None, optional
+            The column headers. If not given, the field names of a
+            structured array are used. The default is None.
+
+        vertical_headers : sequence or None, optional
+            The row headers. The default is None.
+
+        """
+        self._editable = editable
+        self._formats = formats
+        self._horizontal_headers = horizontal_headers
+        self._vertical_headers = vertical_headers
+        self._pages = OrderedDict()
+        self._load_array(array)
+
+    def _load_array(self, array):
+        """ Load the array for the model and clear the rendered pages.
+
+        """
+        if array.dtype.names is not None:
+            if array.ndim != 1:
+                raise ValueError('A structured array must be 1-dimensional')
+            self._names = array.dtype.names
+        else:
+            if array.ndim != 2:
+                raise ValueError('The array must be 2-dimensional')
+            self._names = None
+        self._array = array
+        self._pages.clear()
+
+    def _get_array(self):
+        """ The property getter for the 'array' property.
+
+        """
+        return self._array
+
+    def _set_array(self, array):
+        """ The property setter for the 'array' property.
+
+        """
+        self.begin_reset_model()
+        self._load_array(array)
+        self.end_reset_model()
+
+    array = property(_get_array, _set_array)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _column(self, col):
+        """ Returns a view of the values of the given column.
+
+        """
+        names = self._names
+        if names is not None:
+            return self._array[names[col]]
+        return self._array[:, col]
+
+    def _format(self, col, values):
+        """ Returns the format to use for the given column values.
+
+        """
+        formats = self._formats
+        if isinstance(formats, basestring) or callable(formats):
+            return formats
+        fmt = None
+        if isinstance(formats, dict):
+            fmt = formats.get(col)
+        elif formats is not None and col < len(formats):
+            fmt = formats[col]
+        if fmt is None:
+            fmt = DEFAULT_FORMATS.get(values.dtype.kind, '%s')
+        return fmt
+
+    def _page(self, col, page):
+        """ Returns the list of rendered strings for the given page of
+        rows of the given column, rendering it if necessary.
+
+        """
+        pages = self._pages
+        key = (col, page)
+        rendered = pages.pop(key, None)
+        if rendered is None:
+            start = page * self.page_size
+            values = self._column(col)[start:start + self.page_size]
+            fmt = self._format(col, values)
+            if callable(fmt):
+                rendered = list(fmt(values))
+            else:
+                rendered = np.char.mod(fmt, values).tolist()
+            if len(pages) >= self.max_pages:
+                pages.popitem(last=False)
+        pages[key] = rendered
+        return rendered
+
+    def _discard_pages(self, first_row, last_row, first_col, last_col):
+        """ Discards the rendered pages which overlap the given inclusive
+        ranges of rows and columns.
+
+        """
+        size = self.page_size
+        pages = self._pages
+        for col in xrange(first_col, last_col + 1):
+            for page in xrange(first_row // size, last_row // size + 1):
+                pages.pop((col, page), None)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def notify_array_changed(self, key=None):
+        """ Notify the model that values of the array were changed in
+        place. The affected cached strings are discarded and the views
+        are notified of the smallest ranges which cover the changes.
+
+        Parameters
+        ----------
+        key : index expression, boolean array or None, optional
+            An expression which indexes a 2D array of the shape of the
+            model, such as a tuple of slices, selecting the changed
+            cells. It may also be a boolean mask of that shape. If None,
+            the whole array is considered changed. The default is None.
+
+        """
+        shape = (self.row_count(), self.column_count())
+        if key is None:
+            mask = np.ones(shape, dtype=bool)
+        elif isinstance(key, np.ndarray) and key.dtype == bool:
+            if key.shape != shape:
+                msg = 'The mask shape %s does not match the model shape %s'
+                raise ValueError(msg % (key.shape, shape))
+            mask = key
+        else:
+            mask = np.zeros(shape, dtype=bool)
+            mask[key] = True
+        for first_row, last_row, first_col, last_col in _changed_ranges(mask):
+            self._discard_pages(first_row, last_row, first_col, last_col)
+            top_left = self.index(first_row, first_col)
+            bottom_right = self.index(last_row, last_col)
+            self.notify_data_changed(top_left, bottom_right)
+
+    #--------------------------------------------------------------------------
+    # AbstractTableModel Interface
+    #--------------------------------------------------------------------------
+    def flags(self, index):
+        """ Returns the flags for the items in the model.
+
+        """
+        flags = self.base_flags
+        if self._editable:
+            flags |= ITEM_IS_EDITABLE
+        return flags
+
+    def row_count(self, parent=None):
+        """ Returns the number of rows in the array.
+
+        """
+        if parent is not None:
+            return 0
+        return self._array.shape[0]
+
+    def column_count(self, parent=None):
+        """ Returns the number of columns in the array.
+
+        """
+        if parent is not None:
+            return 0
+        names = self._names
+        if names is not None:
+            return len(names)
+        return self._array.shape[1]
+
+    def data(self, index):
+        """ Returns the rendered string for the given index.
+
+        """
+        row = index.row
+        page, offset = divmod(row, self.page_size)
+        return self._page(index.column, page)[offset]
+
+    def edit_data(self, index):
+        """ Returns the value of the given index as a Python object.
+
+        """
+        return self._column(index.column)[index.row].item()
+
+    def set_data(self, index, value):
+        """ Sets the value of the given index in the array and emits the
+        proper changed notification. Returns False if the array cannot
+        convert the value.
+
+        """
+        row = index.row
+        col = index.column
+        try:
+            self._column(col)[row] = value
+        except (TypeError, ValueError):
+            return False
+        self._discard_pages(row, row, col, col)
+        self.notify_data_changed(index, index)
+        return True
+
+    def data_block(self, rows, columns, role='data'):
+        """ Overridden parent class method which returns the rendered
+        strings or the values of a block of the array.
+
+        """
+        rows = list(rows)
+        if role == 'data':
+            size = self.page_size
+            cols = []
+            for col in columns:
+                rendered = {}
+                vals = []
+                for row in rows:
+                    page, offset = divmod(row, size)
+                    strings = rendered.get(page)
+                    if strings is None:
+                        strings = rendered[page] = self._page(col, page)
+                    vals.append(strings[offset])
+                cols.append(vals)
+        elif role == 'edit_data':
+            cols = [self._column(col)[rows].tolist() for col in columns]
+        else:
+            return super(ArrayTableModel, self).data_block(rows, columns, role)
+        # The result is built per row so that an empty list of columns
+        # still gives one empty list for each row.
+        return [[vals[idx] for vals in cols] for idx in xrange(len(rows))]
+
+    def horizontal_header_data(self, section):
+        """ Returns the horizontal header data for the given section.
+
+        """
+        headers = self._horizontal_headers
+        if headers is None:
+            headers = self._names
+        if headers is not None:
+            return headers[section]
+        return super(ArrayTableModel, self).horizontal_header_data(section)
+
+    def vertical_header_data(self, section):
+        """ Returns the vertical header data for the given section.
+
+        """
+        headers = self._vertical_headers
+        if headers is not None:
+            return headers[section]
+        return super(ArrayTableModel, self).vertical_header_data(section)
@@ -2,14 +2,21 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from functools import wraps
 from os import listdir
-from os.path import abspath, isabs, normpath, join, isdir, pardir
+from os.path import abspath, isabs, normpath, join, isdir, pardir, getmtime
 import re
 
 from enaml.core.item_model import AbstractListModel, ModelIndex, ALIGN_LEFT, ALIGN_VCENTER
 
+# Use the scandir package if available, since it reports whether an
+# entry is a directory without an extra stat call on most platforms.
+try:
+    from scandir import scandir
+except ImportError:
+    scandir = None
+
 
 # A named tuple which holds the relative path of an item in the 
 # current working directory of the model, and whether or not that 
@@ -17,6 +24,24 @@ from enaml.core.item_model import AbstractListModel, ModelIndex, ALIGN_LEFT, ALI
 _FlatRecord = namedtuple('_FlatRecord', 'is_dir rel_path')
 
 
+def _iter_entries(directory):
+    """ A generator which yields a (is_dir, name) tuple for each entry
+    in the given directory. The entries are produced lazily so that a 
+    large directory can be consumed in chunks.
+
+    """
+    if scandir is not None:
+        for entry in scandir(directory):
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            yield (is_dir, entry.name)
+    else:
+        for name in listdir(directory):
+            yield (isdir(join(directory, name)), name)
+
+
 def _reset_model(func):
     """ A method decorator which will reset an abstract item model.
 
@@ -51,7 +76,19 @@ class FlatFileSystemModel(AbstractListModel):
     """ A concrete list model implementation which navigates a mounted
     filesystem one directory at a time.
 
+    The entries of a directory are read in chunks on demand through
+    the can_fetch_more and fetch_more methods, so that a view can show
+    the first entries of a large directory immediately. The complete 
+    listings of recently visited directories are cached until the
+    modification time of the directory changes.
+
     """
+    #: The number of directory entries to read per fetch.
+    fetch_size = 1024
+
+    #: The maximum number of directory listings to keep in the cache.
+    listing_cache_size = 16
+
     def __init__(
         self, directory='.', show_hidden=False, file_pattern=r'.*', 
         dir_icon=None, file_icon=None):
@@ -88,6 +125,10 @@ class FlatFileSystemModel(AbstractListModel):
         self._dir_icon = dir_icon
         self._file_icon = file_icon
         self._contents = []
+        self._entries = None
+        self._listing = None
+        self._listing_mtime = None
+        self._listings = OrderedDict()
         self._loadcwd()
 
     #--------------------------------------------------------------------------
@@ -125,44 +166,104 @@ class FlatFileSystemModel(AbstractListModel):
             return self._dir_icon
         return self._file_icon
 
+    def can_fetch_more(self, parent=None):
+        """ Returns True if the current directory has entries which 
+        have not yet been read.
+
+        """
+        return parent is None and self._entries is not None
+
+    def fetch_more(self, parent=None):
+        """ Reads the next chunk of entries of the current directory
+        and inserts the accepted items into the model.
+
+        """
+        if not self.can_fetch_more(parent):
+            return
+        records = self._read_entries(self.fetch_size)
+        if records:
+            contents = self._contents
+            first = len(contents)
+            last = first + len(records) - 1
+            self.begin_insert_rows(None, first, last)
+            contents.extend(records)
+            self.end_insert_rows(None, first, last)
+
     #--------------------------------------------------------------------------
     # Private Methods
     #--------------------------------------------------------------------------
     def _loadcwd(self):
-        """ Loads the contents of the current working directory.
+        """ Loads the contents of the current working directory. 
 
-        Parameters
-        ----------
-        directory : string
-            The directory for which to retrieve items.
-
-        Returns
-        -------
-        result : list of 2-tuples
-            A list of 2-tuples of the form (bool, string) where the 
-            boolean indicates whether the item is a directory and 
-            the string is the relative path to the item.
+        If the listing of the directory is cached and the directory 
+        has not been modified since, the contents are loaded from the
+        cache. Otherwise, only the first chunk of entries is read and
+        the rest are read on demand by 'fetch_more'.
 
         """
-        contents = self._contents = []
-        push = contents.append
         cwd = self._cwd
-        filter_dir = self.filter_dir
-        filter_file = self.filter_file
-        rcd = _FlatRecord
+        listings = self._listings
+        mtime = getmtime(cwd)
 
         # The first item in a directory is always the relative path to
         # the parent directory. This allows for simple navigation 
         # through the filesystem. But we may want to update it in the
         # future to use something like a breadcrumbs widget.
-        push(rcd(True, pardir))
-        for item in listdir(cwd):
-            if isdir(join(cwd, item)):
+        self._contents = [_FlatRecord(True, pardir)]
+
+        cached = listings.pop(cwd, None)
+        if cached is not None and cached[0] == mtime:
+            listings[cwd] = cached
+            self._entries = None
+            self._contents.extend(self._filter_entries(cached[1]))
+        else:
+            self._entries = _iter_entries(cwd)
+            self._listing = []
+            self._listing_mtime = mtime
+            self._contents.extend(self._read_entries(self.fetch_size))
+
+    def _read_entries(self, count):
+        """ Reads up to the given number of entries from the current 
+        directory and returns the list of accepted records. When the
+        directory is exhausted, its listing is added to the cache.
+
+        """
+        entries = self._entries
+        listing = self._listing
+        chunk = []
+        push = chunk.append
+        for entry in entries:
+            push(entry)
+            if len(chunk) >= count:
+                break
+        listing.extend(chunk)
+        if len(chunk) < count:
+            self._entries = None
+            self._listing = None
+            listings = self._listings
+            listings[self._cwd] = (self._listing_mtime, listing)
+            while len(listings) > self.listing_cache_size:
+                listings.popitem(last=False)
+        return self._filter_entries(chunk)
+
+    def _filter_entries(self, entries):
+        """ Returns the list of records for the given (is_dir, name)
+        entries which are accepted by the filters.
+
+        """
+        filter_dir = self.filter_dir
+        filter_file = self.filter_file
+        rcd = _FlatRecord
+        res = []
+        push = res.append
+        for is_dir, item in entries:
+            if is_dir:
                 if filter_dir(item):
                     push(rcd(True, item))
             else:
                 if filter_file(item):
                     push(rcd(False, item))
+        return res
 
     #--------------------------------------------------------------------------
     # Public Properties
@@ -263,7 +364,7 @@ class FlatFileSystemModel(AbstractListModel):
         directory.
 
         Calling os.path.isdir is an expensive system call, which is
-        therefore only done once when loading a new directory. Using
+        therefore only done once when reading a directory entry. Using
         this method when needing to query for directory status will
         save time.
 
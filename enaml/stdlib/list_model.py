@@ -6,14 +6,18 @@ from enaml.core.item_model import (
     AbstractListModel, ITEM_IS_SELECTABLE, ITEM_IS_ENABLED, ITEM_IS_EDITABLE,
 )
 
+from .row_sequence import RowSequenceMixin
 
-class ListModel(AbstractListModel):
+
+class ListModel(RowSequenceMixin, AbstractListModel):
     """ A concrete implementation of AbstractListModel which is intended
     to be easy to use for data models which behave more-or-less like
     one dimensional sequences.
 
     The data object can be updated dynamically after instantiation by 
-    using the 'data_source' property.
+    using the 'data_source' property. If the data object is a mutable
+    sequence, rows can also be inserted, removed and moved in place
+    with the 'insert_rows', 'remove_rows' and 'move_rows' methods.
 
     """
     base_flags = ITEM_IS_ENABLED | ITEM_IS_SELECTABLE
@@ -108,6 +112,12 @@ class ListModel(AbstractListModel):
     
     data_source = property(_get_data_source, _set_data_source)
 
+    def _row_sequence(self):
+        """ Returns the data source which holds the rows of the model.
+
+        """
+        return self._data_source
+
     def flags(self, index):
         """ Returns the flags for the items in the model.
 
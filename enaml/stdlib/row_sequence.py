@@ -0,0 +1,197 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import MutableSequence
+
+
+class TableRows(list):
+    """ A list of row sequences which can be used as the data source of
+    a TableModel.
+
+    It supports the (row, column) indexing and the 'shape' attribute
+    required by the TableModel, and since it is a mutable sequence of
+    rows, the rows of the model can be inserted, removed and moved in
+    place.
+
+    """
+    def __init__(self, rows=(), column_count=None):
+        """ Initialize a TableRows.
+
+        Parameters
+        ----------
+        rows : iterable of sequences, optional
+            The initial rows of the table. The rows are referenced, not
+            copied.
+
+        column_count : int or None, optional
+            The number of columns in the table. If None, the number of
+            columns is the length of the first row, or zero if there
+            are no rows. The default is None.
+
+        """
+        super(TableRows, self).__init__(rows)
+        self.column_count = column_count
+
+    @property
+    def shape(self):
+        """ The (nrows, ncols) tuple of the table.
+
+        """
+        ncols = self.column_count
+        if ncols is None:
+            ncols = len(self[0]) if len(self) > 0 else 0
+        return (len(self), ncols)
+
+    def __getitem__(self, key):
+        """ Returns the value of the cell for a (row, column) tuple, or
+        the row or rows for any other index.
+
+        """
+        if isinstance(key, tuple):
+            row, col = key
+            return list.__getitem__(self, row)[col]
+        return list.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        """ Sets the value of the cell for a (row, column) tuple, or
+        the row or rows for any other index.
+
+        """
+        if isinstance(key, tuple):
+            row, col = key
+            list.__getitem__(self, row)[col] = value
+        else:
+            list.__setitem__(self, key, value)
+
+
+class RowSequenceMixin(object):
+    """ A mixin class for the item models whose rows are the items of a
+    mutable sequence. It adds methods to insert, remove and move rows
+    in place with the precise row notifications, so that the views do
+    not need to reset when rows are added or removed.
+
+    The sequence is modified with slice assignment and deletion, so a
+    change of k rows only allocates memory for those k rows. Subclasses
+    must implement the '_row_sequence' method.
+
+    """
+    def _row_sequence(self):
+        """ Returns the mutable sequence which holds the rows of the
+        model. This must be implemented by subclasses.
+
+        """
+        raise NotImplementedError
+
+    def _checked_row_sequence(self):
+        """ Returns the mutable sequence which holds the rows of the
+        model, or raises a TypeError if the rows cannot be modified.
+
+        """
+        seq = self._row_sequence()
+        if not isinstance(seq, MutableSequence):
+            msg = 'The rows of a %s data source cannot be modified in place'
+            raise TypeError(msg % type(seq).__name__)
+        return seq
+
+    def insert_rows(self, row, items):
+        """ Inserts rows into the model.
+
+        Parameters
+        ----------
+        row : int
+            The row before which the new rows are inserted. A row equal
+            to the row count appends the new rows.
+
+        items : iterable
+            The items for the new rows.
+
+        """
+        seq = self._checked_row_sequence()
+        if not 0 <= row <= len(seq):
+            raise IndexError('Row %d is out of range' % row)
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        count = len(items)
+        if count == 0:
+            return
+        last = row + count - 1
+        self.begin_insert_rows(None, row, last)
+        seq[row:row] = items
+        self.end_insert_rows(None, row, last)
+
+    def append_rows(self, items):
+        """ Appends rows to the end of the model.
+
+        Parameters
+        ----------
+        items : iterable
+            The items for the new rows.
+
+        """
+        self.insert_rows(len(self._checked_row_sequence()), items)
+
+    def remove_rows(self, row, count=1):
+        """ Removes rows from the model.
+
+        Parameters
+        ----------
+        row : int
+            The first row to remove.
+
+        count : int, optional
+            The number of rows to remove. The default is 1.
+
+        """
+        seq = self._checked_row_sequence()
+        if count <= 0:
+            return
+        if row < 0 or row + count > len(seq):
+            msg = 'Rows %d to %d are out of range'
+            raise IndexError(msg % (row, row + count - 1))
+        last = row + count - 1
+        self.begin_remove_rows(None, row, last)
+        del seq[row:last + 1]
+        self.end_remove_rows(None, row, last)
+
+    def move_rows(self, row, count, destination):
+        """ Moves rows within the model.
+
+        Parameters
+        ----------
+        row : int
+            The first row to move.
+
+        count : int
+            The number of rows to move.
+
+        destination : int
+            The row before which the moved rows are placed, given as a
+            row number from before the move. A destination equal to the
+            row count moves the rows to the end of the model. It must
+            not fall within the rows being moved.
+
+        """
+        seq = self._checked_row_sequence()
+        if count <= 0:
+            return
+        n = len(seq)
+        last = row + count - 1
+        if row < 0 or last >= n:
+            raise IndexError('Rows %d to %d are out of range' % (row, last))
+        if not 0 <= destination <= n:
+            raise IndexError('Destination %d is out of range' % destination)
+        if row <= destination <= last + 1:
+            # Moving rows onto themselves is a no-op.
+            return
+        self.begin_move_rows(None, row, last, None, destination)
+        moved = seq[row:last + 1]
+        del seq[row:last + 1]
+        # The insertion index is shifted by the removed rows, but the
+        # notifications carry the destination from before the move.
+        insert_at = destination
+        if destination > row:
+            insert_at -= count
+        seq[insert_at:insert_at] = moved
+        self.end_move_rows(None, row, last, None, destination)
+
@@ -2,20 +2,93 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from functools import wraps
+import logging
+from Queue import LifoQueue
+from threading import Lock, Thread
+from weakref import ref
 
 from enaml.core.toolkit import Toolkit
 from enaml.core.item_model import AbstractListModel, ALIGN_HCENTER, ALIGN_VCENTER
 
+from .row_sequence import RowSequenceMixin
+
 
 # A named tuple representing a thumbnail. It contains the 'name' to show
 # below the thumbnail in a view. The 'image' object from which to create
-# the thumbnail, and any 'metadata' to associate with the thumbnail for
-# use in other parts of an application.
+# the thumbnail, or the path to an image file which will be read when 
+# the thumbnail is first shown, and any 'metadata' to associate with the
+# thumbnail for use in other parts of an application.
 Thumbnail = namedtuple('Thumbnail', 'name image metadata')
 
 
+logger = logging.getLogger(__name__)
+
+
+#: The number of threads used to decode and scale images. The threads
+#: are shared by all thumbnail models.
+DECODE_THREADS = 2
+
+
+#: The nominal number of bytes counted against the size of the icon
+#: cache for an image which could not be read. This bounds the number
+#: of failed images which are remembered.
+FAILED_IMAGE_BYTES = 1024
+
+
+#: The queue of decoding jobs shared by all thumbnail models, which is
+#: created along with the decoding threads on the first submission.
+_decode_jobs = None
+
+
+#: The lock which protects the creation of the decoding threads.
+_decode_lock = Lock()
+
+
+def _decode_worker(jobs):
+    """ The target of the threads which decode and scale the images 
+    of thumbnails. Each job is a (model_ref, image, size) tuple.
+    Last-in jobs run first, so the most recently shown thumbnails are
+    decoded first. The jobs of models which have been garbage 
+    collected are skipped.
+
+    """
+    while True:
+        model_ref, image, size = jobs.get()
+        model = model_ref()
+        if model is None:
+            continue
+        try:
+            model._decode(image, size)
+        except Exception:
+            logger.exception('Error decoding thumbnail image %r', image)
+        # Do not hold the model or the image while waiting for the 
+        # next job.
+        del model, image
+
+
+def _submit_decode(model, image, size):
+    """ Submits a job to decode the given image for the given model,
+    starting the shared decoding threads if necessary. The model is
+    weakly referenced by the job.
+
+    """
+    global _decode_jobs
+    with _decode_lock:
+        jobs = _decode_jobs
+        if jobs is None:
+            jobs = _decode_jobs = LifoQueue()
+            for idx in xrange(DECODE_THREADS):
+                thread = Thread(
+                    target=_decode_worker, args=(jobs,),
+                    name='ThumbnailDecoder-%d' % idx,
+                )
+                thread.daemon = True
+                thread.start()
+    jobs.put((ref(model), image, size))
+
+
 def _refresh_data(func):
     """ A method decorator which will trigger a refresh of all data in 
     a list model. This assumes that the data in the list model is in 
@@ -33,12 +106,20 @@ def _refresh_data(func):
     return closure
 
 
-class ThumbnailModel(AbstractListModel):
+class ThumbnailModel(RowSequenceMixin, AbstractListModel):
     """ A concrete list model implementation which displays a list of
     thumbnails.
 
+    The images of the thumbnails are read and scaled by a pool of 
+    background threads the first time they are shown, and the icons 
+    created from them are kept in a least recently used cache which is
+    bounded by the size of the icon data. A placeholder icon is shown
+    until the icon for a thumbnail is ready, and in place of the icon
+    of an image which could not be read.
+
     """
-    def __init__(self, thumbs=None):
+    def __init__(self, thumbs=None, icon_size=None, placeholder=None,
+                 cache_bytes=64 * 1024 * 1024):
         """ Initialize a ThumbnailModel
 
         Parameters
@@ -46,10 +127,30 @@ class ThumbnailModel(AbstractListModel):
         thumbs : list, optional
             An initial list of Thumbnail objects to be used by the model.
 
+        icon_size : (width, height) or None, optional
+            The size to which images are scaled, preserving the aspect
+            ratio, before the icons are created. If None, the images 
+            are used at full size. The default is None.
+
+        placeholder : Icon or None, optional
+            The icon to show for a thumbnail while its icon is being
+            created. The default is None.
+
+        cache_bytes : int, optional
+            The maximum number of bytes of image data for the cached
+            icons. The default is 64MB.
+
         """
         self._thumbs = thumbs[:] if thumbs is not None else []
         self._toolkit = Toolkit.active_toolkit()
         self._icon_cls = self._toolkit['Icon']
+        self._image_cls = self._toolkit['Image']
+        self._icon_size = icon_size
+        self._placeholder = placeholder
+        self._cache_bytes = cache_bytes
+        self._cached_bytes = 0
+        self._icons = OrderedDict()
+        self._pending = {}
 
     #--------------------------------------------------------------------------
     # Abstract List Model Implementation
@@ -78,62 +179,152 @@ class ThumbnailModel(AbstractListModel):
     
     def decoration(self, index):
         """ Returns the icon for the given row. The icons are created
-        on the fly from the images contained in the thumbnails.
+        from the images contained in the thumbnails in the background,
+        and the placeholder icon is returned until it is ready.
 
         """
-        image = self._thumbs[index.row].image
-        return self._icon_cls.from_image(image)
+        row = index.row
+        image = self._thumbs[row].image
+        key = self._cache_key(image)
+        icons = self._icons
+        item = icons.pop(key, None)
+        if item is not None:
+            image_ref, icon, nbytes = item
+            if image_ref is None or image_ref() is image:
+                icons[key] = item
+                # A failed image is cached with an icon of None.
+                if icon is None:
+                    return self._placeholder
+                return icon
+            # The key was the id of an image which no longer exists.
+            self._cached_bytes -= nbytes
+        if key not in self._pending:
+            self._pending[key] = row
+            _submit_decode(self, image, self._icon_size)
+        return self._placeholder
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    @staticmethod
+    def _cache_key(image):
+        """ Returns the key of the icon cache for the given image. The
+        thumbnails of the same file path share a key. An image object 
+        is keyed on its id so that the cache does not keep the full 
+        size image alive. The cached entry holds a weak reference to
+        the image to detect the reuse of the id by another image.
+
+        """
+        if isinstance(image, basestring):
+            return image
+        return id(image)
+
+    def _decode(self, image, size):
+        """ Read and scale the given image on a decoding thread and
+        post the result to the main gui thread. If the image cannot be
+        read, the failure is logged and None is posted instead.
+
+        """
+        try:
+            if isinstance(image, basestring):
+                scaled = self._image_cls.from_file(image)
+            else:
+                scaled = image
+            if size is not None:
+                width, height = scaled.size
+                if width > size[0] or height > size[1]:
+                    scaled = scaled.scale(size, preserve_aspect_ratio=True)
+        except Exception:
+            logger.exception('Error decoding thumbnail image %r', image)
+            scaled = None
+        self._toolkit.app.call_on_main(self._icon_ready, image, scaled)
+
+    def _icon_ready(self, image, scaled):
+        """ Create the icon for a decoded image on the main gui thread,
+        add it to the cache, and refresh the row of the thumbnail. An
+        image which could not be decoded is cached with an icon of None
+        so that it is not decoded again. The failed image is counted 
+        as 'FAILED_IMAGE_BYTES' against the size of the cache, so that
+        it is eventually evicted.
+
+        """
+        key = self._cache_key(image)
+        row = self._pending.pop(key, None)
+        if scaled is None:
+            icon = None
+            nbytes = FAILED_IMAGE_BYTES
+        else:
+            icon = self._icon_cls.from_image(scaled)
+            width, height = scaled.size
+            nbytes = width * height * 4
+        if isinstance(image, basestring):
+            image_ref = None
+        else:
+            image_ref = ref(image)
+        icons = self._icons
+        old = icons.pop(key, None)
+        if old is not None:
+            self._cached_bytes -= old[2]
+        icons[key] = (image_ref, icon, nbytes)
+        self._cached_bytes += nbytes
+        while self._cached_bytes > self._cache_bytes and len(icons) > 1:
+            old = icons.popitem(last=False)[1]
+            self._cached_bytes -= old[2]
+
+        # The thumbnails may have moved since the icon was requested.
+        thumbs = self._thumbs
+        if row is None or row >= len(thumbs) or thumbs[row].image is not image:
+            for row, thumb in enumerate(thumbs):
+                if thumb.image is image:
+                    break
+            else:
+                return
+        index = self.index(row, 0)
+        self.notify_data_changed(index, index)
+
+    def _row_sequence(self):
+        """ Returns the list of thumbnails which holds the rows of the
+        model.
+
+        """
+        return self._thumbs
+
     def _insert(self, idx, thumb):
         """ Inserts the given thumbnail or list of thumbnails at the 
         given index and triggers the appropriate data refresh.
 
         """
         if isinstance(thumb, Thumbnail):
-            self.begin_insert_rows(None, idx, idx)
-            self._thumbs.insert(idx, thumb)
-            self.end_insert_rows(None, idx, idx)
-        else:
-            last = idx + len(thumb) - 1
-            self.begin_insert_rows(None, idx, last)
-            old = self._thumbs
-            new = old[:idx] + thumb + old[idx:]
-            self._thumbs = new
-            self.end_insert_rows(None, idx, last)
+            thumb = (thumb,)
+        self.insert_rows(idx, thumb)
 
     def _append(self, thumb):
         """ Appends the given thumbnail to the model and triggers the
         appropriate data refresh.
 
         """
-        idx = len(self._thumbs)
-        self.begin_insert_rows(None, idx, idx)
-        self._thumbs.append(thumb)
-        self.end_insert_rows(None, idx, idx)
+        self.append_rows((thumb,))
 
     def _extend(self, thumbs):
         """ Extends the model with the given thumbnails and triggers
         the appropriate data refresh.
 
         """
-        idx = len(self._thumbs)
-        last = idx + len(thumbs) - 1
-        self.begin_insert_rows(None, idx, last)
-        self._thumbs.extend(thumbs)
-        self.end_insert_rows(None, idx, last)
+        self.append_rows(thumbs)
 
     def _remove(self, idx, count):
         """ Removes the given number of thumbnails starting at the
         given index.
 
         """
-        last = idx + count - 1
-        self.begin_remove_rows(None, idx, last)
-        del self._thumbs[idx:last+1]
-        self.end_remove_rows(None, idx, last)
+        self.remove_rows(idx, count)
+
+    def _move(self, idx, count, destination):
+        """ Moves the given number of thumbnails starting at the given
+        index to before the destination index.
+
+        """
+        self.move_rows(idx, count, destination)
 
     def _set_thumbnails(self, thumbs):
         """ Resets the model using the given thumbnails.
@@ -232,6 +423,30 @@ class ThumbnailModel(AbstractListModel):
         """
         self._toolkit.app.call_on_main(self._remove, idx, count)
 
+    def move(self, idx, count, destination):
+        """ Move the specified thumbnails within the model.
+
+        Parameters
+        ----------
+        idx : int
+            The starting index of the chunk of thumbnails to move.
+
+        count : int
+            The number of thumbnails to move.
+
+        destination : int
+            The index, from before the move, of the thumbnail before
+            which the moved thumbnails are placed. It must not fall
+            within the chunk being moved.
+
+        Notes
+        -----
+        This method is thread safe. The actual update will occur on the
+        main gui thread.
+
+        """
+        self._toolkit.app.call_on_main(self._move, idx, count, destination)
+
     def thumbnail(self, index):
         """ Returns the thumbnail for the given model index.
 
@@ -278,6 +278,17 @@ class StyleSheet(HasStrictTraits):
     # A counter that is used
     _counter = Instance(itertools.count, ())
 
+    # Maps an index key to the set of Selectors which can only match
+    # nodes with that key. The keys are ('*',), ('type', node_type), 
+    # ('id', node_id), ('class', node_class) and ('qual', node_type, 
+    # node_class). This is a plain dict for speed.
+    _selector_index = Any
+
+    # Maps a (node_type, node_id, node_classes) key to a dict of the
+    # resolved tag -> StyleValue for nodes with that key. This is a
+    # plain dict for speed, and is cleared when the sheet changes.
+    _resolved = Any
+
     updated = Event
 
     def __init__(self,  *styles):
@@ -292,6 +303,8 @@ class StyleSheet(HasStrictTraits):
         super(StyleSheet, self).__init__()
         self._selectors = {}
         self._property_selectors = {}
+        self._selector_index = {}
+        self._resolved = {}
         self._parse_styles(*styles)
 
     def _parse_styles(self, *styles):
@@ -380,14 +393,70 @@ class StyleSheet(HasStrictTraits):
                     continue
 
         property_selectors = self._property_selectors
+        selector_index = self._selector_index
         updated_properties = set()
         for selector in updated_selectors:
             for key in selector.properties:
                 property_selectors.setdefault(key, set()).add(selector)
                 updated_properties.add(key)
+            for key in self._index_keys(selector):
+                selector_index.setdefault(key, set()).add(selector)
+
+        self._resolved = {}
 
         return updated_properties
 
+    @staticmethod
+    def _index_keys(selector):
+        """ A private method which returns the index keys of the nodes
+        which the given selector can match.
+
+        """
+        if isinstance(selector, TypeSelector):
+            return [('type', selector.node_type)]
+        if isinstance(selector, ClassSelector):
+            return [('class', cls) for cls in selector.node_classes]
+        if isinstance(selector, QualSelector):
+            node_type = selector.node_type
+            return [('qual', node_type, cls) for cls in selector.node_classes]
+        if isinstance(selector, IDSelector):
+            return [('id', selector.node_id)]
+        return [('*',)]
+
+    def _resolve(self, node_data, node_type, node_id, node_classes):
+        """ A private method which computes the dict of tag -> 
+        StyleValue for the given node by matching the selectors which 
+        are indexed by the node's type, id, and classes.
+
+        """
+        selector_index = self._selector_index
+        keys = [('*',), ('type', node_type), ('id', node_id)]
+        for node_class in node_classes:
+            keys.append(('class', node_class))
+            keys.append(('qual', node_type, node_class))
+
+        candidates = set()
+        for key in keys:
+            selectors = selector_index.get(key)
+            if selectors:
+                candidates.update(selectors)
+
+        specs = []
+        for selector in candidates:
+            match, spec = selector.match(node_data)
+            if match:
+                specs.append(spec)
+        specs.sort()
+
+        # The most specific selector with a given tag is applied last.
+        resolved = {}
+        for spec in specs:
+            for tag, value in spec[2].iteritems():
+                resolved[tag] = value
+        for tag, value in resolved.iteritems():
+            resolved[tag] = StyleValue(value)
+        return resolved
+
     def update(self, *styles):
         """ Update the style sheet with the given style objects.
 
@@ -412,6 +481,7 @@ class StyleSheet(HasStrictTraits):
         """
         self._selectors = {}
         self._property_selectors = {}
+        self._selector_index = {}
         self._counter = itertools.count()
         self.updated = self._parse_styles(*styles)
 
@@ -435,20 +505,22 @@ class StyleSheet(HasStrictTraits):
             the sheet, or NO_STYLE if no match is found.
 
         """
-        selectors = self._property_selectors.get(tag)
-        if not selectors:
+        if tag not in self._property_selectors:
             return NO_STYLE
 
-        matches = (selector.match(node_data) for selector in selectors)
-        specs = (spec for match, spec in matches if match)
-
-        # If there are no matches, max will bail on the empty sequence.
-        try:
-            res = StyleValue(max(specs)[2][tag])
-        except ValueError:
-            res = NO_STYLE
-
-        return res
+        # The selectors only depend on the type, id, and classes of the
+        # node, so the resolved styles are shared by nodes which have 
+        # the same values.
+        node_type = node_data.node_type()
+        node_id = node_data.node_id()
+        node_classes = tuple(node_data.node_classes())
+        key = (node_type, node_id, node_classes)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self._resolve(node_data, node_type, node_id, node_classes)
+            self._resolved[key] = resolved
+
+        return resolved.get(tag, NO_STYLE)
 
     def get_tags(self):
         """ Returns an iterable of all the tags in the style_sheet.
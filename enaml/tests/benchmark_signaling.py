@@ -0,0 +1,98 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A micro-benchmark of the emission of a signal to bound methods.
+
+The emission is timed against a reference which resolves each bound
+method connection on every emission, as the signal connections did
+before emission used a snapshot of the resolved callables. The timings
+depend on the machine, so this is run as a script rather than as part
+of the test suite:
+
+    python -m enaml.tests.benchmark_signaling
+
+"""
+from timeit import repeat
+from types import MethodType
+from weakref import ref
+
+from enaml.core.signaling import Signal
+
+
+class Emitter(object):
+
+    changed = Signal()
+
+
+class Sink(object):
+
+    def slot(self, *args, **kwargs):
+        pass
+
+
+class _ReferenceConnection(object):
+    """ A connection which resolves its bound method on every call.
+
+    """
+    __slots__ = ('im_func', 'im_self_ref', 'im_class')
+
+    def __init__(self, method):
+        self.im_func = method.im_func
+        self.im_self_ref = ref(method.im_self)
+        self.im_class = method.im_class
+
+    def __call__(self, args, kwargs):
+        im_self = self.im_self_ref()
+        if im_self is not None:
+            method = MethodType(self.im_func, im_self, self.im_class)
+            method(*args, **kwargs)
+
+
+def benchmark(connections=8, number=5000, repeats=7):
+    """ Time the emission of a signal and of the reference.
+
+    Parameters
+    ----------
+    connections : int, optional
+        The number of bound methods connected to the signal. The
+        default is 8.
+
+    number : int, optional
+        The number of emissions per timing. The default is 5000.
+
+    repeats : int, optional
+        The number of timings, of which the best is kept. The default
+        is 7.
+
+    Returns
+    -------
+    result : (float, float)
+        The best (emit_time, reference_time) in seconds per emission.
+
+    """
+    sinks = [Sink() for idx in xrange(connections)]
+    emitter = Emitter()
+    for sink in sinks:
+        emitter.changed.connect(sink.slot)
+
+    conns = [_ReferenceConnection(sink.slot) for sink in sinks]
+    def reference(*args, **kwargs):
+        for conn in conns:
+            conn(args, kwargs)
+
+    signal = emitter.changed
+    emit = lambda: signal(1)
+    emit_reference = lambda: reference(1)
+    emit_time = min(repeat(emit, number=number, repeat=repeats))
+    reference_time = min(repeat(emit_reference, number=number, repeat=repeats))
+    return (emit_time / number, reference_time / number)
+
+
+if __name__ == '__main__':
+    for connections in (1, 8, 32):
+        emit_time, reference_time = benchmark(connections)
+        print '%2d connections: emit %.2fus, reference %.2fus (%.1fx)' % (
+            connections, emit_time * 1e6, reference_time * 1e6,
+            reference_time / emit_time,
+        )
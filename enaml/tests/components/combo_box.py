@@ -4,6 +4,8 @@
 #------------------------------------------------------------------------------
 from .enaml_test_case import EnamlTestCase, required_method
 
+from enaml.components.combo_box import ComboBox
+
 
 class TestComboBox(EnamlTestCase):
     """ Logic for testing combo boxes.
@@ -107,6 +109,64 @@ enamldef MainView(MainWindow):
         component.items.pop(0)
         self.test_items()
 
+    def test_replace_items_in_place(self):
+        """ Replace and reorder items on the Enaml side; see if the
+        toolkit widget and the selection update.
+
+        """
+        component = self.component
+        component.items[0:2] = [hex, float, int]
+        self.test_items()
+        self.assertEqual(component.index, 1)
+        component.items.reverse()
+        self.test_items()
+        self.assertEqual(component.index, 2)
+        del component.items[::2]
+        self.test_items()
+        self.assertEqual(component.index, -1)
+        self.assertEqual(self.events, [])
+
+    def test_labels_updated_in_place(self):
+        """ Check that in-place changes to the items fire labels_updated
+        instead of a change to the labels.
+
+        """
+        component = self.component
+        events = []
+        handler = lambda name, new: events.append((name, new))
+        component.on_trait_change(handler, 'labels')
+        component.on_trait_change(handler, 'labels_updated')
+        component.items.append(hex)
+        component.items.insert(1, 'a')
+        component.items.pop(0)
+        to_string = component.to_string
+        expected = [
+            ('labels_updated', (3, 0, [to_string(hex)])),
+            ('labels_updated', (1, 0, ['a!'])),
+            ('labels_updated', (0, 1, [])),
+        ]
+        self.assertEqual(events, expected)
+        labels = map(to_string, component.items)
+        self.assertEqual(component.labels, labels)
+        self.test_items()
+
+    def test_labels_cold_cache(self):
+        """ Check that the labels are correct after an in-place change
+        when they have not been computed before the change.
+
+        """
+        component = ComboBox(items=['a', 'b', 'c'], value='c')
+        events = []
+        handler = lambda name, new: events.append((name, new))
+        component.on_trait_change(handler, 'labels')
+        component.on_trait_change(handler, 'labels_updated')
+        component.on_trait_change(handler, 'index')
+        component.items.append('d')
+        component.items.insert(0, 'z')
+        self.assertEqual(component.labels, ['z', 'a', 'b', 'c', 'd'])
+        self.assertEqual(component.index, 3)
+        self.assertEqual(events, [('index', 2), ('index', 3)])
+
     def test_deselect(self):
         """ Assert that an invalid value sets the index to -1.
 
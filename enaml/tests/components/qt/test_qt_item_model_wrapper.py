@@ -0,0 +1,151 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.backends.qt.qt.QtCore import Qt, QModelIndex
+from enaml.backends.qt import abstract_item_model_wrapper
+from enaml.backends.qt.abstract_item_model_wrapper import (
+    AbstractItemModelWrapper, PREFETCH_ROWS, PREFETCH_COLUMNS,
+)
+from enaml.core.item_model import AbstractItemModel, AbstractTableModel
+
+
+class BlockTableModel(AbstractTableModel):
+    """ A table model which provides its data in bulk and records the
+    blocks which are fetched.
+
+    """
+    def __init__(self, rows=1000, columns=100):
+        self.rows = rows
+        self.columns = columns
+        self.offset = 0
+        self.fetched = []
+
+    def row_count(self, parent=None):
+        if parent is None:
+            return self.rows
+        return 0
+
+    def column_count(self, parent=None):
+        if parent is None:
+            return self.columns
+        return 0
+
+    def data(self, index):
+        return index.row * 1000 + index.column + self.offset
+
+    def data_block(self, rows, columns, role='data'):
+        self.fetched.append((role, rows[0], columns[0]))
+        return super(BlockTableModel, self).data_block(rows, columns, role)
+
+
+class ChildTreeModel(AbstractItemModel):
+    """ A tree model with a single top-level item whose children carry
+    a None context.
+
+    """
+    def data_block(self, rows, columns, role='data'):
+        return [['block'] * len(columns) for row in rows]
+
+    def row_count(self, parent=None):
+        if parent is None:
+            return 1
+        if parent.context == 'root':
+            return 3
+        return 0
+
+    def column_count(self, parent=None):
+        return 1
+
+    def index(self, row, column, parent=None):
+        if parent is None:
+            return self.create_index(row, column, 'root')
+        return self.create_index(row, column, None)
+
+    def parent(self, index):
+        if index.context is None:
+            return self.create_index(0, 0, 'root')
+        return None
+
+    def data(self, index):
+        return '%s %d' % (index.context, index.row)
+
+
+class TestQtDataBlocks(unittest.TestCase):
+
+    def setUp(self):
+        self.model = BlockTableModel()
+        self.wrapper = AbstractItemModelWrapper(self.model)
+
+    def data(self, row, column):
+        wrapper = self.wrapper
+        q_index = wrapper.index(row, column, QModelIndex())
+        return wrapper.data(q_index, Qt.DisplayRole)
+
+    def test_block_data(self):
+        """ Test that the items of a block are served from a single
+        fetch of the block.
+
+        """
+        self.assertEqual(self.data(0, 0), 0)
+        self.assertEqual(self.data(5, 7), 5007)
+        self.assertEqual(self.data(PREFETCH_ROWS, 1), PREFETCH_ROWS * 1000 + 1)
+        self.assertEqual(
+            self.model.fetched, [('data', 0, 0), ('data', PREFETCH_ROWS, 0)],
+        )
+
+    def test_data_changed_discards_intersecting_blocks(self):
+        """ Test that a data change only discards the blocks which
+        contain the changed items.
+
+        """
+        model = self.model
+        self.data(0, 0)
+        self.data(PREFETCH_ROWS, 0)
+        self.data(0, PREFETCH_COLUMNS)
+        model.offset = 1
+        index = model.index(3, 4)
+        model.notify_data_changed(index, index)
+        del model.fetched[:]
+        self.assertEqual(self.data(3, 4), 3005)
+        self.assertEqual(self.data(PREFETCH_ROWS, 0), PREFETCH_ROWS * 1000)
+        self.assertEqual(self.data(0, PREFETCH_COLUMNS), PREFETCH_COLUMNS)
+        self.assertEqual(model.fetched, [('data', 0, 0)])
+
+    def test_least_recently_used_block_discarded(self):
+        """ Test that the least recently used block is discarded when
+        the number of blocks reaches the limit.
+
+        """
+        model = self.model
+        limit = abstract_item_model_wrapper.MAX_PREFETCH_BLOCKS
+        abstract_item_model_wrapper.MAX_PREFETCH_BLOCKS = 2
+        try:
+            self.data(0, 0)
+            self.data(PREFETCH_ROWS, 0)
+            self.data(0, 0)
+            self.data(2 * PREFETCH_ROWS, 0)
+            del model.fetched[:]
+            self.data(0, 0)
+            self.assertEqual(model.fetched, [])
+            self.data(PREFETCH_ROWS, 0)
+            self.assertEqual(model.fetched, [('data', PREFETCH_ROWS, 0)])
+        finally:
+            abstract_item_model_wrapper.MAX_PREFETCH_BLOCKS = limit
+
+    def test_child_items_not_served_from_blocks(self):
+        """ Test that the children of a tree model are not served from
+        the top-level blocks, even if their context is None.
+
+        """
+        wrapper = AbstractItemModelWrapper(ChildTreeModel())
+        top = wrapper.index(0, 0, QModelIndex())
+        child = wrapper.index(2, 0, top)
+        self.assertEqual(wrapper.data(top, Qt.DisplayRole), 'block')
+        self.assertEqual(wrapper.data(child, Qt.DisplayRole), 'None 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
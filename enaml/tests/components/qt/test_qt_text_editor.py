@@ -0,0 +1,26 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt_test_assistant import QtTestAssistant
+
+from .. import text_editor
+
+
+class TestQtTextEditor(QtTestAssistant, text_editor.TestTextEditor):
+    """ QtTextEditor tests.
+
+    """
+    def type_text(self, widget, text):
+        """ Simulate typing text at the cursor of the editor.
+
+        """
+        widget.insertPlainText(text)
+
+    def set_cursor_position(self, widget, index):
+        """ Set the cursor position of the editor.
+
+        """
+        cursor = widget.textCursor()
+        cursor.setPosition(index)
+        widget.setTextCursor(cursor)
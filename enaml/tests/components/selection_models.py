@@ -239,17 +239,22 @@ enamldef MainView(MainWindow):
         """
         self.assertEqual(self.component.selected_rows, [])
         self.component.selected_rows = [2, 3, 5, 6]
-        pysel = [((2, 0), (2, 9)), ((3, 0), (3, 9)), ((5, 0), (5, 9)), ((6, 0), (6, 9))]
+        pysel = [((2, 0), (3, 9)), ((5, 0), (6, 9))]
         self.assertEqual(self.get_tk_selection(self.widget), pysel)
         self.assertEqual(self.get_py_selection(), pysel)
 
         self.component.selected_rows.append(7)
-        new = pysel + [((7, 0), (7, 9))]
+        new = [((2, 0), (3, 9)), ((5, 0), (7, 9))]
         self.assertEqual(self.get_tk_selection(self.widget), new)
         self.assertEqual(self.get_py_selection(), new)
 
         del self.component.selected_rows[1]
-        del new[1]
+        new = [((2, 0), (2, 9)), ((5, 0), (7, 9))]
+        self.assertEqual(self.get_tk_selection(self.widget), new)
+        self.assertEqual(self.get_py_selection(), new)
+
+        self.component.selected_rows = [2, 5, 6]
+        new = [((2, 0), (2, 9)), ((5, 0), (6, 9))]
         self.assertEqual(self.get_tk_selection(self.widget), new)
         self.assertEqual(self.get_py_selection(), new)
 
@@ -0,0 +1,117 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .enaml_test_case import EnamlTestCase, required_method
+
+
+class TestTextEditor(EnamlTestCase):
+    """ Logic for testing text editors.
+
+    Tooklit testcases need to provide the following methods:
+
+    Abstract Methods
+    ----------------
+    type_text
+        Simulates the user typing text at the cursor of the widget.
+
+    set_cursor_position
+        Sets the cursor position of the widget.
+
+    Notes
+    -----
+    All the provided methods need to support the extented signature
+    <method>(widget, ...).
+
+    """
+    def setUp(self):
+        """ Set up tests for Enaml's TextEditor widget.
+
+        """
+        enaml_source = """
+enamldef MainView(MainWindow):
+    attr events
+    TextEditor:
+        name = 'editor'
+        text_delta :: events.append(('text_delta', event.new))
+        text_edited :: events.append(('text_edited', None))
+"""
+        self.events = []
+        self.view = self.parse_and_create(enaml_source, events=self.events)
+        self.component = self.component_by_name(self.view, 'editor')
+        self.widget = self.component.toolkit_widget
+
+    def deltas(self):
+        return [value for name, value in self.events if name == 'text_delta']
+
+    def edits(self):
+        return [name for name, value in self.events if name == 'text_edited']
+
+    def test_set_text(self):
+        """ Test that setting the text reports the whole text as added,
+        with line breaks and without the final paragraph separator, and
+        that it is not reported as an edit.
+
+        """
+        self.component.set_text(u'ab\ncd')
+        position, removed, added = self.deltas()[-1]
+        self.assertEqual((position, added), (0, u'ab\ncd'))
+        self.assertEqual(self.edits(), [])
+        self.assertFalse(self.component.modified)
+        self.assertEqual(self.component.get_text(), u'ab\ncd')
+
+    def test_append_text(self):
+        """ Test that appending text reports only the appended text and
+        that it is not reported as an edit.
+
+        """
+        self.component.set_text(u'ab')
+        del self.events[:]
+        self.component.append_text(u'\ncd')
+        self.assertEqual(self.deltas(), [(2, 0, u'\ncd')])
+        self.assertEqual(self.edits(), [])
+        self.assertFalse(self.component.modified)
+        self.assertEqual(self.component.get_text(), u'ab\ncd')
+
+    def test_typed_text(self):
+        """ Test that typed text is reported at the cursor position and
+        as an edit.
+
+        """
+        self.component.set_text(u'ab\ncd')
+        del self.events[:]
+        self.set_cursor_position(self.widget, 4)
+        self.type_text(self.widget, u'X')
+        self.assertEqual(self.deltas(), [(4, 0, u'X')])
+        self.assertEqual(self.edits(), ['text_edited'])
+        self.assertTrue(self.component.modified)
+        self.assertEqual(self.component.get_text(), u'ab\ncXd')
+
+    def test_typed_line_break(self):
+        """ Test that a typed line break is reported as a line break
+        rather than a paragraph separator.
+
+        """
+        self.component.set_text(u'ab')
+        del self.events[:]
+        self.set_cursor_position(self.widget, 1)
+        self.type_text(self.widget, u'\n')
+        self.assertEqual(self.deltas(), [(1, 0, u'\n')])
+        self.assertEqual(self.component.get_text(), u'a\nb')
+
+    #--------------------------------------------------------------------------
+    # Abstract methods
+    #--------------------------------------------------------------------------
+    @required_method
+    def type_text(self, widget, text):
+        """ Simulate typing text at the cursor of the widget.
+
+        """
+        pass
+
+    @required_method
+    def set_cursor_position(self, widget, index):
+        """ Set the cursor position of the widget.
+
+        """
+        pass
@@ -0,0 +1,105 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import locale
+import unittest
+
+from enaml.localization import SnapshotLocale, SystemLocale
+from enaml.localization.snapshot_locale import _grouping_sizes, _group_digits
+
+
+class TestGrouping(unittest.TestCase):
+
+    def test_grouping_sizes(self):
+        self.assertEqual(_grouping_sizes([]), ())
+        self.assertEqual(_grouping_sizes([3, locale.CHAR_MAX]), (3,))
+        self.assertEqual(_grouping_sizes([3, 2, locale.CHAR_MAX]), (3, 2))
+        sizes = _grouping_sizes([3, 2, 0])
+        self.assertEqual(sizes[:4], (3, 2, 2, 2))
+        self.assertTrue(len(sizes) > 64)
+
+    def test_group_digits(self):
+        sizes = _grouping_sizes([3, 0])
+        self.assertEqual(_group_digits('1234567', sizes, ','), '1,234,567')
+        self.assertEqual(_group_digits('-123456', sizes, ','), '-123,456')
+        self.assertEqual(_group_digits('123', sizes, ','), '123')
+        self.assertEqual(_group_digits('12345.678', sizes, ','), '12,345.678')
+        self.assertEqual(_group_digits('nan', sizes, ','), 'nan')
+        self.assertEqual(_group_digits('1234567', (), ','), '1234567')
+
+    def test_group_digits_indian(self):
+        sizes = _grouping_sizes([3, 2, 0])
+        self.assertEqual(_group_digits('12345678', sizes, ','), '1,23,45,678')
+
+    def test_group_digits_limited(self):
+        sizes = _grouping_sizes([3, locale.CHAR_MAX])
+        self.assertEqual(_group_digits('1234567', sizes, '.'), '1234.567')
+
+
+class TestSnapshotLocale(unittest.TestCase):
+    """ Checks that a SnapshotLocale agrees with the SystemLocale for
+    the current system locale.
+
+    """
+    def setUp(self):
+        self.system = SystemLocale.default()
+        self.snapshot = SnapshotLocale.default()
+
+    def test_properties(self):
+        names = (
+            'name', 'encoding', 'am_string', 'pm_string', 'decimal_point',
+            'monetary_decimal_point', 'exponential', 'thousands_separator',
+            'monetary_thousands_separator', 'negative_sign', 'positive_sign',
+        )
+        for name in names:
+            self.assertEqual(
+                getattr(self.snapshot, name), getattr(self.system, name),
+            )
+
+    def test_names_and_formats(self):
+        system = self.system
+        snapshot = self.snapshot
+        for abbr in (False, True):
+            for month in range(0, 14):
+                self.assertEqual(
+                    snapshot.month_name(month, abbr),
+                    system.month_name(month, abbr),
+                )
+            for day in range(0, 9):
+                self.assertEqual(
+                    snapshot.day_name(day, abbr), system.day_name(day, abbr),
+                )
+            self.assertEqual(
+                snapshot.time_format(abbr), system.time_format(abbr),
+            )
+            self.assertEqual(
+                snapshot.date_format(abbr), system.date_format(abbr),
+            )
+            self.assertEqual(
+                snapshot.datetime_format(abbr), system.datetime_format(abbr),
+            )
+
+    def test_numbers(self):
+        system = self.system
+        snapshot = self.snapshot
+        for value in (0, 7, -42, 1234567, -9876543210):
+            for group in (False, True):
+                text = system.from_int(value, group=group)
+                self.assertEqual(snapshot.from_int(value, group=group), text)
+                self.assertEqual(snapshot.to_int(text), system.to_int(text))
+        for value in (0.0, 1.5, -1234.25, 1e20, 3.14159e-7):
+            for prec in (-1, 3, 12):
+                text = system.from_float(value, prec=prec)
+                self.assertEqual(snapshot.from_float(value, prec=prec), text)
+                self.assertEqual(snapshot.to_float(text), system.to_float(text))
+
+    def test_refresh(self):
+        snapshot = self.snapshot
+        snapshot._decimal_point = u'?'
+        snapshot.refresh()
+        self.assertEqual(snapshot.decimal_point, self.system.decimal_point)
+
+
+if __name__ == '__main__':
+    unittest.main()
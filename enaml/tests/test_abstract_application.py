@@ -0,0 +1,177 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.components.abstract_application import AbstractTkApplication
+
+
+class ManualApplication(AbstractTkApplication):
+    """ An application which queues the main thread calls so that the 
+    test can run them one event loop trip at a time.
+
+    """
+    def __init__(self):
+        super(ManualApplication, self).__init__()
+        self.posted = []
+
+    def run_next(self):
+        callback, args, kwargs = self.posted.pop(0)
+        callback(*args, **kwargs)
+
+    def call_on_main(self, callback, *args, **kwargs):
+        self.posted.append((callback, args, kwargs))
+
+    def initialize(self, *args, **kwargs):
+        pass
+
+    def start_event_loop(self):
+        pass
+
+    def event_loop_running(self):
+        return True
+
+    def app_object(self):
+        return None
+
+    def is_main_thread(self):
+        return True
+
+    def timer(self, ms, callback, *args, **kwargs):
+        pass
+
+    def process_events(self):
+        pass
+
+
+class HookedLock(object):
+    """ A heap lock which calls a hook once after it is released by the
+    drain of the heap, to stand in for another thread which schedules
+    a task at that moment.
+
+    """
+    def __init__(self, app, hook):
+        self.app = app
+        self.lock = app._AbstractTkApplication__heap_lock
+        self.hook = hook
+
+    def __enter__(self):
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        res = self.lock.__exit__(*args)
+        app = self.app
+        drained = not (
+            app._AbstractTkApplication__heap or
+            app._AbstractTkApplication__dispatching
+        )
+        if self.hook is not None and drained:
+            hook = self.hook
+            self.hook = None
+            hook()
+        return res
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.app = ManualApplication()
+        self.results = []
+
+    def test_one_task_per_trip(self):
+        """ Test that one task is run per event loop trip by default.
+
+        """
+        app = self.app
+        for idx in range(3):
+            app.schedule(self.results.append, (idx,))
+        self.assertEqual(len(app.posted), 1)
+        app.run_next()
+        self.assertEqual(self.results, [0])
+        app.run_next()
+        app.run_next()
+        self.assertEqual(self.results, [0, 1, 2])
+        app.run_next()
+        self.assertEqual(app.posted, [])
+        self.assertFalse(app.has_pending_tasks())
+
+    def test_batched_dispatch(self):
+        """ Test that all pending tasks are run in a single trip when the
+        batch time budget allows it, in priority order.
+
+        """
+        app = self.app
+        app.set_batch_time(10000)
+        app.schedule(self.results.append, (1,))
+        app.schedule(self.results.append, (0,), priority=0)
+        app.schedule(self.results.append, (2,), priority=100)
+        app.run_next()
+        self.assertEqual(self.results, [0, 1, 2])
+        self.assertEqual(app.posted, [])
+        stats = app.scheduler_stats()
+        self.assertEqual(stats['executed'], 3)
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['max_queue_depth'], 3)
+        self.assertEqual(stats['queue_depth'], 0)
+
+    def test_exception_reposts_batch(self):
+        """ Test that the remaining tasks are run after a task raises.
+
+        """
+        app = self.app
+        app.set_batch_time(10000)
+        app.schedule(lambda: 1/0)
+        app.schedule(self.results.append, (1,))
+        self.assertRaises(ZeroDivisionError, app.run_next)
+        app.run_next()
+        self.assertEqual(self.results, [1])
+
+    def test_schedule_after_drain(self):
+        """ Test that a task scheduled by another thread right after the
+        heap is drained is posted once.
+
+        """
+        app = self.app
+        app.schedule(self.results.append, (0,))
+        app.run_next()
+        app._AbstractTkApplication__heap_lock = HookedLock(
+            app, lambda: app.schedule(self.results.append, (1,)),
+        )
+        app.run_next()
+        self.assertEqual(len(app.posted), 1)
+        app.run_next()
+        self.assertEqual(self.results, [0, 1])
+        app.run_next()
+        self.assertEqual(app.posted, [])
+
+    def test_coalesce(self):
+        """ Test that tasks with an equal coalesce key collapse into the
+        pending task with the latest arguments.
+
+        """
+        app = self.app
+        append = self.results.append
+        key = ('append', id(self.results))
+        task = app.schedule(append, (0,), coalesce_key=key)
+        other = app.schedule(append, (1,), coalesce_key=key)
+        self.assertTrue(task is other)
+        app.schedule(append, (2,))
+        app.run_next()
+        app.run_next()
+        self.assertEqual(self.results, [1, 2])
+        self.assertEqual(app.scheduler_stats()['coalesced'], 1)
+
+        # A key which is no longer pending schedules a new task.
+        new = app.schedule(append, (3,), coalesce_key=key)
+        self.assertFalse(new is task)
+        new.unschedule()
+        newer = app.schedule(append, (4,), coalesce_key=key)
+        self.assertFalse(newer is new)
+        app.run_next()
+        app.run_next()
+        self.assertEqual(self.results, [1, 2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
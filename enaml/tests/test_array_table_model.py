@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+import numpy as np
+
+from enaml.stdlib.array_table_model import ArrayTableModel
+
+
+class TestArrayTableModel(unittest.TestCase):
+
+    def setUp(self):
+        self.array = np.arange(20, dtype=float).reshape((5, 4))
+        self.model = ArrayTableModel(self.array, formats={1: '%.1f'})
+        self.model.page_size = 2
+        self.changes = []
+        self.model.data_changed.connect(self.on_data_changed)
+
+    def on_data_changed(self, evt_arg):
+        self.changes.append(evt_arg)
+
+    def test_no_copy(self):
+        """ Test that the model shares the memory of the array.
+
+        """
+        self.assertTrue(self.model.array is self.array)
+        self.assertEqual(self.model.row_count(), 5)
+        self.assertEqual(self.model.column_count(), 4)
+
+    def test_formatting(self):
+        """ Test the per-column formats and the data_block results.
+
+        """
+        model = self.model
+        self.assertEqual(model.data(model.index(4, 0)), '16.0')
+        self.assertEqual(model.data(model.index(4, 1)), '17.0')
+        block = model.data_block(xrange(1, 4), [0, 1])
+        self.assertEqual(block, [['4.0', '5.0'], ['8.0', '9.0'], ['12.0', '13.0']])
+        block = model.data_block([0, 3], [2], 'edit_data')
+        self.assertEqual(block, [[2.0], [14.0]])
+        self.assertEqual(model.data_block(xrange(3), []), [[], [], []])
+
+    def test_float_precision(self):
+        """ Test that the default float format does not lose precision.
+
+        """
+        array = np.array([[1234567.89, 1.0 / 3]])
+        model = ArrayTableModel(array)
+        self.assertEqual(model.data(model.index(0, 0)), '1234567.89')
+        self.assertEqual(float(model.data(model.index(0, 1))), 1.0 / 3)
+
+    def test_notify_array_changed(self):
+        """ Test that in place changes update the rendered strings and
+        emit the covering ranges.
+
+        """
+        model = self.model
+        self.assertEqual(model.data(model.index(0, 0)), '0.0')
+        self.array[0, 0] = 100
+        self.array[3:5, 2:4] = -1
+        mask = np.zeros((5, 4), dtype=bool)
+        mask[0, 0] = True
+        mask[3:5, 2:4] = True
+        model.notify_array_changed(mask)
+        ranges = [
+            (tl.row, tl.column, br.row, br.column) for tl, br in self.changes
+        ]
+        self.assertEqual(ranges, [(0, 0, 0, 0), (3, 2, 4, 3)])
+        self.assertEqual(model.data(model.index(0, 0)), '100.0')
+        self.assertEqual(model.data(model.index(4, 3)), '-1.0')
+
+        del self.changes[:]
+        model.notify_array_changed((slice(1, 3), 1))
+        ranges = [
+            (tl.row, tl.column, br.row, br.column) for tl, br in self.changes
+        ]
+        self.assertEqual(ranges, [(1, 1, 2, 1)])
+
+        mask = np.zeros((4, 5), dtype=bool)
+        self.assertRaises(ValueError, model.notify_array_changed, mask)
+
+    def test_record_array(self):
+        """ Test that the fields of a record array are the columns.
+
+        """
+        array = np.array(
+            [(1, 2.5), (2, 3.5)], dtype=[('id', int), ('value', float)]
+        )
+        model = ArrayTableModel(array, editable=True)
+        self.assertEqual(model.column_count(), 2)
+        self.assertEqual(model.horizontal_header_data(1), 'value')
+        self.assertEqual(model.data(model.index(1, 1)), '3.5')
+        self.assertTrue(model.set_data(model.index(1, 1), 4.25))
+        self.assertEqual(array['value'][1], 4.25)
+        self.assertEqual(model.data(model.index(1, 1)), '4.25')
+        self.assertFalse(model.set_data(model.index(1, 0), 'x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
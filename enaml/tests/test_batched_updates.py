@@ -0,0 +1,182 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import logging
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.core import expressions
+from enaml.core.expressions import (
+    SubscriptionExpression, batched_updates, flush_updates,
+    set_scheduled_updates,
+)
+from enaml.core.monitors import TraitAttributeMonitor
+from enaml.core.toolkit import Toolkit
+
+
+class Model(HasTraits):
+
+    a = Int
+
+    b = Int
+
+
+class Owner(HasTraits):
+
+    total = Int
+
+
+class ScheduleApp(object):
+    """ A stand-in for the toolkit application which records the
+    scheduled callbacks.
+
+    """
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule(self, callback, args=None, kwargs=None, priority=50):
+        self.scheduled.append(callback)
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestBatchedUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.owner = Owner()
+        self.toolkit = Toolkit()
+        self.values = []
+        code = compile('model.a + model.b', '<test>', 'eval')
+        self.expr = SubscriptionExpression(
+            (TraitAttributeMonitor,), self.owner, 'total', code,
+            {'model': self.model}, {}, self.toolkit,
+        )
+        self.expr.expression_changed.connect(self.on_changed)
+        self.expr._update()
+        self.values = []
+        self.evals = 0
+        self.eval = self.expr.eval
+        self.expr.eval = self.counting_eval
+
+    def tearDown(self):
+        set_scheduled_updates(False)
+
+    def counting_eval(self):
+        self.evals += 1
+        return self.eval()
+
+    def on_changed(self, expr, name, value):
+        self.values.append(value)
+
+    def test_immediate(self):
+        """ Test that each change re-evaluates the expression outside
+        of a batch.
+
+        """
+        self.model.a = 1
+        self.model.b = 2
+        self.assertEqual(self.evals, 2)
+        self.assertEqual(self.values, [1, 3])
+
+    def test_batched(self):
+        """ Test that the changes in a batch re-evaluate the expression
+        once when the batch exits.
+
+        """
+        with batched_updates():
+            with batched_updates():
+                self.model.a = 1
+                self.model.b = 2
+                self.model.a = 3
+            self.assertEqual(self.evals, 0)
+        self.assertEqual(self.evals, 1)
+        self.assertEqual(self.values, [5])
+
+    def test_batched_no_op(self):
+        """ Test that a batch whose changes cancel out does not emit.
+
+        """
+        with batched_updates():
+            self.model.a = 1
+            self.model.a = 0
+        self.assertEqual(self.evals, 1)
+        self.assertEqual(self.values, [])
+
+    def test_scheduled(self):
+        """ Test that scheduled updates are flushed by a single task.
+
+        """
+        app = self.toolkit.app = ScheduleApp()
+        set_scheduled_updates(True)
+        self.model.a = 1
+        self.model.b = 2
+        self.assertEqual(app.scheduled, [flush_updates])
+        self.assertEqual(self.evals, 0)
+        app.scheduled.pop()()
+        self.assertEqual(self.evals, 1)
+        self.assertEqual(self.values, [3])
+
+    def test_scheduled_without_app(self):
+        """ Test that the updates are immediate if there is no toolkit
+        application with which to schedule the flush.
+
+        """
+        set_scheduled_updates(True)
+        self.model.a = 1
+        self.assertEqual(self.evals, 1)
+
+    def test_failed_update(self):
+        """ Test that an update which raises is logged and does not 
+        prevent the update of the other dirty expressions.
+
+        """
+        owner = Owner()
+        other = Model()
+        code = compile('1 / (other.a - 1)', '<test>', 'eval')
+        failing = SubscriptionExpression(
+            (TraitAttributeMonitor,), owner, 'total', code,
+            {'other': other}, {}, self.toolkit,
+        )
+        failing._update()
+        handler = ListHandler()
+        expressions.logger.addHandler(handler)
+        expressions.logger.propagate = False
+        try:
+            with batched_updates():
+                other.a = 1
+                self.model.a = 1
+                self.model.b = 2
+        finally:
+            expressions.logger.removeHandler(handler)
+            expressions.logger.propagate = True
+        self.assertEqual(len(handler.records), 1)
+        self.assertEqual(self.evals, 1)
+        self.assertEqual(self.values, [3])
+
+    def test_batch_body_raises(self):
+        """ Test that the expressions are updated when the body of a
+        batch raises, and that the exception propagates.
+
+        """
+        def body():
+            with batched_updates():
+                self.model.a = 1
+                self.model.b = 2
+                raise ValueError
+        self.assertRaises(ValueError, body)
+        self.assertEqual(self.evals, 1)
+        self.assertEqual(self.values, [3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.components.container import Container
+from enaml.components.group_box import GroupBox, AbstractTkGroupBox
+from enaml.core.base_component import BaseComponent
+from enaml.layout.constrainable import Constrainable
+from enaml.layout.geometry import Box
+
+
+class Node(BaseComponent, Constrainable):
+    """ A constrainable component which does not require a toolkit.
+
+    """
+    pass
+
+
+class StubTkGroupBox(AbstractTkGroupBox):
+    """ A toolkit group box which only provides the contents margins.
+
+    """
+    margins = Box(10, 5, 5, 5)
+
+    def get_contents_margins(self):
+        return self.margins
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+# The remaining abstract methods are not used by the tests.
+StubTkGroupBox.__abstractmethods__ = frozenset()
+
+
+class TestVisibilityInvalidation(unittest.TestCase):
+
+    def setUp(self):
+        # root -> (mid -> (leaf, hidden -> inner), sibling)
+        self.root = root = Node()
+        self.mid = mid = Node()
+        self.leaf = leaf = Node()
+        self.hidden = hidden = Node(visible=False)
+        self.inner = inner = Node()
+        self.sibling = sibling = Node()
+        root.add_subcomponent(mid)
+        root.add_subcomponent(sibling)
+        mid.add_subcomponent(leaf)
+        mid.add_subcomponent(hidden)
+        hidden.add_subcomponent(inner)
+        self.nodes = [root, mid, leaf, hidden, inner, sibling]
+        for node in self.nodes:
+            node._constraints_cache.update(
+                {'user': [], 'component': [], 'hard': []}
+            )
+
+    def cached(self):
+        return [
+            sorted(node._constraints_cache.keys()) for node in self.nodes
+        ]
+
+    def test_visible_changed(self):
+        """ Test that a visibility change discards the constraints of the
+        ancestors and the visible subtree only.
+
+        """
+        self.mid.visible = False
+        full = ['component', 'hard', 'user']
+        self.assertEqual(self.cached(), [
+            ['hard'], ['hard'], ['hard'], full, full, full,
+        ])
+
+
+class TestComputeConstraints(unittest.TestCase):
+
+    def setUp(self):
+        # container -> (first, second)
+        self.container = container = Container()
+        self.first = first = Node()
+        self.second = second = Node()
+        container.add_subcomponent(first)
+        container.add_subcomponent(second)
+        names = ('hard', 'padding', 'user', 'component')
+        container._constraints_cache.update(
+            dict((name, []) for name in names)
+        )
+        for node in (first, second):
+            node._constraints_cache.update(dict(
+                (name, [(node, name)])
+                for name in ('hard', 'size_hint', 'user', 'component')
+            ))
+
+    def test_reuse_clean_children(self):
+        """ Test that the cached constraints of the clean children are
+        reused after another child is invalidated.
+
+        """
+        container = self.container
+        first, second = self.first, self.second
+        container.compute_constraints()
+        first_cache = dict(first._constraints_cache)
+        second_cache = dict(second._constraints_cache)
+        first.invalidate_constraints('user')
+        cns = container.compute_constraints()
+        for name, cached in second_cache.iteritems():
+            self.assertIs(second._constraints_cache[name], cached)
+        for name in ('hard', 'size_hint', 'component'):
+            self.assertIs(first._constraints_cache[name], first_cache[name])
+        user_cns = first._constraints_cache['user']
+        self.assertIsNot(user_cns, first_cache['user'])
+        self.assertEqual(user_cns, [])
+        self.assertEqual(sorted(cns), sorted([
+            (first, 'hard'), (first, 'size_hint'), (first, 'component'),
+            (second, 'hard'), (second, 'size_hint'), (second, 'user'),
+            (second, 'component'),
+        ]))
+
+
+class TestGroupBoxPadding(unittest.TestCase):
+
+    def setUp(self):
+        self.group_box = GroupBox()
+        self.group_box.abstract_obj = self.tk_group_box = StubTkGroupBox()
+
+    def test_cached_padding(self):
+        """ Test that the padding constraints are cached until the
+        contents margins change.
+
+        """
+        group_box = self.group_box
+        cns = group_box.cached_constraints('padding')
+        self.assertIs(group_box.cached_constraints('padding'), cns)
+        self.tk_group_box.margins = Box(20, 5, 5, 5)
+        new_cns = group_box.cached_constraints('padding')
+        self.assertIsNot(new_cns, cns)
+        self.assertIs(group_box.cached_constraints('padding'), new_cns)
+
+    def test_title_invalidates(self):
+        """ Test that a change to the title discards the cached padding.
+
+        """
+        group_box = self.group_box
+        cns = group_box.cached_constraints('padding')
+        group_box.title = 'Title'
+        self.assertIsNot(group_box.cached_constraints('padding'), cns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from casuarius import ConstraintVariable
+
+from enaml.layout.constraints_layout import ConstraintsLayout
+
+
+class CountingSolver(object):
+    """ A proxy for a solver which counts the suggested value solves.
+
+    """
+    def __init__(self, solver):
+        self.solver = solver
+        self.solves = 0
+
+    def __getattr__(self, name):
+        return getattr(self.solver, name)
+
+    def __setattr__(self, name, value):
+        if name in ('solver', 'solves'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.solver, name, value)
+
+    def suggest_values(self, *args):
+        self.solves += 1
+        return self.solver.suggest_values(*args)
+
+
+class TestLayoutReplay(unittest.TestCase):
+    """ Tests the replay of memoized layout solutions.
+
+    """
+    def setUp(self):
+        self.width = width = ConstraintVariable('width')
+        self.height = height = ConstraintVariable('height')
+        self.child = child = ConstraintVariable('child')
+        self.layout_manager = manager = ConstraintsLayout()
+        manager.initialize([width >= 0, height >= 0, child == width * 0.5])
+        self.solved = []
+        self.replayed = []
+
+    def callback(self):
+        value = self.child.value
+        self.solved.append(value)
+        return value
+
+    def layout(self, width):
+        self.layout_manager.layout(
+            self.callback, self.width, self.height, (width, 10),
+            replay=self.replayed.append,
+        )
+
+    def test_replay_same_size(self):
+        """ Test that the solution of a solved size is replayed.
+
+        """
+        self.layout(100)
+        self.layout(100)
+        self.assertEqual(self.solved, [50])
+        self.assertEqual(self.replayed, [50])
+
+    def test_replay_other_sizes(self):
+        """ Test that the solution of each solved size is replayed, and
+        that only new sizes are solved.
+
+        """
+        self.layout(100)
+        self.layout(200)
+        self.layout(100)
+        self.layout(200)
+        self.layout(300)
+        self.assertEqual(self.solved, [50, 100, 150])
+        self.assertEqual(self.replayed, [50, 100])
+
+    def test_size_query_does_not_affect_replay(self):
+        """ Test that a size query, which runs the solver for another
+        size, does not affect the replayed solutions.
+
+        """
+        manager = self.layout_manager
+        self.layout(100)
+        manager.get_min_size(self.width, self.height)
+        self.layout(100)
+        self.assertEqual(self.solved, [50])
+        self.assertEqual(self.replayed, [50])
+
+    def test_solution_cache_size(self):
+        """ Test that the least recently used solution is discarded when
+        the number of solutions exceeds the cache size.
+
+        """
+        self.layout_manager.solution_cache_size = 2
+        self.layout(100)
+        self.layout(200)
+        self.layout(100)
+        self.layout(300)
+        self.layout(100)
+        self.layout(200)
+        self.assertEqual(self.solved, [50, 100, 150, 100])
+        self.assertEqual(self.replayed, [50, 50])
+
+    def test_update_constraints_clears_solutions(self):
+        """ Test that changing the constraints discards the solutions.
+
+        """
+        manager = self.layout_manager
+        self.layout(100)
+        cn = self.child >= 60
+        manager.update_constraints([], [cn])
+        self.layout(100)
+        self.assertEqual(self.solved, [50, 60])
+        self.assertEqual(self.replayed, [])
+
+
+class TestSizeCache(unittest.TestCase):
+    """ Tests the caching of the min and max sizes.
+
+    """
+    def setUp(self):
+        self.width = width = ConstraintVariable('width')
+        self.height = height = ConstraintVariable('height')
+        self.layout_manager = manager = ConstraintsLayout()
+        manager.initialize([width >= 10, height >= 20, width <= 100])
+        self.solver = manager._solver = CountingSolver(manager._solver)
+
+    def test_cache_hit(self):
+        """ Test that repeated size queries are solved only once.
+
+        """
+        manager = self.layout_manager
+        width, height = self.width, self.height
+        for idx in xrange(3):
+            self.assertEqual(manager.get_min_size(width, height), (10, 20))
+            self.assertEqual(manager.get_max_size(width, height), (100, -1))
+        self.assertEqual(self.solver.solves, 2)
+
+    def test_min_max_size(self):
+        """ Test that the combined query returns both bounds and shares
+        the cache of the separate queries.
+
+        """
+        manager = self.layout_manager
+        width, height = self.width, self.height
+        sizes = ((10, 20), (100, -1))
+        self.assertEqual(manager.get_min_max_size(width, height), sizes)
+        self.assertEqual(manager.get_min_max_size(width, height), sizes)
+        self.assertEqual(manager.get_min_size(width, height), sizes[0])
+        self.assertEqual(manager.get_max_size(width, height), sizes[1])
+        self.assertEqual(self.solver.solves, 2)
+
+    def test_other_variables(self):
+        """ Test that a query for other variables is not served from
+        the cache, even if the variables have the same names.
+
+        """
+        width, height = self.width, self.height
+        other_width = ConstraintVariable('width')
+        other_height = ConstraintVariable('height')
+        manager = self.layout_manager
+        manager.initialize([
+            width >= 10, height >= 20, other_width >= 30, other_height >= 40,
+        ])
+        self.solver = manager._solver = CountingSolver(manager._solver)
+        self.assertEqual(manager.get_min_size(width, height), (10, 20))
+        self.assertEqual(
+            manager.get_min_size(other_width, other_height), (30, 40),
+        )
+        self.assertEqual(self.solver.solves, 2)
+
+    def test_update_constraints_invalidates(self):
+        """ Test that changing the constraints invalidates the cache.
+
+        """
+        manager = self.layout_manager
+        width, height = self.width, self.height
+        manager.get_min_size(width, height)
+        manager.get_max_size(width, height)
+        manager.update_constraints([], [width >= 50, height <= 300])
+        self.assertEqual(manager.get_min_size(width, height), (50, 20))
+        self.assertEqual(manager.get_max_size(width, height), (100, 300))
+        self.assertEqual(self.solver.solves, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from casuarius import ConstraintVariable, CassowaryError
+from traits.api import List
+
+from enaml.components.container import Container
+from enaml.layout.geometry import Rect
+
+
+class RefreshContainer(Container):
+    """ A container which records the refreshes instead of running
+    them.
+
+    """
+    refreshes = List
+
+    def refresh(self):
+        self.refreshes.append('refresh')
+
+    def request_refresh(self):
+        self.refreshes.append('request_refresh')
+
+
+class Child(object):
+    """ A stand-in for a child widget which records the layout rects
+    which are applied to it.
+
+    """
+    def __init__(self, rect=None):
+        self._layout_rect = rect
+        self.applied = []
+
+    def set_layout_geometry(self, rect):
+        self._layout_rect = rect
+        self.applied.append(rect)
+
+
+class TestContainerResize(unittest.TestCase):
+
+    def test_handle_resize(self):
+        """ Test that a resize refreshes the layout immediately.
+
+        """
+        container = RefreshContainer()
+        container.handle_resize()
+        self.assertEqual(container.refreshes, ['refresh'])
+
+    def test_throttle_resize(self):
+        """ Test that a throttled resize requests a refresh.
+
+        """
+        container = RefreshContainer(throttle_resize=True)
+        container.handle_resize()
+        container.handle_resize()
+        self.assertEqual(container.refreshes, ['request_refresh'] * 2)
+
+    def test_replay_layout(self):
+        """ Test that replaying a layout only applies the rects which
+        have changed.
+
+        """
+        container = Container()
+        unchanged = Child(Rect(0, 0, 10, 10))
+        changed = Child(Rect(10, 0, 10, 10))
+        container.replay_layout([
+            (unchanged, Rect(0, 0, 10, 10)), (changed, Rect(10, 0, 20, 10)),
+        ])
+        self.assertEqual(unchanged.applied, [])
+        self.assertEqual(changed.applied, [Rect(10, 0, 20, 10)])
+        self.assertEqual(container.geometry_update_stats(), (1, 1))
+
+
+class TestUpdateConstraints(unittest.TestCase):
+
+    def setUp(self):
+        self.width = width = ConstraintVariable('width')
+        self.height = height = ConstraintVariable('height')
+        self.a = a = ConstraintVariable('a')
+        self.b = b = ConstraintVariable('b')
+        self.first = [width >= 0, height >= 0, a == width * 0.5, b == a + 10]
+        self.second = [width >= 0, height >= 0, a == width * 0.25, b == a + 10]
+
+    def solve(self, container):
+        values = []
+        def cb():
+            values.extend((self.a.value, self.b.value))
+        container.layout_manager.layout(cb, self.width, self.height, (100, 50))
+        return values
+
+    def test_incremental_matches_rebuild(self):
+        """ Test that an incremental update of the constraints gives
+        the same solution as a solver built from the new constraints.
+
+        """
+        incremental = Container()
+        incremental._update_constraints(self.first)
+        kept = incremental._layout_constraints.values()
+        incremental._update_constraints(self.second)
+        rebuilt = Container()
+        rebuilt._update_constraints(self.second)
+        self.assertEqual(self.solve(incremental), [25, 35])
+        self.assertEqual(self.solve(incremental), self.solve(rebuilt))
+
+        # The unchanged constraints are the instances from the solver.
+        current = incremental._layout_constraints.values()
+        shared = [cn for cn in current if any(cn is k for k in kept)]
+        self.assertEqual(len(shared), 3)
+
+    def test_unsatisfiable_update(self):
+        """ Test that an unsatisfiable update raises the solver error.
+
+        """
+        container = Container()
+        container._update_constraints(self.first)
+        cns = self.first + [self.a == 10, self.a == 20]
+        self.assertRaises(CassowaryError, container._update_constraints, cns)
+
+    def test_other_errors_not_masked(self):
+        """ Test that an error which is not a solver error propagates
+        instead of falling back to a rebuild.
+
+        """
+        def update_constraints(old_cns, new_cns):
+            raise TypeError('bad constraint')
+        container = Container()
+        container._update_constraints(self.first)
+        container.layout_manager.update_constraints = update_constraints
+        self.assertRaises(
+            TypeError, container._update_constraints, self.second,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
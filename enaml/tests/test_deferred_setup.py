@@ -0,0 +1,94 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.base_component import BaseComponent
+from enaml.core.toolkit import Toolkit
+
+
+class ScheduleApp(object):
+    """ A stand-in for the toolkit application which records the
+    scheduled callbacks and their priorities.
+
+    """
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule(self, callback, args=None, kwargs=None, priority=50):
+        self.scheduled.append((callback, priority))
+
+
+def make_tree():
+    """ Create a component with two children, each with a child.
+
+    """
+    root = BaseComponent()
+    for idx in range(2):
+        child = BaseComponent(name='child%d' % idx)
+        child.add_subcomponent(BaseComponent(name='leaf%d' % idx))
+        root.add_subcomponent(child)
+    return root
+
+
+class TestDeferredSetup(unittest.TestCase):
+
+    def test_defer_and_complete(self):
+        """ Test that deferred subcomponents are set up by completing
+        the setup.
+
+        """
+        root = make_tree()
+        child = root.children[1]
+        leaf = child.children[0]
+        child.defer_setup()
+        root.setup()
+        self.assertTrue(child.initialized)
+        self.assertTrue(child.setup_deferred)
+        self.assertEqual(child.children, [])
+        self.assertFalse(leaf.initialized)
+        self.assertIs(root.find_by_name('leaf1'), None)
+
+        child.complete_setup()
+        self.assertFalse(child.setup_deferred)
+        self.assertTrue(leaf.initialized)
+        self.assertEqual(child.children, [leaf])
+        self.assertIs(root.find_by_name('leaf1'), leaf)
+        child.complete_setup()
+        self.assertEqual(child.children, [leaf])
+
+    def test_schedule(self):
+        """ Test that the deferred components are set up one per idle
+        task of the lowest priority.
+
+        """
+        root = make_tree()
+        app = ScheduleApp()
+        root.toolkit = toolkit = Toolkit()
+        toolkit.app = app
+        children = root.children
+        for child in children:
+            child.defer_setup()
+        root.setup()
+        root.schedule_deferred_setup(children)
+        callback, priority = app.scheduled.pop()
+        self.assertEqual(priority, 100)
+        callback()
+        self.assertFalse(children[0].setup_deferred)
+        self.assertTrue(children[1].setup_deferred)
+        app.scheduled.pop()[0]()
+        self.assertFalse(children[1].setup_deferred)
+        self.assertEqual(app.scheduled, [])
+
+    def test_destroy(self):
+        root = make_tree()
+        child = root.children[0]
+        child.defer_setup()
+        root.setup()
+        root.destroy()
+        self.assertFalse(child.setup_deferred)
+
+
+if __name__ == '__main__':
+    unittest.main()
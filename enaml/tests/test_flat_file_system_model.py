@@ -0,0 +1,98 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from enaml.stdlib import flat_file_system_model
+from enaml.stdlib.flat_file_system_model import FlatFileSystemModel
+
+
+class SmallFetchModel(FlatFileSystemModel):
+    fetch_size = 4
+
+
+class TestFlatFileSystemModel(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for idx in range(10):
+            open(os.path.join(self.directory, 'file%d.txt' % idx), 'w').close()
+        os.mkdir(os.path.join(self.directory, 'subdir'))
+        # Make sure the directory mtime is in the past, so that adding
+        # a file in the test will change it.
+        os.utime(self.directory, (0, 0))
+        self.inserted = []
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def on_rows_inserted(self, evt_arg):
+        self.inserted.append(evt_arg)
+
+    def create_model(self):
+        model = SmallFetchModel(self.directory)
+        model.rows_inserted.connect(self.on_rows_inserted)
+        return model
+
+    def names(self, model):
+        return sorted(
+            model.data(model.index(row, 0)) 
+            for row in range(1, model.row_count(None))
+        )
+
+    def test_incremental_fetch(self):
+        """ Test that the entries are read in chunks on demand.
+
+        """
+        model = self.create_model()
+        self.assertEqual(model.row_count(None), 5)
+        self.assertTrue(model.can_fetch_more())
+        while model.can_fetch_more():
+            model.fetch_more()
+        self.assertEqual(model.row_count(None), 12)
+        self.assertEqual(self.inserted, [(None, 5, 8), (None, 9, 11)])
+        expected = ['file%d.txt' % idx for idx in range(10)] + ['subdir']
+        self.assertEqual(self.names(model), expected)
+        subdir = [
+            row for row in range(model.row_count(None))
+            if model.data(model.index(row, 0)) == 'subdir'
+        ][0]
+        self.assertTrue(model.isdir(model.index(subdir, 0)))
+
+    def test_listing_cache(self):
+        """ Test that a complete listing is reused until the directory
+        is modified.
+
+        """
+        model = self.create_model()
+        while model.can_fetch_more():
+            model.fetch_more()
+
+        calls = []
+        iter_entries = flat_file_system_model._iter_entries
+        def counting_iter_entries(directory):
+            calls.append(directory)
+            return iter_entries(directory)
+        flat_file_system_model._iter_entries = counting_iter_entries
+        try:
+            model.show_hidden = True
+            self.assertEqual(calls, [])
+            self.assertFalse(model.can_fetch_more())
+            self.assertEqual(model.row_count(None), 12)
+
+            open(os.path.join(self.directory, 'new.txt'), 'w').close()
+            model.chdir(self.directory)
+            self.assertEqual(calls, [model.getcwd()])
+            while model.can_fetch_more():
+                model.fetch_more()
+            self.assertEqual(model.row_count(None), 13)
+        finally:
+            flat_file_system_model._iter_entries = iter_entries
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,10 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 from enaml.core import import_hooks
@@ -49,3 +52,46 @@ class TestImportHooks(unittest.TestCase):
         self.assertEquals(counts[importer], 0)
         self.assertEquals(len(meta_path), 0)
 
+
+class TestHashedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_hashed_file_info(self):
+        """ Test that the hashed cache path depends only on the content.
+
+        """
+        make_info = import_hooks.make_hashed_file_info
+        info_a = make_info('/a/foo.enaml', 'src', self.cache_dir)
+        info_b = make_info('/b/bar.enaml', 'src', self.cache_dir)
+        info_c = make_info('/a/foo.enaml', 'other src', self.cache_dir)
+        self.assertEqual(info_a.cache_path, info_b.cache_path)
+        self.assertNotEqual(info_a.cache_path, info_c.cache_path)
+        self.assertEqual(info_a.cache_dir, self.cache_dir)
+        self.assertEqual(info_b.src_path, '/b/bar.enaml')
+
+    def test_cache_round_trip(self):
+        """ Test that a code object written to the cache is loaded back
+        with the filename of the importing source file.
+
+        """
+        code = compile('def f():\n    return 42\n', '/a/foo.enaml', 'exec')
+        info = import_hooks.make_hashed_file_info(
+            '/b/foo.enaml', 'src', os.path.join(self.cache_dir, 'sub'),
+        )
+        import_hooks.write_cache(code, 0, info)
+        magic, ts = import_hooks.read_magic_info(info)
+        self.assertEqual(magic, import_hooks.MAGIC)
+        self.assertEqual(ts, 0)
+
+        loaded = import_hooks.load_cache(info)
+        loaded = import_hooks.update_filename(loaded, info.src_path)
+        self.assertEqual(loaded.co_filename, '/b/foo.enaml')
+        ns = {}
+        exec loaded in ns
+        self.assertEqual(ns['f'].func_code.co_filename, '/b/foo.enaml')
+        self.assertEqual(ns['f'](), 42)
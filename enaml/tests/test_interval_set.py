@@ -0,0 +1,128 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Any
+
+from enaml.components.row_selection_model import RowSelectionModel
+from enaml.core.interval_set import IntervalSet
+
+
+class TestIntervalSet(unittest.TestCase):
+
+    def test_merge(self):
+        """ Test that overlapping and adjacent ranges are merged.
+
+        """
+        s = IntervalSet([(5, 7), (0, 2), (3, 3), (6, 9), (12, 11)])
+        self.assertEqual(s.ranges(), [(0, 3), (5, 9)])
+        self.assertEqual(len(s), 9)
+        self.assertEqual(list(s), [0, 1, 2, 3, 5, 6, 7, 8, 9])
+        self.assertEqual(IntervalSet.from_values([3, 1, 2, 2, 7]).ranges(),
+                         [(1, 3), (7, 7)])
+        self.assertFalse(IntervalSet())
+
+    def test_contains(self):
+        s = IntervalSet([(0, 999999), (2000000, 2000000)])
+        self.assertTrue(0 in s)
+        self.assertTrue(999999 in s)
+        self.assertFalse(1000000 in s)
+        self.assertTrue(2000000 in s)
+        self.assertFalse(-1 in s)
+        self.assertEqual(len(s), 1000001)
+
+    def test_union(self):
+        s = IntervalSet([(0, 2), (10, 12)]) | IntervalSet([(3, 5), (11, 20)])
+        self.assertEqual(s.ranges(), [(0, 5), (10, 20)])
+
+    def test_difference(self):
+        s = IntervalSet([(0, 9), (20, 29)])
+        other = IntervalSet([(-5, 0), (3, 4), (8, 21), (25, 25), (29, 40)])
+        self.assertEqual((s - other).ranges(), [(1, 2), (5, 7), (22, 24),
+                                                 (26, 28)])
+        self.assertEqual((s - IntervalSet()), s)
+        self.assertEqual((s - s).ranges(), [])
+
+
+class Index(object):
+
+    def __init__(self, row):
+        self.row = row
+
+
+class ItemModel(object):
+
+    def create_index(self, row, column, parent):
+        return Index(row)
+
+
+class Parent(object):
+
+    item_model = ItemModel()
+
+
+class SelectionModel(RowSelectionModel):
+    """ A RowSelectionModel which stands in for the toolkit selection.
+
+    """
+    parent = Any
+
+    selection = Any
+
+    def set_selection(self, selection, command='clear_select'):
+        self.selection = selection
+
+    def get_selection(self):
+        return self.selection
+
+
+class TestRowSelectionModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = SelectionModel(parent=Parent())
+
+    def test_set_rows(self):
+        """ Test that contiguous rows are set as a single range.
+
+        """
+        self.model.selected_rows = [5, 1, 2, 3]
+        ranges = [(tl.row, br.row) for tl, br in self.model.selection]
+        self.assertEqual(ranges, [(1, 3), (5, 5)])
+        self.assertEqual(self.model.selected_rows, [1, 2, 3, 5])
+
+    def test_selection_event(self):
+        """ Test that the toolkit selection updates the ranges and that
+        the rows are created on request.
+
+        """
+        model = self.model
+        model.selection = [(Index(0), Index(999999))]
+        model.selection_event(([], model.selection))
+        self.assertEqual(model.selected_ranges.ranges(), [(0, 999999)])
+        self.assertEqual(len(model.selected_rows), 1000000)
+
+    def test_modify_rows_in_place(self):
+        """ Test that modifying the rows in-place updates the selection
+        and fires the items event.
+
+        """
+        model = self.model
+        events = []
+        model.on_trait_change(
+            lambda event: events.append((event.added, event.removed)),
+            'selected_rows_items',
+        )
+        model.selected_rows = [1, 2, 5]
+        model.selected_rows.append(3)
+        self.assertEqual(model.selected_ranges.ranges(), [(1, 3), (5, 5)])
+        del model.selected_rows[0]
+        self.assertEqual(model.selected_ranges.ranges(), [(2, 3), (5, 5)])
+        ranges = [(tl.row, br.row) for tl, br in model.selection]
+        self.assertEqual(ranges, [(2, 3), (5, 5)])
+        self.assertEqual(events, [([3], []), ([], [1])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.item_model import AbstractTableModel
+
+
+class ProductModel(AbstractTableModel):
+
+    def row_count(self, parent=None):
+        if parent is None:
+            return 4
+        return 0
+
+    def column_count(self, parent=None):
+        if parent is None:
+            return 3
+        return 0
+
+    def data(self, index):
+        return index.row * index.column
+
+    def tool_tip(self, index):
+        return '%d, %d' % (index.row, index.column)
+
+
+class TestDataBlock(unittest.TestCase):
+
+    def test_default_data_block(self):
+        """ Test that the default data_block matches the per-index data.
+
+        """
+        model = ProductModel()
+        block = model.data_block(xrange(1, 4), [0, 2])
+        self.assertEqual(block, [[0, 2], [0, 4], [0, 6]])
+
+    def test_data_block_role(self):
+        """ Test that data_block dispatches on the role name.
+
+        """
+        model = ProductModel()
+        block = model.data_block([3], xrange(2), 'tool_tip')
+        self.assertEqual(block, [['3, 0', '3, 1']])
+        block = model.data_block([0], [0], 'edit_data')
+        self.assertEqual(block, [[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Any, Int, Instance
+
+from enaml.core.byteplay import (
+    LOAD_ATTR, LOAD_CONST, DUP_TOP, ROT_TWO, CALL_FUNCTION, POP_TOP,
+)
+from enaml.core.expressions import (
+    SubscriptionExpression, _monitored_code_cache,
+)
+from enaml.core.monitors import (
+    AbstractMonitor, AbstractAttributeMonitor, AbstractCallMonitor,
+)
+from enaml.core.toolkit import Toolkit
+
+
+class Inner(HasTraits):
+
+    value = Int
+
+
+class Model(HasTraits):
+
+    inner = Instance(Inner, ())
+
+    count = Int
+
+
+class Owner(HasTraits):
+
+    parent = Any
+
+    total = Int
+
+
+class RecordingAttributeMonitor(AbstractAttributeMonitor):
+    """ An attribute monitor which records the attribute accesses.
+
+    """
+    def __init__(self):
+        self.accessed = []
+
+    def monitor_attribute(self, obj, attr):
+        self.accessed.append((obj, attr))
+
+    def reset(self):
+        pass
+
+
+class RecordingCallMonitor(AbstractCallMonitor):
+    """ A call monitor which records the function calls.
+
+    """
+    def __init__(self):
+        self.called = []
+
+    def monitor_function(self, func_obj, args, kwargs):
+        self.called.append((func_obj, args, kwargs))
+
+    def reset(self):
+        pass
+
+
+class LegacyMonitor(AbstractMonitor):
+    """ A monitor written against the api which preceded the binders,
+    whose generated code references the monitor instance.
+
+    """
+    def __init__(self):
+        self.accessed = []
+
+    def get_insertion_code(self, code_list):
+        def code_binder(obj, attr):
+            self.accessed.append((obj, attr))
+        insertion_code = []
+        for idx, (op, op_arg) in enumerate(code_list):
+            if op == LOAD_ATTR:
+                code = [
+                    (DUP_TOP, None),
+                    (LOAD_CONST, code_binder),
+                    (ROT_TWO, None),
+                    (LOAD_CONST, op_arg),
+                    (CALL_FUNCTION, 0x0002),
+                    (POP_TOP, None),
+                ]
+                insertion_code.append((idx, code))
+        return insertion_code
+
+    def reset(self):
+        pass
+
+
+class TestMonitoredCode(unittest.TestCase):
+
+    def setUp(self):
+        self.owner = Owner()
+        self.model = Model(count=2)
+        self.model.inner.value = 5
+        self.code = compile(
+            "model.inner.value + getattr(model, 'count')", '<test>', 'eval',
+        )
+
+    def create(self, monitor_classes):
+        return SubscriptionExpression(
+            monitor_classes, self.owner, 'total', self.code,
+            {'model': self.model}, {}, Toolkit(),
+        )
+
+    def subscriptions(self, expr):
+        """ Evaluates the expression and returns its value and the
+        attribute accesses and calls recorded by its monitors.
+
+        """
+        value = expr.eval()
+        attr_monitor, call_monitor = expr.monitors
+        return value, attr_monitor.accessed, call_monitor.called
+
+    def test_shared_code(self):
+        """ Test that the expressions created from the same code and
+        monitor classes share the instrumented code.
+
+        """
+        classes = (RecordingAttributeMonitor, RecordingCallMonitor)
+        first = self.create(classes)
+        second = self.create(classes)
+        self.assertIs(first.eval_code, second.eval_code)
+        other = self.create(classes[:1])
+        self.assertIsNot(other.eval_code, first.eval_code)
+
+    def test_cached_subscriptions(self):
+        """ Test that the cached code gives the same subscriptions as
+        the uncached code, and that each expression only records its
+        own evaluations.
+
+        """
+        classes = (RecordingAttributeMonitor, RecordingCallMonitor)
+        _monitored_code_cache.pop(self.code, None)
+        uncached = self.create(classes)
+        cached = self.create(classes)
+        self.assertIs(cached.eval_code, uncached.eval_code)
+        _monitored_code_cache.pop(self.code, None)
+        fresh = self.create(classes)
+        self.assertIsNot(fresh.eval_code, cached.eval_code)
+
+        expected = self.subscriptions(fresh)
+        model = self.model
+        self.assertEqual(expected, (7, [
+            (model, 'inner'), (model.inner, 'value'),
+        ], [
+            (getattr, (model, 'count'), {}),
+        ]))
+        self.assertEqual(self.subscriptions(cached), expected)
+        self.assertEqual(uncached.monitors[0].accessed, [])
+
+    def test_legacy_monitor(self):
+        """ Test that a monitor without a binder is given the code list
+        only and that its code is not shared.
+
+        """
+        first = self.create((LegacyMonitor,))
+        second = self.create((LegacyMonitor,))
+        self.assertIsNot(first.eval_code, second.eval_code)
+        self.assertEqual(first.eval(), 7)
+        model = self.model
+        expected = [(model, 'inner'), (model.inner, 'value')]
+        self.assertEqual(first.monitors[0].accessed, expected)
+        self.assertEqual(second.monitors[0].accessed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.core.monitors import TraitAttributeMonitor
+
+
+class Model(HasTraits):
+
+    a = Int
+
+    b = Int
+
+
+class TestTraitAttributeMonitor(unittest.TestCase):
+    """ Tests the differential rebinding of the trait monitors.
+
+    """
+    def setUp(self):
+        self.changes = 0
+        self.monitor = TraitAttributeMonitor()
+        self.monitor.expression_changed.connect(self.on_changed)
+        self.model = Model()
+
+    def on_changed(self):
+        self.changes += 1
+
+    def bind(self, *attrs):
+        monitor = self.monitor
+        monitor.begin_binding()
+        for attr in attrs:
+            monitor.monitor_attribute(self.model, attr)
+        monitor.end_binding()
+
+    def test_notification(self):
+        """ Test that a bound attribute notifies exactly once.
+
+        """
+        self.bind('a', 'a')
+        self.model.a = 1
+        self.assertEqual(self.changes, 1)
+
+    def test_unchanged_dependencies_keep_notifiers(self):
+        """ Test that rebinding the same dependencies reuses the existing
+        notifiers.
+
+        """
+        self.bind('a', 'b')
+        handlers = dict(self.monitor._handlers)
+        self.bind('b', 'a')
+        self.assertEqual(len(handlers), 2)
+        for key, handler in self.monitor._handlers.iteritems():
+            self.assertIs(handlers[key], handler)
+        self.model.a = 1
+        self.model.b = 1
+        self.assertEqual(self.changes, 2)
+
+    def test_stale_dependencies_removed(self):
+        """ Test that the dependencies which are no longer accessed stop
+        notifying.
+
+        """
+        self.bind('a', 'b')
+        self.bind('b')
+        self.model.a = 1
+        self.assertEqual(self.changes, 0)
+        self.model.b = 1
+        self.assertEqual(self.changes, 1)
+
+    def test_reset(self):
+        """ Test that a reset removes every notifier.
+
+        """
+        self.bind('a')
+        self.monitor.reset()
+        self.model.a = 1
+        self.assertEqual(self.changes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Any, Int, Str
+
+from enaml.core.base_component import BaseComponent
+from enaml.core.constructor import Constructor
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.expressions import ExecutionScope, _resolution_plan
+from enaml.core.operators import OPERATORS, op_simple
+from enaml.core.parser import parse
+from enaml.core.toolkit import Toolkit
+
+
+class Widget(BaseComponent):
+
+    value = Int
+
+    text = Str
+
+
+SOURCE = """
+offset = 100
+text = 'global'
+enamldef Main(Widget):
+    id: main
+    attr a = 1
+    text = 'main'
+    value = a + offset
+    Widget:
+        id: inner
+        value = a + offset + len(main.text)
+        name = text + '!'
+        Widget:
+            name = str(a + offset + inner.value)
+"""
+
+
+def build(operators):
+    """ Compiles the sample source and builds the Main declaration
+    using a toolkit with the given operators.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE), 'test_resolution_plan')
+    ns = {}
+    exec code in ns
+    toolkit = Toolkit()
+    toolkit.update(operators)
+    toolkit['Widget'] = Constructor(lambda: Widget)
+    with toolkit:
+        main = ns['Main']()
+    inner = main.children[0]
+    leaf = inner.children[0]
+    return [(c.value, c.text, c.name) for c in (main, inner, leaf)]
+
+
+class TestCompiledPlans(unittest.TestCase):
+
+    def test_plan_operator(self):
+        """ Test that an operator which accepts the plan receives it and
+        resolves the names the same as a dynamic lookup.
+
+        """
+        plans = []
+        def op(cmpnt, attr, code, identifiers, f_globals, toolkit, plan=()):
+            plans.append((attr, plan))
+            op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit, plan)
+        op.__enaml_accepts_plan__ = True
+
+        def dynamic_op(cmpnt, attr, code, identifiers, f_globals, toolkit):
+            op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit)
+
+        res = build({'__operator_Equal__': op})
+        self.assertEqual(res, [
+            (101, 'main', ''), (105, '', '!'), (0, '', '206'),
+        ])
+        self.assertEqual(res, build({'__operator_Equal__': dynamic_op}))
+        self.assertIn(('value', (
+            ('a', 'attribute', 1), ('offset', 'global', None),
+            ('len', 'global', None), ('main', 'identifier', None),
+        )), plans)
+
+    def test_legacy_operator(self):
+        """ Test that an operator which only accepts 6 arguments is
+        called without the plan.
+
+        """
+        calls = []
+        def op(cmpnt, attr, code, identifiers, f_globals, toolkit):
+            calls.append(attr)
+            op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit)
+        operators = dict(OPERATORS)
+        operators['__operator_Equal__'] = op
+        res = build(operators)
+        self.assertEqual(res[2], (0, '', '206'))
+        self.assertEqual(len(calls), 6)
+
+
+class TestExecutionScope(unittest.TestCase):
+
+    def setUp(self):
+        self.root = root = Widget()
+        root.add_trait('a', Any('root'))
+        self.mid = mid = Widget()
+        root.add_subcomponent(mid)
+        self.leaf = leaf = Widget()
+        leaf.add_trait('b', Any('leaf'))
+        mid.add_subcomponent(leaf)
+        self.f_globals = {'offset': 1, 'text': 'global', 'a': 'global'}
+        self.plan = _resolution_plan((
+            ('a', 'attribute', 2), ('b', 'attribute', 0),
+            ('text', 'global', None), ('offset', 'global', None),
+            ('missing', 'global', None), ('ident', 'identifier', None),
+        ))
+
+    def lookup(self, name, plan):
+        """ Looks up the name in a scope on the leaf component and
+        returns the result and the attribute callbacks.
+
+        """
+        accessed = []
+        cb = lambda obj, attr: accessed.append((obj, attr))
+        scope = ExecutionScope(
+            self.leaf, {}, self.f_globals, Toolkit(), {}, cb, plan,
+        )
+        try:
+            res = scope[name]
+        except KeyError:
+            res = KeyError
+        return res, accessed
+
+    def assertSameLookup(self, name):
+        planned = self.lookup(name, self.plan)
+        self.assertEqual(planned, self.lookup(name, None))
+        return planned
+
+    def test_same_resolution(self):
+        """ Test that the planned lookup gives the same results and the
+        same attribute accesses as the dynamic lookup.
+
+        """
+        root, mid, leaf = self.root, self.mid, self.leaf
+        self.assertEqual(self.assertSameLookup('a'), ('root', [(root, 'a')]))
+        self.assertEqual(self.assertSameLookup('b'), ('leaf', [(leaf, 'b')]))
+        self.assertEqual(self.assertSameLookup('text'), ('', [(leaf, 'text')]))
+        self.assertEqual(self.assertSameLookup('offset'), (1, []))
+        self.assertEqual(self.assertSameLookup('missing'), (KeyError, []))
+        self.assertEqual(self.assertSameLookup('ident'), (KeyError, []))
+
+    def test_shadowed_attribute(self):
+        """ Test that an attribute added to a component between the
+        expression and the declaring component still shadows it.
+
+        """
+        mid = self.mid
+        mid.add_trait('a', Any('mid'))
+        self.assertEqual(self.assertSameLookup('a'), ('mid', [(mid, 'a')]))
+        mid.add_trait('offset', Any(2))
+        self.assertEqual(self.assertSameLookup('offset'), (2, [(mid, 'offset')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.stdlib.list_model import ListModel
+from enaml.stdlib.row_sequence import TableRows
+from enaml.stdlib.table_model import TableModel
+
+
+class TestRowSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.data = range(6)
+        self.model = ListModel(self.data)
+        self.events = []
+        # Signals hold weak references, so the recorders are kept alive.
+        self.recorders = []
+        for name in ('rows_about_to_be_inserted', 'rows_inserted',
+                     'rows_about_to_be_removed', 'rows_removed',
+                     'rows_about_to_be_moved', 'rows_moved'):
+            recorder = self.recorder(name)
+            self.recorders.append(recorder)
+            getattr(self.model, name).connect(recorder)
+
+    def recorder(self, name):
+        def record(evt_arg):
+            self.events.append((name, evt_arg, self.data[:]))
+        return record
+
+    def test_insert_rows(self):
+        """ Test that rows are inserted in place with a single pair of
+        notifications.
+
+        """
+        data = self.data
+        self.model.insert_rows(2, ['a', 'b'])
+        self.assertIs(self.model.data_source, data)
+        self.assertEqual(data, [0, 1, 'a', 'b', 2, 3, 4, 5])
+        self.assertEqual(self.events, [
+            ('rows_about_to_be_inserted', (None, 2, 3), [0, 1, 2, 3, 4, 5]),
+            ('rows_inserted', (None, 2, 3), data),
+        ])
+        self.model.append_rows(iter('c'))
+        self.assertEqual(data[-1], 'c')
+        self.assertEqual(self.events[-1][1], (None, 8, 8))
+
+    def test_remove_rows(self):
+        self.model.remove_rows(1, 3)
+        self.assertEqual(self.data, [0, 4, 5])
+        self.assertEqual(
+            [event[:2] for event in self.events], [
+                ('rows_about_to_be_removed', (None, 1, 3)),
+                ('rows_removed', (None, 1, 3)),
+            ],
+        )
+
+    def test_move_rows(self):
+        """ Test that the destination of a move is a row number from
+        before the move.
+
+        """
+        self.model.move_rows(0, 2, 5)
+        self.assertEqual(self.data, [2, 3, 4, 0, 1, 5])
+        self.model.move_rows(4, 2, 0)
+        self.assertEqual(self.data, [1, 5, 2, 3, 4, 0])
+        self.model.move_rows(0, 1, 6)
+        self.assertEqual(self.data, [5, 2, 3, 4, 0, 1])
+        self.assertEqual(
+            [event[:2] for event in self.events[:2]], [
+                ('rows_about_to_be_moved', (None, 0, 1, None, 5)),
+                ('rows_moved', (None, 0, 1, None, 5)),
+            ],
+        )
+
+    def test_no_op(self):
+        self.model.insert_rows(0, [])
+        self.model.remove_rows(0, 0)
+        self.model.move_rows(1, 2, 3)
+        self.assertEqual(self.events, [])
+
+    def test_invalid(self):
+        """ Test that invalid changes raise before any notification.
+
+        """
+        model = self.model
+        self.assertRaises(IndexError, model.insert_rows, 7, [1])
+        self.assertRaises(IndexError, model.remove_rows, 4, 3)
+        self.assertRaises(IndexError, model.move_rows, 0, 2, 7)
+        tuple_model = ListModel((1, 2, 3))
+        self.assertRaises(TypeError, tuple_model.insert_rows, 0, [4])
+        self.assertEqual(self.events, [])
+
+
+class TestTableRows(unittest.TestCase):
+
+    def test_table_model(self):
+        rows = TableRows([[1, 2], [3, 4]])
+        model = TableModel(rows)
+        self.assertEqual(rows.shape, (2, 2))
+        self.assertEqual(rows[1, 0], 3)
+        model.insert_rows(1, [[5, 6]])
+        self.assertEqual(model.row_count(), 3)
+        self.assertEqual(model.data(model.index(1, 1)), u'6')
+        rows[1, 1] = 7
+        self.assertEqual(rows[1], [5, 7])
+        model.remove_rows(0, 3)
+        self.assertEqual(rows.shape, (0, 0))
+        self.assertEqual(TableRows(column_count=2).shape, (0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
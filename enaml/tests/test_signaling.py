@@ -0,0 +1,116 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import gc
+import unittest
+from weakref import ref
+
+from enaml.core.signaling import Signal
+
+
+class Emitter(object):
+
+    changed = Signal()
+
+
+class Receiver(object):
+
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def slot(self, *args, **kwargs):
+        self.log.append((self.name, args, kwargs))
+
+
+class TestSignal(unittest.TestCase):
+
+    def setUp(self):
+        self.log = []
+        self.emitter = Emitter()
+
+    def test_emit_order(self):
+        """ Test that the handlers are called in connection order with
+        the emitted arguments.
+
+        """
+        receivers = [Receiver(self.log, idx) for idx in range(4)]
+        for receiver in receivers:
+            self.emitter.changed.connect(receiver.slot)
+        self.emitter.changed(1, two=2)
+        expected = [(idx, (1,), {'two': 2}) for idx in range(4)]
+        self.assertEqual(self.log, expected)
+
+    def test_connect_once(self):
+        """ Test that a handler is only connected once.
+
+        """
+        receiver = Receiver(self.log, 'a')
+        self.emitter.changed.connect(receiver.slot)
+        self.emitter.changed.connect(receiver.slot)
+        self.emitter.changed()
+        self.assertEqual(len(self.log), 1)
+
+    def test_disconnect(self):
+        """ Test that disconnected methods and functions are not called.
+
+        """
+        receiver = Receiver(self.log, 'a')
+        def func(*args):
+            self.log.append('func')
+        self.emitter.changed.connect(receiver.slot)
+        self.emitter.changed.connect(func)
+        self.emitter.changed.disconnect(receiver.slot)
+        self.emitter.changed()
+        self.assertEqual(self.log, ['func'])
+        self.emitter.changed.disconnect(func)
+        self.emitter.changed()
+        self.assertEqual(self.log, ['func'])
+
+    def test_dead_receiver(self):
+        """ Test that the connection dies with the bound object.
+
+        """
+        receiver = Receiver(self.log, 'a')
+        self.emitter.changed.connect(receiver.slot)
+        del receiver
+        gc.collect()
+        self.emitter.changed()
+        self.assertEqual(self.log, [])
+        self.assertEqual(len(self.emitter.changed._connections), 0)
+
+    def test_disconnect_during_emit(self):
+        """ Test that changing the connections during an emission does
+        not affect the handlers called by that emission.
+
+        """
+        first = Receiver(self.log, 'first')
+        second = Receiver(self.log, 'second')
+        def disconnector(*args):
+            self.emitter.changed.disconnect(second.slot)
+        self.emitter.changed.connect(disconnector)
+        self.emitter.changed.connect(first.slot)
+        self.emitter.changed.connect(second.slot)
+        self.emitter.changed()
+        self.assertEqual([item[0] for item in self.log], ['first', 'second'])
+        self.emitter.changed()
+        self.assertEqual(len(self.log), 3)
+
+    def test_connect_after_emit(self):
+        """ Test that a handler connected after an emission is called
+        by the next emission.
+
+        """
+        first = Receiver(self.log, 'first')
+        second = Receiver(self.log, 'second')
+        self.emitter.changed.connect(first.slot)
+        self.emitter.changed()
+        self.emitter.changed.connect(second.slot)
+        self.emitter.changed()
+        names = [item[0] for item in self.log]
+        self.assertEqual(names, ['first', 'first', 'second'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import itertools
+import unittest
+
+from enaml.styling.style_sheet import StyleSheet, style, NO_STYLE
+
+
+class NodeData(object):
+
+    def __init__(self, node_type, node_id, node_classes):
+        self._type = node_type
+        self._id = node_id
+        self._classes = node_classes
+
+    def node_type(self):
+        return self._type
+
+    def node_id(self):
+        return self._id
+
+    def node_classes(self):
+        return self._classes
+
+    def parent_node(self):
+        return None
+
+
+def brute_force(sheet, tag, node_data):
+    """ Matches every selector in the sheet against the node.
+
+    """
+    specs = []
+    for selector in sheet._selectors.values():
+        if tag in selector.properties:
+            match, spec = selector.match(node_data)
+            if match:
+                specs.append(spec)
+    if not specs:
+        return NO_STYLE
+    return max(specs)[2][tag]
+
+
+class TestStyleSheet(unittest.TestCase):
+
+    def setUp(self):
+        self.sheet = StyleSheet(
+            style('*', color='default', size=1),
+            style('PushButton', color='type'),
+            style('.error', color='class', weight='bold'),
+            style('.error.warn', size=2),
+            style('PushButton.error', color='qual'),
+            style('#ok', color='id'),
+            style('Label', 'Field.warn', size=3),
+        )
+        types = ('PushButton', 'Label', 'Field')
+        ids = ('ok', 'cancel')
+        classes = ((), ('error',), ('warn',), ('error', 'warn'))
+        self.nodes = [
+            NodeData(*args) for args in itertools.product(types, ids, classes)
+        ]
+
+    def check_all(self):
+        for node in self.nodes:
+            for tag in ('color', 'size', 'weight', 'missing'):
+                res = self.sheet.get_property(tag, node)
+                expected = brute_force(self.sheet, tag, node)
+                if expected is NO_STYLE:
+                    self.assertTrue(res is NO_STYLE)
+                else:
+                    self.assertEqual(res.value, expected)
+
+    def test_get_property(self):
+        """ Test that indexed resolution matches all of the selectors.
+
+        """
+        self.check_all()
+        node = NodeData('PushButton', 'cancel', ('error',))
+        self.assertEqual(self.sheet.get_property('color', node).value, 'qual')
+        node = NodeData('PushButton', 'ok', ('error',))
+        self.assertEqual(self.sheet.get_property('color', node).value, 'id')
+
+    def test_update_and_replace(self):
+        """ Test that the resolved styles are invalidated on changes.
+
+        """
+        self.check_all()
+        node = NodeData('Label', 'cancel', ())
+        self.assertEqual(self.sheet.get_property('color', node).value, 'default')
+        self.sheet.update(style('Label', color='label'))
+        self.assertEqual(self.sheet.get_property('color', node).value, 'label')
+        self.check_all()
+        self.sheet.replace(style('.warn', color='warn'))
+        self.assertTrue(self.sheet.get_property('color', node) is NO_STYLE)
+        self.check_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
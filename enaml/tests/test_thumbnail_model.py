@@ -0,0 +1,179 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import gc
+import logging
+from Queue import Queue
+import threading
+import unittest
+from weakref import ref
+
+from enaml.core.toolkit import Toolkit
+from enaml.stdlib import thumbnail_model
+from enaml.stdlib.thumbnail_model import ThumbnailModel, Thumbnail
+
+
+class Image(object):
+    """ A stand-in for the toolkit image which records the files which
+    are read.
+
+    """
+    read = []
+
+    def __init__(self, size=(10, 10)):
+        self.size = size
+
+    @classmethod
+    def from_file(cls, path):
+        cls.read.append(path)
+        if path.startswith('bad'):
+            raise IOError('cannot read %s' % path)
+        return cls()
+
+    def scale(self, size, preserve_aspect_ratio=False):
+        return Image(size)
+
+
+class Icon(object):
+
+    def __init__(self, image):
+        self.image = image
+
+    @classmethod
+    def from_image(cls, image):
+        return cls(image)
+
+
+class App(object):
+    """ A stand-in for the toolkit application which queues the calls
+    made on the main thread.
+
+    """
+    def __init__(self):
+        self.calls = Queue()
+
+    def call_on_main(self, callback, *args):
+        self.calls.put((callback, args))
+
+    def process(self, count=1):
+        for idx in xrange(count):
+            callback, args = self.calls.get(timeout=5)
+            callback(*args)
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestThumbnailModel(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = toolkit = Toolkit()
+        toolkit['Image'] = Image
+        toolkit['Icon'] = Icon
+        toolkit.app = self.app = App()
+        self.handler = ListHandler()
+        thumbnail_model.logger.addHandler(self.handler)
+        thumbnail_model.logger.propagate = False
+        del Image.read[:]
+
+    def tearDown(self):
+        thumbnail_model.logger.removeHandler(self.handler)
+        thumbnail_model.logger.propagate = True
+
+    def create_model(self, images, **kwargs):
+        with self.toolkit:
+            thumbs = [Thumbnail(str(image), image, None) for image in images]
+            return ThumbnailModel(thumbs, placeholder='placeholder', **kwargs)
+
+    def decoration(self, model, row):
+        return model.decoration(model.index(row, 0))
+
+    def test_decode(self):
+        """ Test that an icon is created in the background and that the
+        thumbnails of the same file share it.
+
+        """
+        model = self.create_model(['a.png', 'a.png'])
+        self.assertEqual(self.decoration(model, 0), 'placeholder')
+        self.assertEqual(self.decoration(model, 1), 'placeholder')
+        self.app.process()
+        icon = self.decoration(model, 0)
+        self.assertIsInstance(icon, Icon)
+        self.assertIs(self.decoration(model, 1), icon)
+        self.assertEqual(Image.read, ['a.png'])
+
+    def test_failed_decode(self):
+        """ Test that a failed decode is logged and is not retried.
+
+        """
+        model = self.create_model(['bad.png'])
+        self.decoration(model, 0)
+        self.app.process()
+        self.assertEqual(self.decoration(model, 0), 'placeholder')
+        self.assertEqual(self.decoration(model, 0), 'placeholder')
+        self.assertEqual(Image.read, ['bad.png'])
+        self.assertEqual(len(self.handler.records), 1)
+        self.assertTrue(self.app.calls.empty())
+
+    def test_failed_decode_evicted(self):
+        """ Test that the failed images are counted against the size of
+        the cache, so that they are evicted.
+
+        """
+        nbytes = thumbnail_model.FAILED_IMAGE_BYTES
+        model = self.create_model(
+            ['bad%d.png' % i for i in xrange(3)], cache_bytes=2 * nbytes,
+        )
+        for row in xrange(3):
+            self.decoration(model, row)
+        self.app.process(3)
+        self.assertEqual(len(model._icons), 2)
+        self.assertEqual(model._cached_bytes, 2 * nbytes)
+
+    def test_image_not_kept_alive(self):
+        """ Test that the icon cache does not keep the full size image
+        of a thumbnail alive.
+
+        """
+        image = Image((100, 100))
+        model = self.create_model([image], icon_size=(10, 10))
+        self.decoration(model, 0)
+        self.app.process()
+        icon = self.decoration(model, 0)
+        self.assertIsInstance(icon, Icon)
+        self.assertEqual(icon.image.size, (10, 10))
+        image_ref = ref(image)
+        model._set_thumbnails([])
+        del image
+        gc.collect()
+        self.assertIs(image_ref(), None)
+        self.assertEqual(len(model._icons), 1)
+
+    def test_shared_threads(self):
+        """ Test that the models share the decoding threads and that
+        the threads do not keep the models alive.
+
+        """
+        models = [self.create_model(['%d.png' % i]) for i in xrange(5)]
+        for model in models:
+            self.decoration(model, 0)
+        self.app.process(5)
+        names = [thread.name for thread in threading.enumerate()]
+        decoders = [n for n in names if n.startswith('ThumbnailDecoder')]
+        self.assertEqual(len(decoders), thumbnail_model.DECODE_THREADS)
+        model_ref = ref(models[0])
+        del models, model
+        gc.collect()
+        self.assertIs(model_ref(), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
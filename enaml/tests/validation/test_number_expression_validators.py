@@ -0,0 +1,72 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.validation.number_expression_validators import (
+    NumberExpressionValidator, NumberExpressionSandboxError,
+    IntExpressionValidator, FloatExpressionValidator, _evaluator_cache,
+)
+
+
+class TestNumberExpressionValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = NumberExpressionValidator()
+
+    def test_arithmetic_matches_eval(self):
+        """ Test that the arithmetic evaluator gives the same results
+        as evaluating the text in the sandbox.
+
+        """
+        sandbox = NumberExpressionValidator.sandbox
+        texts = (
+            u'12', u'-12', u'1e7', u'7/2', u'7.0/2', u'7//2', u'-2**2',
+            u'2**-1', u'~5 & 3 | 8 ^ 1', u'1 << 4 >> 2', u'10 % 3',
+            u'3+4j', u'float(3) / 2', u"int('ff', 16)", u"complex('1+2j')",
+            u'  1 + 1', u'long(5) * 2',
+        )
+        for text in texts:
+            self.assertEqual(
+                self.validator._convert(text), eval(text.strip(), *sandbox),
+            )
+
+    def test_fallback(self):
+        """ Test that expressions outside of the arithmetic subset are
+        still evaluated in the sandbox.
+
+        """
+        self.assertEqual(self.validator._convert(u'(1.5).real'), 1.5)
+        self.assertEqual(self.validator._convert(u'1 if 0 else 2'), 2)
+
+    def test_sandbox_names(self):
+        """ Test that access to names outside of the sandbox fails.
+
+        """
+        convert = self.validator._convert
+        self.assertRaises(NumberExpressionSandboxError, convert, u'open(1)')
+        self.assertRaises(NumberExpressionSandboxError, convert, u'x + 1')
+        self.assertRaises(SyntaxError, convert, u'1 +')
+        self.assertRaises(ZeroDivisionError, convert, u'1 / 0')
+
+    def test_cache(self):
+        """ Test that repeated conversions reuse the compiled text.
+
+        """
+        text = u'123 * 456'
+        self.validator._convert(text)
+        evaluator = _evaluator_cache[text]
+        self.validator._convert(text)
+        self.assertIs(_evaluator_cache[text], evaluator)
+
+    def test_validate(self):
+        v = IntExpressionValidator(low=0, high=100)
+        self.assertEqual(v.validate(u'6*7'), v.ACCEPTABLE)
+        self.assertEqual(v.validate(u'6*'), v.INTERMEDIATE)
+        v = FloatExpressionValidator()
+        self.assertEqual(v.validate(u'1.5 * 2'), v.ACCEPTABLE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,10 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import ast
+from collections import OrderedDict
 from numbers import Real, Integral, Complex
+import operator
 
 from .number_validators import NumberValidator
 
@@ -35,6 +38,127 @@ class NumberExpressionSandbox(object):
         raise NumberExpressionSandboxError(msg)
 
 
+#------------------------------------------------------------------------------
+# Expression Compiler
+#------------------------------------------------------------------------------
+#: The maximum number of compiled expressions kept in the cache.
+EXPRESSION_CACHE_SIZE = 512
+
+#: The LRU cache of compiled expression evaluators, keyed on the text.
+_evaluator_cache = OrderedDict()
+
+#: The operator functions for the supported binary operators. Division
+#: is the classic division performed by 'eval' in this module.
+_binary_ops = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.div, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow,
+    ast.LShift: operator.lshift, ast.RShift: operator.rshift,
+    ast.BitOr: operator.or_, ast.BitXor: operator.xor,
+    ast.BitAnd: operator.and_,
+}
+
+#: The operator functions for the supported unary operators.
+_unary_ops = {
+    ast.UAdd: operator.pos, ast.USub: operator.neg, 
+    ast.Invert: operator.invert,
+}
+
+
+class _UnsupportedNode(Exception):
+    """ An internal exception raised when an expression node is not
+    supported by the arithmetic evaluator.
+
+    """
+    pass
+
+
+def _build_evaluator(node, call_arg=False):
+    """ Builds a closure which evaluates the given arithmetic expression 
+    node. The closure accepts the sandbox tuple and returns the value.
+    Only number literals, arithmetic operators and calls to the names 
+    in the sandbox are supported. Strings are only supported as the 
+    arguments of a call.
+
+    """
+    if isinstance(node, ast.Num):
+        value = node.n
+        return lambda sandbox: value
+
+    if isinstance(node, ast.Str) and call_arg:
+        value = node.s
+        return lambda sandbox: value
+
+    if isinstance(node, ast.BinOp):
+        op = _binary_ops.get(type(node.op))
+        if op is not None:
+            left = _build_evaluator(node.left)
+            right = _build_evaluator(node.right)
+            return lambda sandbox: op(left(sandbox), right(sandbox))
+
+    elif isinstance(node, ast.UnaryOp):
+        op = _unary_ops.get(type(node.op))
+        if op is not None:
+            operand = _build_evaluator(node.operand)
+            return lambda sandbox: op(operand(sandbox))
+
+    elif isinstance(node, ast.Call):
+        func = node.func
+        simple = (
+            isinstance(func, ast.Name) and not node.keywords and 
+            node.starargs is None and node.kwargs is None
+        )
+        if simple:
+            # The name is looked up in the sandbox at evaluation time
+            # so that access to the name is checked by the sandbox.
+            name = func.id
+            args = [_build_evaluator(arg, True) for arg in node.args]
+            def call(sandbox):
+                return sandbox[1][name](*[arg(sandbox) for arg in args])
+            return call
+
+    raise _UnsupportedNode
+
+
+def _compile_expression(text):
+    """ Compiles the expression text into an evaluator which accepts 
+    the sandbox tuple and returns the value of the expression.
+
+    Arithmetic expressions are evaluated by the closures built from 
+    their syntax tree. Any other expression falls back to a code object
+    which is evaluated in the sandbox. Text which is not a valid 
+    expression gives an evaluator which raises the syntax error.
+
+    """
+    try:
+        # Leading spaces and tabs are stripped, the same as 'eval'.
+        tree = ast.parse(text.lstrip(' \t'), mode='eval')
+    except SyntaxError as exc:
+        def fail(sandbox):
+            raise exc
+        return fail
+    try:
+        return _build_evaluator(tree.body)
+    except _UnsupportedNode:
+        code = compile(tree, '<string>', 'eval')
+        return lambda sandbox: eval(code, *sandbox)
+
+
+def _get_evaluator(text):
+    """ Returns the cached evaluator for the expression text, compiling
+    it if necessary.
+
+    """
+    cache = _evaluator_cache
+    evaluator = cache.pop(text, None)
+    if evaluator is None:
+        evaluator = _compile_expression(text)
+        if len(cache) >= EXPRESSION_CACHE_SIZE:
+            cache.popitem(last=False)
+    cache[text] = evaluator
+    return evaluator
+
+
 class NumberExpressionValidator(NumberValidator):
     """ A NumberValidator subclass that accepts a string expression 
     which evaluates to a Python number. 
@@ -55,10 +179,11 @@ class NumberExpressionValidator(NumberValidator):
 
         It does not use the locale object to perform conversion since 
         it allows for generic arithmetic expressions which must make
-        a successful round-trip.
+        a successful round-trip. The compiled form of the text is 
+        cached, since the same text is typically validated repeatedly.
 
         """
-        return eval(text, *self.sandbox)
+        return _get_evaluator(text)(self.sandbox)
         
     def _coerce(self, value):
         """ Overriden default coerce method which attempts to use the